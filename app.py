@@ -151,7 +151,7 @@ profile = {
     'family': p_family
 }
 
-total_score, audit_log = scoring.calculate_score(profile)
+total_score, audit_log = scoring.cached_score(profile)
 
 # ==========================================
 # 3. MAIN CONTENT (TABS)
@@ -1,47 +1,163 @@
 # generate_job_data.py
-import pandas as pd
+#
+# LIS workbook -> job_data.npz + job_data.json (manifest).
+#   python generate_job_data.py [workbook.xlsx] [--force] [--release 2024-2028]
+# The workbook is streamed row by row (openpyxl read-only mode), checked,
+# and written as dictionary-encoded columns. Nothing is rewritten when the
+# manifest already records the same source hash and the same generator hash
+# (the code and settings that clean, check and lay out the data).
+#
+# The app keys every job by its NOC code, so the workbook must have exactly
+# one row per NOC. Regional diagnostics (one row per NOC and region) have to
+# be aggregated to a single provincial row per NOC before import.
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
 from pathlib import Path
 
+import numpy as np
+
+import job_data
+import translations as tr
+
 EXCEL_PATH = Path("LIS_Diagnostics_moyen_terme_2024-2028_516_professions.xlsx")
-OUT_PATH = Path("job_data.py")
-
-
-def esc(s: str) -> str:
-    """Escape single quotes for embedding in single-quoted Python strings."""
-    return s.replace("\\", "\\\\").replace("'", "\\'")
-
-
-def main():
-    df = pd.read_excel(EXCEL_PATH)
-
-    lines = []
-    lines.append("# job_data.py")
-    lines.append("# Diagnostics de main-d'œuvre (2024-2028)")
-    lines.append("# Source: LIS_Diagnostics_moyen_terme_2024-2028_516_professions.xlsx")
-    lines.append("")
-    lines.append("JOBS = [")
-
-    for _, row in df.iterrows():
-        noc = str(row["CNP 2021"]).strip()
-        title_fr = str(row["Titre de la profession (FR)"]).strip()
-        title_en = str(row["Profession title (EN)"]).strip()
-        diagnosis = str(row["Diagnostic"]).strip()
-        category = str(row["Category"]).strip()
-        sub_category = str(row["Sub-Category"]).strip()
-
-        lines.append(
-            "    {"
-            f"'NOC': '{esc(noc)}', "
-            f"'Title (FR)': '{esc(title_fr)}', "
-            f"'Title (EN)': '{esc(title_en)}', "
-            f"'Diagnosis': '{esc(diagnosis)}', "
-            f"'Category': '{esc(category)}', "
-            f"'Sub category': '{esc(sub_category)}'"
-            "},"
-        )
-
-    lines.append("]")
-    OUT_PATH.write_text("\n".join(lines), encoding="utf-8")
+OUT_PATH = job_data.DATA_PATH
+MANIFEST_PATH = OUT_PATH.with_suffix(".json")
+
+# job_data column -> Excel column
+SOURCE_COLUMNS = {
+    "NOC": "CNP 2021",
+    "Title (FR)": "Titre de la profession (FR)",
+    "Title (EN)": "Profession title (EN)",
+    "Diagnosis": "Diagnostic",
+    "Category": "Category",
+    "Sub category": "Sub-Category",
+}
+
+
+def file_sha256(path, block=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(block), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def generator_sha256():
+    """Hash of everything that shapes the output besides the workbook itself."""
+    parts = [inspect.getsource(f) for f in (job_data.clean_label, job_data._key, job_data.to_arrays, collect)]
+    parts.append(json.dumps([job_data.COLUMNS, job_data.CATEGORICAL, SOURCE_COLUMNS,
+                             sorted(tr.JOB_DIAG_VALUE_MAP)], ensure_ascii=False))
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def read_rows(path):
+    """Yield the rows of the first sheet as tuples of cell values (header first)."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from wb.worksheets[0].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def collect(rows):
+    """
+    Header + data rows -> {column: [clean values]}. Raises ValueError listing
+    every problem: missing columns, bad NOC codes, unknown diagnoses, NOCs
+    on more than one row (input must be one row per NOC).
+    """
+    rows = iter(rows)
+    header = [job_data.clean_label(h) if h is not None else "" for h in next(rows, ())]
+    missing = [src for src in SOURCE_COLUMNS.values() if src not in header]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    positions = {col: header.index(src) for col, src in SOURCE_COLUMNS.items()}
+
+    columns = {col: [] for col in SOURCE_COLUMNS}
+    errors = []
+    lines = {}  # NOC -> workbook rows it appears on
+    for line, row in enumerate(rows, start=2):
+        if not any(v is not None and str(v).strip() for v in row):
+            continue  # blank line
+        values = {col: job_data.clean_label("" if row[i] is None else row[i]) for col, i in positions.items()}
+        # Excel may hand back NOC codes as numbers, losing leading zeros
+        values["NOC"] = values["NOC"].zfill(5) if values["NOC"].isdigit() else values["NOC"]
+        if not (values["NOC"].isdigit() and len(values["NOC"]) == 5):
+            errors.append(f"row {line}: bad NOC {values['NOC']!r}")
+        if values["Diagnosis"] not in tr.JOB_DIAG_VALUE_MAP:
+            errors.append(f"row {line}: unknown diagnosis {values['Diagnosis']!r}")
+        lines.setdefault(values["NOC"], []).append(line)
+        for col, value in values.items():
+            columns[col].append(value)
+
+    for noc, where in sorted(lines.items()):
+        if len(where) > 1:
+            errors.append(f"NOC {noc} on rows {', '.join(map(str, where))}: the workbook must have "
+                          "one row per NOC (aggregate regional rows before import)")
+    if errors:
+        raise ValueError("Invalid job data:\n  " + "\n  ".join(errors))
+    return columns
+
+
+def _write_atomic(path, write):
+    # Write-then-rename so the app never loads a half-written file
+    tmp = path.with_name(f".{path.stem}.{os.getpid()}{path.suffix}")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def build(source=EXCEL_PATH, out=OUT_PATH, manifest_path=MANIFEST_PATH, force=False):
+    """Regenerate `out` from `source` unless the manifest says it is current. Returns True if written."""
+    sha, generator = file_sha256(source), generator_sha256()
+    if not force and Path(out).exists() and Path(manifest_path).exists():
+        manifest = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+        if manifest.get("source_sha256") == sha and manifest.get("generator_sha256") == generator:
+            return False
+
+    columns = collect(read_rows(source))
+    arrays = job_data.to_arrays(columns)
+    _write_atomic(Path(out), lambda tmp: np.savez_compressed(tmp, **arrays))
+
+    diagnoses = {}
+    for value in columns["Diagnosis"]:
+        diagnoses[value] = diagnoses.get(value, 0) + 1
+    manifest = {
+        "source": Path(source).name,
+        "source_sha256": sha,
+        "generator_sha256": generator,
+        "rows": len(columns["NOC"]),
+        "columns": list(job_data.COLUMNS),
+        "diagnoses": diagnoses,
+        "sha256": file_sha256(out),
+    }
+    text = json.dumps(manifest, ensure_ascii=False, indent=2)
+    _write_atomic(Path(manifest_path), lambda tmp: tmp.write_text(text, encoding="utf-8"))
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build job_data.npz from the LIS diagnostics workbook.")
+    parser.add_argument("source", nargs="?", default=str(EXCEL_PATH))
+    parser.add_argument("--out", default=str(OUT_PATH))
+    parser.add_argument("--force", action="store_true", help="rebuild even if the source is unchanged")
+    parser.add_argument("--release", help="also record the diagnoses as this release id in the release store")
+    args = parser.parse_args(argv)
+
+    out = Path(args.out)
+    try:
+        written = build(args.source, out, out.with_suffix(".json"), args.force)
+    except ValueError as e:
+        sys.exit(str(e))
+    print(f"{out}: {'written' if written else 'up to date'}")
+    if args.release:
+        from logic import releases
+        releases.main(["add", args.release, "--data", str(out)])
 
 
 if __name__ == "__main__":
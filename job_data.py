@@ -1,522 +1,69 @@
 # job_data.py
 # Diagnostics de main-d'œuvre (2024-2028)
 # Source: LIS_Diagnostics_moyen_terme_2024-2028_516_professions.xlsx
+#
+# The table lives in job_data.npz (written by generate_job_data.py): one
+# array per column, with the repetitive columns dictionary-encoded as
+# int codes + distinct values. It is read on first use only.
 
-JOBS = [
-    {'NOC': '00010', 'Title (FR)': 'Membres des corps législatifs', 'Title (EN)': 'Members of legislative bodies', 'Diagnosis': 'Non publié', 'Category': 'Legislative and senior management occupations	Legislative and senior management occupations', 'Sub category': 'Legislative and senior managers'},
-    {'NOC': '00011', 'Title (FR)': 'Cadres supérieurs/cadres supérieures – administration publique', 'Title (EN)': 'Senior managers – public administration', 'Diagnosis': 'Non publié', 'Category': 'Legislative and senior management occupations	Legislative and senior management occupations', 'Sub category': 'Legislative and senior managers'},
-    {'NOC': '00012', 'Title (FR)': 'Cadres supérieurs/cadres supérieures – services financiers, communications et autres services aux entreprises', 'Title (EN)': 'Senior managers – financial, communications and other business services', 'Diagnosis': 'Non publié', 'Category': 'Legislative and senior management occupations	Legislative and senior management occupations', 'Sub category': 'Legislative and senior managers'},
-    {'NOC': '00013', 'Title (FR)': 'Cadres supérieurs/cadres supérieures – santé, enseignement, services sociaux et communautaires et associations mutuelles', 'Title (EN)': 'Senior managers – health, education, social and community services and membership organizations', 'Diagnosis': 'Non publié', 'Category': 'Legislative and senior management occupations	Legislative and senior management occupations', 'Sub category': 'Legislative and senior managers'},
-    {'NOC': '00014', 'Title (FR)': 'Cadres supérieurs/cadres supérieures – commerce, radiotélédiffusion et autres services', 'Title (EN)': 'Senior managers – trade, broadcasting and other services', 'Diagnosis': 'Non publié', 'Category': 'Legislative and senior management occupations	Legislative and senior management occupations', 'Sub category': 'Legislative and senior managers'},
-    {'NOC': '00015', 'Title (FR)': 'Cadres supérieurs/cadres supérieures – construction, transport, production et services d’utilité publique', 'Title (EN)': 'Senior managers – construction, transportation, manufacturing and utilities', 'Diagnosis': 'Non publié', 'Category': 'Legislative and senior management occupations	Legislative and senior management occupations', 'Sub category': 'Legislative and senior managers'},
-    {'NOC': '10010', 'Title (FR)': 'Directeurs financiers/directrices financières', 'Title (EN)': 'Financial managers', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Specialized middle management occupations in administrative services, financial and business services and communication (except broadcasting)'},
-    {'NOC': '10011', 'Title (FR)': 'Directeurs/directrices des ressources humaines', 'Title (EN)': 'Human resources managers', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Specialized middle management occupations in administrative services, financial and business services and communication (except broadcasting)'},
-    {'NOC': '10012', 'Title (FR)': 'Directeurs/directrices des achats', 'Title (EN)': 'Purchasing managers', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Specialized middle management occupations in administrative services, financial and business services and communication (except broadcasting)'},
-    {'NOC': '10019', 'Title (FR)': 'Directeurs/directrices d’autres services administratifs', 'Title (EN)': 'Managers of other administrative services', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Specialized middle management occupations in administrative services, financial and business services and communication (except broadcasting)'},
-    {'NOC': '10020', 'Title (FR)': 'Directeurs/directrices des assurances, de l’immobilier et du courtage financier', 'Title (EN)': 'Managers in insurance, real estate and financial brokerage', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Specialized middle management occupations in administrative services, financial and business services and communication (except broadcasting)'},
-    {'NOC': '10021', 'Title (FR)': 'Directeurs/directrices de banque, du crédit et d’autres services de placements', 'Title (EN)': 'Banking, credit and other investment managers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Specialized middle management occupations in administrative services, financial and business services and communication (except broadcasting)'},
-    {'NOC': '10022', 'Title (FR)': 'Directeurs/directrices de la publicité, du marketing et des relations publiques', 'Title (EN)': 'Advertising, marketing and public relations managers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Specialized middle management occupations in administrative services, financial and business services and communication (except broadcasting)'},
-    {'NOC': '10029', 'Title (FR)': 'Directeurs/directrices d’autres services aux entreprises', 'Title (EN)': 'Managers of other business services', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Specialized middle management occupations in administrative services, financial and business services and communication (except broadcasting)'},
-    {'NOC': '10030', 'Title (FR)': 'Directeurs/directrices d’entreprises de télécommunications', 'Title (EN)': 'Telecommunications managers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Specialized middle management occupations in administrative services, financial and business services and communication (except broadcasting)'},
-    {'NOC': '11100', 'Title (FR)': 'Vérificateurs/vérificatrices et comptables', 'Title (EN)': 'Auditors and accountants', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Professional occupations in finance and business'},
-    {'NOC': '11101', 'Title (FR)': 'Analystes financiers/analystes financières et analystes en placements', 'Title (EN)': 'Financial and investment analysts', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Professional occupations in finance and business'},
-    {'NOC': '11102', 'Title (FR)': 'Conseillers financiers/conseillères financières', 'Title (EN)': 'Financial advisors', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Professional occupations in finance and business'},
-    {'NOC': '11103', 'Title (FR)': 'Agents/agentes en valeurs, agents/agentes en placements et négociateurs/négociatrices en valeurs', 'Title (EN)': 'Securities, investment and brokerage agents', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Professional occupations in finance and business'},
-    {'NOC': '11109', 'Title (FR)': 'Autres agents financiers/agentes financières', 'Title (EN)': 'Other financial officers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Professional occupations in finance and business'},
-    {'NOC': '11200', 'Title (FR)': 'Professionnels/professionnelles en ressources humaines', 'Title (EN)': 'Human resources professionals', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Professional occupations in finance and business'},
-    {'NOC': '11201', 'Title (FR)': 'Professionnels/professionnelles des services-conseils en gestion aux entreprises', 'Title (EN)': 'Business management consulting professionals', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Professional occupations in finance and business'},
-    {'NOC': '11202', 'Title (FR)': 'Professionnels/professionnelles en publicité, en marketing et en relations publiques', 'Title (EN)': 'Advertising, marketing and public relations professionals', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Professional occupations in finance and business'},
-    {'NOC': '12010', 'Title (FR)': 'Superviseurs/superviseures de commis de bureau et du personnel de soutien administratif', 'Title (EN)': 'Supervisors of office clerks and administrative support workers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12011', 'Title (FR)': 'Superviseurs/superviseures de commis de finance et d\'assurance', 'Title (EN)': 'Supervisors of finance and insurance clerks', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12012', 'Title (FR)': 'Superviseurs/superviseures de commis de bibliothèque, de correspondanciers et d\'autres commis à l\'information', 'Title (EN)': 'Supervisors of library, correspondence and information clerks', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12013', 'Title (FR)': 'Superviseurs/superviseures du personnel de coordination de la chaîne d\'approvisionnement, du suivi et des horaires', 'Title (EN)': 'Supervisors of supply chain, tracking and scheduling coordination workers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12100', 'Title (FR)': 'Adjoints/adjointes de direction', 'Title (EN)': 'Executive assistants', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12101', 'Title (FR)': 'Agents/agentes des ressources humaines et de recrutement', 'Title (EN)': 'Human resources and recruitment officers', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12102', 'Title (FR)': 'Agents/agentes en approvisionnement et aux achats', 'Title (EN)': 'Procurement and purchasing officers', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12103', 'Title (FR)': 'Planificateurs/planificatrices de congrès et d\'événements', 'Title (EN)': 'Conference and event planners', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12104', 'Title (FR)': 'Agents/agentes d\'assurance-emploi et du revenu', 'Title (EN)': 'Employment insurance and revenue officers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12110', 'Title (FR)': 'Sténographes judiciaires, transcripteurs médicaux/transcriptrices médicales et personnel assimilé', 'Title (EN)': 'Court reporters, medical transcriptionists and related workers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12111', 'Title (FR)': 'Personnel en gestion de l’information sur la santé', 'Title (EN)': 'Health information management professionals', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12112', 'Title (FR)': 'Techniciens/techniciennes à la gestion des documents', 'Title (EN)': 'Records management technicians', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12113', 'Title (FR)': 'Agents/agentes de statistiques et professions connexes du soutien de la recherche', 'Title (EN)': 'Statistics officers and related research support occupations', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12200', 'Title (FR)': 'Techniciens/techniciennes en comptabilité et teneurs/teneuses de livres', 'Title (EN)': 'Accounting technicians and bookkeepers', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12201', 'Title (FR)': 'Experts/expertes en sinistres et rédacteurs/rédactrices sinistres', 'Title (EN)': 'Insurance adjusters and claims examiners', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12202', 'Title (FR)': 'Assureurs/assureuses', 'Title (EN)': 'Insurance underwriters', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '12203', 'Title (FR)': 'Estimateurs/estimatrices, évaluateurs/évaluatrices d\'entreprise et autres évaluateurs/évaluatrices', 'Title (EN)': 'Estimators, business valuators and appraisers', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial supervisors and specialized administrative occupations'},
-    {'NOC': '13100', 'Title (FR)': 'Agents/agentes d\'administration', 'Title (EN)': 'Administrative officers', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative occupations and transportation logistics occupations'},
-    {'NOC': '13101', 'Title (FR)': 'Agents/agentes de gestion immobilière', 'Title (EN)': 'Property administrators', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative occupations and transportation logistics occupations'},
-    {'NOC': '13102', 'Title (FR)': 'Administrateurs/administratrices de la paye', 'Title (EN)': 'Payroll administrators', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative occupations and transportation logistics occupations'},
-    {'NOC': '13110', 'Title (FR)': 'Adjoints administratifs/adjointes administratives', 'Title (EN)': 'Administrative assistants', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative occupations and transportation logistics occupations'},
-    {'NOC': '13111', 'Title (FR)': 'Adjoints administratifs juridiques/adjointes administratives juridiques', 'Title (EN)': 'Legal administrative assistants', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative occupations and transportation logistics occupations'},
-    {'NOC': '13112', 'Title (FR)': 'Adjoints administratifs médicaux/adjointes administratives médicales', 'Title (EN)': 'Medical administrative assistants', 'Diagnosis': 'Déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative occupations and transportation logistics occupations'},
-    {'NOC': '13200', 'Title (FR)': 'Courtiers/courtières en douanes, courtiers maritimes/courtières maritimes et autres courtiers/courtières', 'Title (EN)': 'Customs brokers, ship brokers and other brokers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative occupations and transportation logistics occupations'},
-    {'NOC': '13201', 'Title (FR)': 'Coordonnateur/coordonnatrice de la logistique de la production et du transport', 'Title (EN)': 'Production and transportation logistics coordinators', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative occupations and transportation logistics occupations'},
-    {'NOC': '14100', 'Title (FR)': 'Employés/employées de bureau – soutien général', 'Title (EN)': 'General office support workers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14101', 'Title (FR)': 'Réceptionnistes', 'Title (EN)': 'Receptionists', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14102', 'Title (FR)': 'Commis des services du personnel', 'Title (EN)': 'Personnel clerks', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14103', 'Title (FR)': 'Commis des services judiciaires et autres professions des services judiciaires', 'Title (EN)': 'Court clerks and related court services occupations', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14110', 'Title (FR)': 'Intervieweurs/intervieweuses pour enquêtes et commis aux statistiques', 'Title (EN)': 'Survey interviewers and statistical clerks', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14111', 'Title (FR)': 'Commis à la saisie de données', 'Title (EN)': 'Data entry clerks', 'Diagnosis': 'Léger surplus', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14112', 'Title (FR)': 'Opérateurs/opératrices d’équipement d’éditique et personnel assimilé', 'Title (EN)': 'Desktop publishing operators and related occupations', 'Diagnosis': 'Non publié', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14200', 'Title (FR)': 'Commis à la comptabilité et personnel assimilé', 'Title (EN)': 'Accounting clerks and related workers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14201', 'Title (FR)': 'Commis de banque, d’assurance et d’autres services financiers', 'Title (EN)': 'Banking, insurance and other financial clerks', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14202', 'Title (FR)': 'Commis de recouvrement', 'Title (EN)': 'Collection clerks', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14300', 'Title (FR)': 'Commis et assistants/assistantes dans les bibliothèques', 'Title (EN)': 'Library clerks and assistants', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14301', 'Title (FR)': 'Correspondanciers/correspondancières et commis aux publications et aux règlements', 'Title (EN)': 'Correspondence and publications clerks', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14400', 'Title (FR)': 'Expéditeurs/expéditrices et réceptionnaires', 'Title (EN)': 'Shippers and receivers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14401', 'Title (FR)': 'Magasiniers/magasinières et commis aux pièces', 'Title (EN)': 'Storekeepers and parts clerks', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14402', 'Title (FR)': 'Travailleurs/travailleuses de la logistique de la production', 'Title (EN)': 'Production logistics workers', 'Diagnosis': 'Équilibre', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14403', 'Title (FR)': 'Commis aux achats et au contrôle de l’inventaire', 'Title (EN)': 'Purchasing and inventory control clerks', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14404', 'Title (FR)': 'Répartiteurs/répartitrices', 'Title (EN)': 'Dispatchers', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '14405', 'Title (FR)': 'Horairistes de trajets et d’équipages', 'Title (EN)': 'Transportation route and crew schedulers', 'Diagnosis': 'Léger déficit', 'Category': 'Business, finance and administration occupations', 'Sub category': 'Administrative and financial support and supply chain logistics occupations'},
-    {'NOC': '20010', 'Title (FR)': 'Directeurs/directrices des services de génie', 'Title (EN)': 'Engineering managers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Specialized middle management occupations in engineering, architecture, science and information systems'},
-    {'NOC': '20011', 'Title (FR)': 'Directeurs/directrices des services d’architecture et de sciences', 'Title (EN)': 'Architecture and science managers', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Specialized middle management occupations in engineering, architecture, science and information systems'},
-    {'NOC': '20012', 'Title (FR)': 'Gestionnaires des systèmes informatiques', 'Title (EN)': 'Computer and information systems managers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Specialized middle management occupations in engineering, architecture, science and information systems'},
-    {'NOC': '21100', 'Title (FR)': 'Physiciens/physiciennes et astronomes', 'Title (EN)': 'Physicists and astronomers', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21101', 'Title (FR)': 'Chimistes', 'Title (EN)': 'Chemists', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21102', 'Title (FR)': 'Géoscientifiques et océanographes', 'Title (EN)': 'Geoscientists and oceanographers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21103', 'Title (FR)': 'Météorologues et climatologues', 'Title (EN)': 'Meteorologists and climatologists', 'Diagnosis': 'Non publié', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21109', 'Title (FR)': 'Autres professionnels/professionnelles des sciences physiques', 'Title (EN)': 'Other physical science professionals', 'Diagnosis': 'Non publié', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21110', 'Title (FR)': 'Biologistes et personnel scientifique assimilé', 'Title (EN)': 'Biologists and related scientists', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21111', 'Title (FR)': 'Professionnels/professionnelles des sciences forestières', 'Title (EN)': 'Forestry professionals', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21112', 'Title (FR)': 'Agronomes, conseillers/conseillères et spécialistes en agriculture', 'Title (EN)': 'Agronomists, agricultural advisors and specialists', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21120', 'Title (FR)': 'Professionnels/professionnelles de la santé et sécurité publique et environnementale', 'Title (EN)': 'Occupational and environmental health and safety professionals', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21200', 'Title (FR)': 'Architectes', 'Title (EN)': 'Architects', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21201', 'Title (FR)': 'Architectes paysagistes', 'Title (EN)': 'Landscape architects', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21202', 'Title (FR)': 'Urbanistes et planificateurs/planificatrices de l’utilisation des sols', 'Title (EN)': 'Urban and land use planners', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21203', 'Title (FR)': 'Arpenteurs-géomètres/arpenteuses-géomètres', 'Title (EN)': 'Land surveyors', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21210', 'Title (FR)': 'Mathématiciens/mathématiciennes, statisticiens/statisticiennes et actuaires', 'Title (EN)': 'Mathematicians, statisticians and actuaries', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21211', 'Title (FR)': 'Scientifiques de données', 'Title (EN)': 'Data scientists', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21220', 'Title (FR)': 'Spécialistes de la cybersécurité', 'Title (EN)': 'Cybersecurity specialists', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21221', 'Title (FR)': 'Spécialistes des systèmes commerciaux', 'Title (EN)': 'Business systems specialists', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21222', 'Title (FR)': 'Spécialistes en informatique', 'Title (EN)': 'Computer specialists', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21223', 'Title (FR)': 'Analystes de bases de données et administrateurs/administratrices de données', 'Title (EN)': 'Database analysts and data administrators', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21230', 'Title (FR)': 'Développeurs/développeuses et programmeurs/programmeuses de systèmes informatiques', 'Title (EN)': 'Computer systems developers and programmers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21231', 'Title (FR)': 'Ingénieurs/ingénieures et concepteurs/conceptrices en logiciel', 'Title (EN)': 'Software engineers and designers', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21232', 'Title (FR)': 'Développeurs/développeuses et programmeurs/programmeuses de logiciels', 'Title (EN)': 'Software developers and programmers', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21233', 'Title (FR)': 'Concepteurs/conceptrices Web', 'Title (EN)': 'Web designers', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21234', 'Title (FR)': 'Développeurs/développeuses et programmeurs/programmeuses Web', 'Title (EN)': 'Web developers and programmers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21300', 'Title (FR)': 'Ingénieurs civils/ingénieures civiles', 'Title (EN)': 'Civil engineers', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21301', 'Title (FR)': 'Ingénieurs mécaniciens/ingénieures mécaniciennes', 'Title (EN)': 'Mechanical engineers', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21310', 'Title (FR)': 'Ingénieurs électriciens et électroniciens/ingénieures électriciennes et électroniciennes', 'Title (EN)': 'Electrical and electronics engineers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21311', 'Title (FR)': 'Ingénieurs informaticiens/ingénieures informaticiennes (sauf ingénieurs/ingénieures et concepteurs/conceptrices en logiciel)', 'Title (EN)': 'Computer engineers (except software engineers and designers)', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21320', 'Title (FR)': 'Ingénieurs chimistes/ingénieures chimistes', 'Title (EN)': 'Chemical engineers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21321', 'Title (FR)': 'Ingénieurs/ingénieures d’industrie et de fabrication', 'Title (EN)': 'Industrial and manufacturing engineers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21322', 'Title (FR)': 'Ingénieurs/ingénieures métallurgistes et des matériaux', 'Title (EN)': 'Metallurgical and materials engineers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21330', 'Title (FR)': 'Ingénieurs miniers/ingénieures minières', 'Title (EN)': 'Mining engineers', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21331', 'Title (FR)': 'Ingénieurs/ingénieures géologiques', 'Title (EN)': 'Geological engineers', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21332', 'Title (FR)': 'Ingénieurs/ingénieures de l’extraction et du raffinage du pétrole', 'Title (EN)': 'Petroleum extraction and refining engineers', 'Diagnosis': 'Non publié', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21390', 'Title (FR)': 'Ingénieurs/ingénieures en aérospatiale', 'Title (EN)': 'Aerospace engineers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '21399', 'Title (FR)': 'Autres ingénieurs/ingénieures', 'Title (EN)': 'Other engineers', 'Diagnosis': 'Non publié', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Professional occupations in natural and applied sciences'},
-    {'NOC': '22100', 'Title (FR)': 'Technologues et techniciens/techniciennes en chimie', 'Title (EN)': 'Chemical technologists and technicians', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22101', 'Title (FR)': 'Technologues et techniciens/techniciennes en géologie et en minéralogie', 'Title (EN)': 'Geological and mineralogical technologists and technicians', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22110', 'Title (FR)': 'Technologues et techniciens/techniciennes en biologie', 'Title (EN)': 'Biological technologists and technicians', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22111', 'Title (FR)': 'Inspecteurs/inspectrices des produits agricoles et de la pêche', 'Title (EN)': 'Agricultural and fish product inspectors', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22112', 'Title (FR)': 'Technologues et techniciens/techniciennes en sciences forestières', 'Title (EN)': 'Forestry technologists and technicians', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22113', 'Title (FR)': 'Techniciens/techniciennes du milieu naturel et de la pêche', 'Title (EN)': 'Natural environment and fisheries technicians', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22114', 'Title (FR)': 'Techniciens/techniciennes et spécialistes de l’aménagement paysager et de l’horticulture', 'Title (EN)': 'Landscaping and horticulture technicians and specialists', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22210', 'Title (FR)': 'Technologues et techniciens/techniciennes en architecture', 'Title (EN)': 'Architectural technologists and technicians', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22211', 'Title (FR)': 'Designers industriels/designers industrielles', 'Title (EN)': 'Industrial designers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22212', 'Title (FR)': 'Technologues et techniciens/techniciennes en dessin', 'Title (EN)': 'Drafting technologists and technicians', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22213', 'Title (FR)': 'Technologues et techniciens/techniciennes en arpentage', 'Title (EN)': 'Survey technologists and technicians', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22214', 'Title (FR)': 'Personnel technique en géomatique et en météorologie', 'Title (EN)': 'Geomatics and meteorology technologists and technicians', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22220', 'Title (FR)': 'Techniciens/techniciennes de réseau informatique et Web', 'Title (EN)': 'Computer network and Web technicians', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22221', 'Title (FR)': 'Agents/agentes de soutien aux utilisateurs', 'Title (EN)': 'User support technicians', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22222', 'Title (FR)': 'Évaluateurs/évaluatrices de systèmes informatiques', 'Title (EN)': 'Computer systems evaluators', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22230', 'Title (FR)': 'Vérificateurs/vérificatrices et inspecteurs/inspectrices des essais non destructifs', 'Title (EN)': 'Non-destructive testing inspectors and examiners', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22231', 'Title (FR)': 'Inspecteurs/inspectrices d’ingénierie et officiers/officières de réglementation', 'Title (EN)': 'Engineering inspectors and regulatory officers', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22232', 'Title (FR)': 'Spécialistes de l’hygiène et de la sécurité au travail', 'Title (EN)': 'Occupational health and safety specialists', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22233', 'Title (FR)': 'Inspecteurs/inspectrices en construction', 'Title (EN)': 'Construction inspectors', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22300', 'Title (FR)': 'Technologues et techniciens/techniciennes en génie civil', 'Title (EN)': 'Civil engineering technologists and technicians', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22301', 'Title (FR)': 'Technologues et techniciens/techniciennes en génie mécanique', 'Title (EN)': 'Mechanical engineering technologists and technicians', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22302', 'Title (FR)': 'Technologues et techniciens/techniciennes en génie industriel et en génie de fabrication', 'Title (EN)': 'Industrial and manufacturing engineering technologists and technicians', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22303', 'Title (FR)': 'Estimateurs/estimatrices en construction', 'Title (EN)': 'Construction estimators', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22310', 'Title (FR)': 'Technologues et techniciens/techniciennes en génie électrique et électronique', 'Title (EN)': 'Electrical and electronics engineering technologists and technicians', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22311', 'Title (FR)': 'Électroniciens/électroniciennes d’entretien (biens domestiques et commerciaux)', 'Title (EN)': 'Electronics service technicians (household and commercial equipment)', 'Diagnosis': 'Équilibre', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22312', 'Title (FR)': 'Techniciens/techniciennes et mécaniciens/mécaniciennes d’instruments industriels', 'Title (EN)': 'Industrial instrument technicians and mechanics', 'Diagnosis': 'Déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '22313', 'Title (FR)': 'Mécaniciens, techniciens et contrôleurs d’avionique et d’instruments et d’appareillages électriques d’aéronefs', 'Title (EN)': 'Avionics mechanics, technicians and inspectors', 'Diagnosis': 'Léger déficit', 'Category': 'Natural and applied sciences and related occupations', 'Sub category': 'Technical occupations related to natural and applied sciences'},
-    {'NOC': '30010', 'Title (FR)': 'Directeurs/directrices des soins de santé', 'Title (EN)': 'Health care managers', 'Diagnosis': 'Équilibre', 'Category': 'Health occupations', 'Sub category': 'Specialized middle management occupations in health care'},
-    {'NOC': '31100', 'Title (FR)': 'Spécialistes en médecine clinique et de laboratoire', 'Title (EN)': 'Clinical and laboratory medicine specialists', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31101', 'Title (FR)': 'Spécialistes en chirurgie', 'Title (EN)': 'Surgical specialists', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31102', 'Title (FR)': 'Omnipraticiens et médecins en médecine familiale', 'Title (EN)': 'General practitioners and family physicians', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31103', 'Title (FR)': 'Vétérinaires', 'Title (EN)': 'Veterinarians', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31110', 'Title (FR)': 'Dentistes', 'Title (EN)': 'Dentists', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31111', 'Title (FR)': 'Optométristes', 'Title (EN)': 'Optometrists', 'Diagnosis': 'Équilibre', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31112', 'Title (FR)': 'Audiologistes et orthophonistes', 'Title (EN)': 'Audiologists and speech-language pathologists', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31120', 'Title (FR)': 'Pharmaciens', 'Title (EN)': 'Pharmacists', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31121', 'Title (FR)': 'Diététistes et nutritionnistes', 'Title (EN)': 'Dietitians and nutritionists', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31200', 'Title (FR)': 'Psychologues', 'Title (EN)': 'Psychologists', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31201', 'Title (FR)': 'Chiropraticiens', 'Title (EN)': 'Chiropractors', 'Diagnosis': 'Équilibre', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31202', 'Title (FR)': 'Physiothérapeutes', 'Title (EN)': 'Physiotherapists', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31203', 'Title (FR)': 'Ergothérapeutes', 'Title (EN)': 'Occupational therapists', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31204', 'Title (FR)': 'Kinésiologues et autres professionnels en thérapie et en diagnostic', 'Title (EN)': 'Kinesiologists and other therapy and diagnostic professionals', 'Diagnosis': 'Équilibre', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31209', 'Title (FR)': 'Autres professionnels en diagnostic et en traitement de la santé', 'Title (EN)': 'Other health diagnostic and treatment professionals', 'Diagnosis': 'Équilibre', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31300', 'Title (FR)': 'Coordonnateurs et superviseurs des soins infirmiers', 'Title (EN)': 'Nursing coordinators and supervisors', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31301', 'Title (FR)': 'Infirmiers autorisés et infirmiers psychiatriques autorisés', 'Title (EN)': 'Registered nurses and registered psychiatric nurses', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31302', 'Title (FR)': 'Infirmiers praticiens', 'Title (EN)': 'Nurse practitioners', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '31303', 'Title (FR)': 'Adjoints au médecin, sages-femmes et professionnels paramédicaux', 'Title (EN)': 'Physician assistants, midwives and paramedical professionals', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Professional occupations in health'},
-    {'NOC': '32100', 'Title (FR)': 'Opticiens d’ordonnances', 'Title (EN)': 'Dispensing opticians', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32101', 'Title (FR)': 'Infirmiers auxiliaires', 'Title (EN)': 'Licensed practical nurses', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32102', 'Title (FR)': 'Personnel ambulancier et paramédical', 'Title (EN)': 'Paramedics and ambulance attendants', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32103', 'Title (FR)': 'Inhalothérapeutes, perfusionnistes cardiovasculaires et technologues cardiopulmonaires', 'Title (EN)': 'Respiratory therapists, cardiovascular perfusionists and cardiopulmonary technologists', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32104', 'Title (FR)': 'Technologues en santé animale et techniciens vétérinaires', 'Title (EN)': 'Animal health technologists and veterinary technicians', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32109', 'Title (FR)': 'Autre personnel technique en thérapie et en diagnostic', 'Title (EN)': 'Other therapy and diagnostic technical occupations', 'Diagnosis': 'Non publié', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32110', 'Title (FR)': 'Denturologistes', 'Title (EN)': 'Denturists', 'Diagnosis': 'Équilibre', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32111', 'Title (FR)': 'Hygiénistes et thérapeutes dentaires', 'Title (EN)': 'Dental hygienists and dental therapists', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32112', 'Title (FR)': 'Technologues et techniciens dentaires', 'Title (EN)': 'Dental technologists and technicians', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32120', 'Title (FR)': 'Technologues de laboratoires médicaux', 'Title (EN)': 'Medical laboratory technologists', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32121', 'Title (FR)': 'Technologues en radiation médicale', 'Title (EN)': 'Medical radiation technologists', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32122', 'Title (FR)': 'Technologues en échographie', 'Title (EN)': 'Diagnostic medical sonographers', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32123', 'Title (FR)': 'Technologues en cardiologie et en électrophysiologie diagnostique', 'Title (EN)': 'Cardiology technologists and diagnostic electrophysiology technologists', 'Diagnosis': 'Déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32124', 'Title (FR)': 'Techniciens en pharmacie', 'Title (EN)': 'Pharmacy technicians', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32129', 'Title (FR)': 'Autres technologues et techniciens des sciences de la santé', 'Title (EN)': 'Other health science technologists and technicians', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32200', 'Title (FR)': 'Praticiens en médecine traditionnelle chinoise et acupuncteurs', 'Title (EN)': 'Traditional Chinese medicine practitioners and acupuncturists', 'Diagnosis': 'Non publié', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32201', 'Title (FR)': 'Massothérapeutes', 'Title (EN)': 'Massage therapists', 'Diagnosis': 'Équilibre', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '32209', 'Title (FR)': 'Autres praticiens des médecines douces', 'Title (EN)': 'Other alternative health practitioners', 'Diagnosis': 'Non publié', 'Category': 'Health occupations', 'Sub category': 'Technical occupations in health'},
-    {'NOC': '33100', 'Title (FR)': 'Assistants dentaires et auxiliaires dans les laboratoires dentaires', 'Title (EN)': 'Dental assistants and dental laboratory aides', 'Diagnosis': 'Équilibre', 'Category': 'Health occupations', 'Sub category': 'Assisting occupations in support of health services'},
-    {'NOC': '33101', 'Title (FR)': 'Assistants de laboratoires médicaux et préposés techniques reliés', 'Title (EN)': 'Medical laboratory assistants and related technical workers', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Assisting occupations in support of health services'},
-    {'NOC': '33102', 'Title (FR)': 'Aides-infirmiers, aides-soignants et préposés aux bénéficiaires', 'Title (EN)': 'Nurse aides, orderlies and patient service associates', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Assisting occupations in support of health services'},
-    {'NOC': '33103', 'Title (FR)': 'Assistants techniques en pharmacie et assistants en pharmacie', 'Title (EN)': 'Pharmacy technical assistants and pharmacy assistants', 'Diagnosis': 'Léger déficit', 'Category': 'Health occupations', 'Sub category': 'Assisting occupations in support of health services'},
-    {'NOC': '33109', 'Title (FR)': 'Autre personnel de soutien des services de santé', 'Title (EN)': 'Other health services support occupations', 'Diagnosis': 'Non publié', 'Category': 'Health occupations', 'Sub category': 'Assisting occupations in support of health services'},
-    {'NOC': '40010', 'Title (FR)': 'Gestionnaires de la fonction publique – politiques et programmes sociaux et de santé', 'Title (EN)': 'Public service managers – social and health policy and program administration', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Managers in public administration, in education and social and community services and in public protection services'},
-    {'NOC': '40011', 'Title (FR)': 'Gestionnaires de la fonction publique – analyse économique et administration de programmes', 'Title (EN)': 'Public service managers – economic analysis and program administration', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Managers in public administration, in education and social and community services and in public protection services'},
-    {'NOC': '40012', 'Title (FR)': 'Gestionnaires de la fonction publique – politiques en éducation et administration de programmes', 'Title (EN)': 'Public service managers – education policy and program administration', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Managers in public administration, in education and social and community services and in public protection services'},
-    {'NOC': '40019', 'Title (FR)': 'Autres gestionnaires de la fonction publique', 'Title (EN)': 'Other public service managers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Managers in public administration, in education and social and community services and in public protection services'},
-    {'NOC': '40020', 'Title (FR)': 'Administrateurs – enseignement postsecondaire et formation professionnelle', 'Title (EN)': 'Postsecondary education and vocational training administrators', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Managers in public administration, in education and social and community services and in public protection services'},
-    {'NOC': '40021', 'Title (FR)': 'Directeurs d’école et administrateurs de programmes – primaire et secondaire', 'Title (EN)': 'School principals and elementary/secondary education program administrators', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Managers in public administration, in education and social and community services and in public protection services'},
-    {'NOC': '40030', 'Title (FR)': 'Directeurs des services sociaux, communautaires et correctionnels', 'Title (EN)': 'Social, community and correctional services managers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Managers in public administration, in education and social and community services and in public protection services'},
-    {'NOC': '40040', 'Title (FR)': 'Officiers de direction des services de police et professions connexes', 'Title (EN)': 'Police service senior officers and related public protection occupations', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Managers in public administration, in education and social and community services and in public protection services'},
-    {'NOC': '40041', 'Title (FR)': 'Chefs et officiers supérieurs des services d’incendie', 'Title (EN)': 'Fire chiefs and senior fire officers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Managers in public administration, in education and social and community services and in public protection services'},
-    {'NOC': '40042', 'Title (FR)': 'Officiers/officières de direction des Forces armées canadiennes', 'Title (EN)': 'Canadian Armed Forces senior officers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Managers in public administration, in education and social and community services and in public protection services'},
-    {'NOC': '41100', 'Title (FR)': 'Juges', 'Title (EN)': 'Judges', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41101', 'Title (FR)': 'Avocats/avocates (Canada) et notaires (Québec)', 'Title (EN)': 'Lawyers (Canada-wide) and notaries (Quebec)', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41200', 'Title (FR)': 'Professeurs et chargés de cours universitaires', 'Title (EN)': 'University professors and lecturers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41201', 'Title (FR)': 'Assistants d’enseignement et de recherche au postsecondaire', 'Title (EN)': 'Postsecondary teaching and research assistants', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41210', 'Title (FR)': 'Enseignants au collégial et instructeurs en formation professionnelle', 'Title (EN)': 'College and vocational instructors', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41220', 'Title (FR)': 'Enseignants au secondaire', 'Title (EN)': 'Secondary school teachers', 'Diagnosis': 'Déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41221', 'Title (FR)': 'Enseignants au primaire et préscolaire', 'Title (EN)': 'Elementary and kindergarten teachers', 'Diagnosis': 'Déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41300', 'Title (FR)': 'Travailleurs sociaux', 'Title (EN)': 'Social workers', 'Diagnosis': 'Déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41301', 'Title (FR)': 'Thérapeutes en counseling et thérapies spécialisées connexes', 'Title (EN)': 'Counselling and related specialized therapists', 'Diagnosis': 'Déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41302', 'Title (FR)': 'Chefs religieux', 'Title (EN)': 'Religious leaders', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41310', 'Title (FR)': 'Enquêteurs de police et autres professions d’enquête', 'Title (EN)': 'Police investigators and related occupations', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41311', 'Title (FR)': 'Agents de probation et de libération conditionnelle', 'Title (EN)': 'Probation and parole officers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41320', 'Title (FR)': 'Conseillers en information scolaire', 'Title (EN)': 'Educational counsellors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41321', 'Title (FR)': 'Conseillers en développement de carrière et en orientation (hors éducation)', 'Title (EN)': 'Career development and employment counsellors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41400', 'Title (FR)': 'Recherchistes, experts-conseils et agents de programmes – sciences naturelles et appliquées', 'Title (EN)': 'Natural and applied sciences policy researchers, consultants and program officers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41401', 'Title (FR)': 'Économistes, recherchistes et analystes des politiques économiques', 'Title (EN)': 'Economists and economic policy researchers and analysts', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41402', 'Title (FR)': 'Agents de développement économique et analystes en marketing', 'Title (EN)': 'Economic development officers and marketing analysts', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41403', 'Title (FR)': 'Recherchistes, experts-conseils et agents de programmes – politiques sociales', 'Title (EN)': 'Social policy researchers, consultants and program officers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41404', 'Title (FR)': 'Recherchistes, experts-conseils et agents de programmes – politiques de la santé', 'Title (EN)': 'Health policy researchers, consultants and program officers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41405', 'Title (FR)': 'Recherchistes, experts-conseils et agents de programmes – politiques de l’enseignement', 'Title (EN)': 'Education policy researchers, consultants and program officers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41406', 'Title (FR)': 'Recherchistes, experts-conseils et agents de programmes – sports, loisirs et conditionnement physique', 'Title (EN)': 'Sports, recreation and fitness policy researchers, consultants and program officers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41407', 'Title (FR)': 'Agents de programmes propres au gouvernement', 'Title (EN)': 'Government program officers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '41409', 'Title (FR)': 'Autres professionnels/professionnelles des sciences sociales', 'Title (EN)': 'Other social science professionals', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Professional occupations in law, education, social, community and government services'},
-    {'NOC': '42100', 'Title (FR)': 'Policiers/policières (sauf cadres supérieurs)', 'Title (EN)': 'Police officers (except senior management)', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Front-line public protection services and paraprofessional occupations in legal, social, community, education services'},
-    {'NOC': '42101', 'Title (FR)': 'Pompiers/pompières', 'Title (EN)': 'Firefighters', 'Diagnosis': 'Léger surplus', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Front-line public protection services and paraprofessional occupations in legal, social, community, education services'},
-    {'NOC': '42102', 'Title (FR)': 'Membres spécialisés des Forces armées canadiennes', 'Title (EN)': 'Specialized members of the Canadian Armed Forces', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Front-line public protection services and paraprofessional occupations in legal, social, community, education services'},
-    {'NOC': '42200', 'Title (FR)': 'Techniciens/techniciennes juridiques et personnel assimilé', 'Title (EN)': 'Paralegals and related occupations', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Front-line public protection services and paraprofessional occupations in legal, social, community, education services'},
-    {'NOC': '42201', 'Title (FR)': 'Travailleurs/travailleuses des services sociaux et communautaires', 'Title (EN)': 'Social and community service workers', 'Diagnosis': 'Déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Front-line public protection services and paraprofessional occupations in legal, social, community, education services'},
-    {'NOC': '42202', 'Title (FR)': 'Éducateurs/éducatrices et aides-éducateurs/aides-éducatrices de la petite enfance', 'Title (EN)': 'Early childhood educators and assistants', 'Diagnosis': 'Déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Front-line public protection services and paraprofessional occupations in legal, social, community, education services'},
-    {'NOC': '42203', 'Title (FR)': 'Instructeurs/instructrices pour personnes ayant une déficience', 'Title (EN)': 'Instructors for persons with disabilities', 'Diagnosis': 'Déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Front-line public protection services and paraprofessional occupations in legal, social, community, education services'},
-    {'NOC': '42204', 'Title (FR)': 'Travailleurs/travailleuses de la religion', 'Title (EN)': 'Religious workers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Front-line public protection services and paraprofessional occupations in legal, social, community, education services'},
-    {'NOC': '43100', 'Title (FR)': 'Aides-enseignants/aides-enseignantes aux niveaux primaire et secondaire', 'Title (EN)': 'Elementary and secondary school teacher assistants', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Assisting occupations in education and in legal and public protection'},
-    {'NOC': '43109', 'Title (FR)': 'Autres instructeurs/instructrices', 'Title (EN)': 'Other instructors', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Assisting occupations in education and in legal and public protection'},
-    {'NOC': '43200', 'Title (FR)': 'Shérifs et huissiers/huissières de justice', 'Title (EN)': 'Sheriffs and bailiffs', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Assisting occupations in education and in legal and public protection'},
-    {'NOC': '43201', 'Title (FR)': 'Agents/agentes de services correctionnels', 'Title (EN)': 'Correctional service officers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Assisting occupations in education and in legal and public protection'},
-    {'NOC': '43202', 'Title (FR)': 'Agents/agentes d’application de règlements municipaux et autres agents/agentes de réglementation', 'Title (EN)': 'By-law enforcement officers and other regulatory officers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Assisting occupations in education and in legal and public protection'},
-    {'NOC': '43203', 'Title (FR)': 'Agents/agentes des services frontaliers, des douanes et de l’immigration', 'Title (EN)': 'Border services, customs and immigration officers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Assisting occupations in education and in legal and public protection'},
-    {'NOC': '43204', 'Title (FR)': 'Membres des opérations des Forces armées canadiennes', 'Title (EN)': 'Canadian Armed Forces operations personnel', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Assisting occupations in education and in legal and public protection'},
-    {'NOC': '44100', 'Title (FR)': 'Gardiens/gardiennes d’enfants en milieu familial', 'Title (EN)': 'Home child care providers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Care providers and legal and public protection support occupations'},
-    {'NOC': '44101', 'Title (FR)': 'Aides de maintien à domicile, aides familiaux/familiales et personnel assimilé', 'Title (EN)': 'Home support workers, caregivers and related occupations', 'Diagnosis': 'Déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Care providers and legal and public protection support occupations'},
-    {'NOC': '44200', 'Title (FR)': 'Combattants/combattantes de première ligne des Forces armées canadiennes', 'Title (EN)': 'Front-line combat personnel of the Canadian Armed Forces', 'Diagnosis': 'Non publié', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Care providers and legal and public protection support occupations'},
-    {'NOC': '45100', 'Title (FR)': 'Surveillants/surveillantes d’élèves, brigadiers/brigadières et professions connexes', 'Title (EN)': 'School monitors, crossing guards and related occupations', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in education, law and social, community and government services', 'Sub category': 'Student monitors, crossing guards and related occupations'},
-    {'NOC': '50010', 'Title (FR)': 'Directeurs/directrices de bibliothèques, archives, musées et galeries d’art', 'Title (EN)': 'Library, archive, museum and art gallery managers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Specialized middle management occupations in art, culture, recreation and sport'},
-    {'NOC': '50011', 'Title (FR)': 'Directeurs/directrices – édition, cinéma, radiotélédiffusion et arts de la scène', 'Title (EN)': 'Managers – publishing, film, broadcasting and performing arts', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Specialized middle management occupations in art, culture, recreation and sport'},
-    {'NOC': '50012', 'Title (FR)': 'Directeurs/directrices de programmes et services de sports, loisirs et conditionnement physique', 'Title (EN)': 'Sports, recreation and fitness program and service managers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Specialized middle management occupations in art, culture, recreation and sport'},
-    {'NOC': '51100', 'Title (FR)': 'Bibliothécaires', 'Title (EN)': 'Librarians', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Professional occupations in art and culture'},
-    {'NOC': '51101', 'Title (FR)': 'Restaurateurs/restauratrices et conservateurs/conservatrices', 'Title (EN)': 'Conservators and curators', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Professional occupations in art and culture'},
-    {'NOC': '51102', 'Title (FR)': 'Archivistes', 'Title (EN)': 'Archivists', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Professional occupations in art and culture'},
-    {'NOC': '51110', 'Title (FR)': 'Réviseurs, rédacteurs-réviseurs et chefs du service des nouvelles', 'Title (EN)': 'Editors, proofreaders and news managers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Professional occupations in art and culture'},
-    {'NOC': '51111', 'Title (FR)': 'Auteurs, écrivains et rédacteurs (sauf techniques)', 'Title (EN)': 'Authors, writers and non-technical writers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Professional occupations in art and culture'},
-    {'NOC': '51112', 'Title (FR)': 'Rédacteurs techniques', 'Title (EN)': 'Technical writers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Professional occupations in art and culture'},
-    {'NOC': '51113', 'Title (FR)': 'Journalistes', 'Title (EN)': 'Journalists', 'Diagnosis': 'Léger surplus', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Professional occupations in art and culture'},
-    {'NOC': '51114', 'Title (FR)': 'Traducteurs, terminologues et interprètes', 'Title (EN)': 'Translators, terminologists and interpreters', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Professional occupations in art and culture'},
-    {'NOC': '51120', 'Title (FR)': 'Producteurs, réalisateurs, chorégraphes et personnel assimilé', 'Title (EN)': 'Producers, directors, choreographers and related occupations', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Professional occupations in art and culture'},
-    {'NOC': '51121', 'Title (FR)': 'Chefs d’orchestre, compositeurs et arrangeurs', 'Title (EN)': 'Conductors, composers and arrangers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Professional occupations in art and culture'},
-    {'NOC': '51122', 'Title (FR)': 'Musiciens et chanteurs', 'Title (EN)': 'Musicians and singers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Professional occupations in art and culture'},
-    {'NOC': '52100', 'Title (FR)': 'Techniciens dans les bibliothèques et les services d’archives publiques', 'Title (EN)': 'Library and public archives technicians', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Technical occupations in art, culture and sport'},
-    {'NOC': '52110', 'Title (FR)': 'Cadreurs de films et cadreurs vidéo', 'Title (EN)': 'Film and video camera operators', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Technical occupations in art, culture and sport'},
-    {'NOC': '52111', 'Title (FR)': 'Techniciens en graphisme', 'Title (EN)': 'Graphic arts technicians', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Technical occupations in art, culture and sport'},
-    {'NOC': '52112', 'Title (FR)': 'Techniciens en radiotélédiffusion', 'Title (EN)': 'Broadcasting technicians', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Technical occupations in art, culture and sport'},
-    {'NOC': '52113', 'Title (FR)': 'Techniciens en enregistrement audio et vidéo', 'Title (EN)': 'Audio and video recording technicians', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Technical occupations in art, culture and sport'},
-    {'NOC': '52114', 'Title (FR)': 'Annonceurs et autres communicateurs', 'Title (EN)': 'Announcers and other broadcasters', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Technical occupations in art, culture and sport'},
-    {'NOC': '52119', 'Title (FR)': 'Autre personnel technique et de coordination – cinéma, radiotélédiffusion et arts de la scène', 'Title (EN)': 'Other technical and coordination occupations in film, broadcasting and performing arts', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Technical occupations in art, culture and sport'},
-    {'NOC': '52120', 'Title (FR)': 'Designers graphiques et illustrateurs', 'Title (EN)': 'Graphic designers and illustrators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Technical occupations in art, culture and sport'},
-    {'NOC': '52121', 'Title (FR)': 'Designers d’intérieur et décorateurs d’intérieur', 'Title (EN)': 'Interior designers and interior decorators', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Technical occupations in art, culture and sport'},
-    {'NOC': '53100', 'Title (FR)': 'Registraires, restaurateurs, interprètes et travailleurs assimilés des musées et galeries d’art', 'Title (EN)': 'Registrars, restorers, interpreters and related museum and art gallery workers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '53110', 'Title (FR)': 'Photographes', 'Title (EN)': 'Photographers', 'Diagnosis': 'Léger surplus', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '53111', 'Title (FR)': 'Assistants et opérateurs – cinéma, radiotélédiffusion, photographie et arts de la scène', 'Title (EN)': 'Film, broadcasting, photography and performing arts assistants and operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '53120', 'Title (FR)': 'Danseurs', 'Title (EN)': 'Dancers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '53121', 'Title (FR)': 'Acteurs, comédiens et artistes de cirque', 'Title (EN)': 'Actors, comedians and circus performers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '53122', 'Title (FR)': 'Peintres, sculpteurs et autres artistes des arts visuels', 'Title (EN)': 'Painters, sculptors and other visual artists', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '53123', 'Title (FR)': 'Ensembliers de théâtre, dessinateurs de mode et concepteurs artistiques', 'Title (EN)': 'Theatre set designers, fashion designers and other artistic designers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '53124', 'Title (FR)': 'Artisans', 'Title (EN)': 'Artisans and craftspersons', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '53125', 'Title (FR)': 'Patronniers de produits textiles et d’articles en cuir et en fourrure', 'Title (EN)': 'Patternmakers – textiles, leather and fur products', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '53200', 'Title (FR)': 'Athlètes', 'Title (EN)': 'Athletes', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '53201', 'Title (FR)': 'Entraîneurs/entraîneuses', 'Title (EN)': 'Coaches', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '53202', 'Title (FR)': 'Arbitres et officiels de sports', 'Title (EN)': 'Sports referees and officials', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Occupations in art, culture and sport'},
-    {'NOC': '54100', 'Title (FR)': 'Animateurs et responsables de programmes de sports, de loisirs et de conditionnement physique', 'Title (EN)': 'Program leaders in sports, recreation and fitness', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Support occupations in sport'},
-    {'NOC': '55109', 'Title (FR)': 'Autres artistes de spectacle', 'Title (EN)': 'Other performing artists', 'Diagnosis': 'Non publié', 'Category': 'Occupations in art, culture, recreation and sport', 'Sub category': 'Support occupations in art and culture'},
-    {'NOC': '60010', 'Title (FR)': 'Directeurs des ventes corporatives', 'Title (EN)': 'Corporate sales managers', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Middle management occupations in retail and wholesale trade and customer services'},
-    {'NOC': '60020', 'Title (FR)': 'Directeurs – commerce de détail et de gros', 'Title (EN)': 'Retail and wholesale trade managers', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Middle management occupations in retail and wholesale trade and customer services'},
-    {'NOC': '60030', 'Title (FR)': 'Directeurs de la restauration et des services alimentaires', 'Title (EN)': 'Food service managers', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Middle management occupations in retail and wholesale trade and customer services'},
-    {'NOC': '60031', 'Title (FR)': 'Directeurs des services d’hébergement', 'Title (EN)': 'Accommodation service managers', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Middle management occupations in retail and wholesale trade and customer services'},
-    {'NOC': '60040', 'Title (FR)': 'Directeurs du service à la clientèle et des services personnels', 'Title (EN)': 'Customer and personal service managers', 'Diagnosis': 'Non publié', 'Category': 'Sales and service occupations', 'Sub category': 'Middle management occupations in retail and wholesale trade and customer services'},
-    {'NOC': '62010', 'Title (FR)': 'Superviseurs des ventes – commerce de détail', 'Title (EN)': 'Retail sales supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '62020', 'Title (FR)': 'Superviseurs des services alimentaires', 'Title (EN)': 'Food service supervisors', 'Diagnosis': 'Déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '62021', 'Title (FR)': 'Gouvernants principaux', 'Title (EN)': 'Executive housekeepers', 'Diagnosis': 'Non publié', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '62022', 'Title (FR)': 'Superviseurs des services d’hébergement, de voyages, de tourisme et connexes', 'Title (EN)': 'Accommodation, travel, tourism and related services supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '62023', 'Title (FR)': 'Superviseurs des services d’information et à la clientèle', 'Title (EN)': 'Information and customer service supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '62024', 'Title (FR)': 'Surveillants des services de nettoyage', 'Title (EN)': 'Cleaning supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '62029', 'Title (FR)': 'Surveillants des autres services', 'Title (EN)': 'Other service supervisors', 'Diagnosis': 'Non publié', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '62100', 'Title (FR)': 'Spécialistes des ventes techniques – commerce de gros', 'Title (EN)': 'Technical sales specialists – wholesale trade', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '62101', 'Title (FR)': 'Acheteurs des commerces de détail et de gros', 'Title (EN)': 'Retail and wholesale buyers', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '62200', 'Title (FR)': 'Chefs', 'Title (EN)': 'Chefs', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '62201', 'Title (FR)': 'Directeurs de funérailles et embaumeurs', 'Title (EN)': 'Funeral directors and embalmers', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '62202', 'Title (FR)': 'Bijoutiers, réparateurs de bijoux, horlogers-rhabilleurs et professions connexes', 'Title (EN)': 'Jewelers, jewelry repairers, watch and clock repairers', 'Diagnosis': 'Léger surplus', 'Category': 'Sales and service occupations', 'Sub category': 'Retail sales and service supervisors and specialized occupations in sales and services'},
-    {'NOC': '63100', 'Title (FR)': 'Agents et courtiers d’assurance', 'Title (EN)': 'Insurance agents and brokers', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Occupations in sales and services'},
-    {'NOC': '63101', 'Title (FR)': 'Agents et vendeurs en immobilier', 'Title (EN)': 'Real estate agents and salespersons', 'Diagnosis': 'Léger surplus', 'Category': 'Sales and service occupations', 'Sub category': 'Occupations in sales and services'},
-    {'NOC': '63102', 'Title (FR)': 'Représentants des ventes financières', 'Title (EN)': 'Financial sales representatives', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Occupations in sales and services'},
-    {'NOC': '63200', 'Title (FR)': 'Cuisiniers', 'Title (EN)': 'Cooks', 'Diagnosis': 'Déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Occupations in sales and services'},
-    {'NOC': '63201', 'Title (FR)': 'Bouchers – commerce de gros et de détail', 'Title (EN)': 'Butchers – retail and wholesale', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Occupations in sales and services'},
-    {'NOC': '63202', 'Title (FR)': 'Boulangers-pâtissiers', 'Title (EN)': 'Bakers and pastry chefs', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Occupations in sales and services'},
-    {'NOC': '63210', 'Title (FR)': 'Coiffeurs et barbiers', 'Title (EN)': 'Hairdressers and barbers', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Occupations in sales and services'},
-    {'NOC': '63211', 'Title (FR)': 'Esthéticiens, électrolystes et professions connexes', 'Title (EN)': 'Estheticians, electrologists and related occupations', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Occupations in sales and services'},
-    {'NOC': '63220', 'Title (FR)': 'Cordonniers et fabricants de chaussures', 'Title (EN)': 'Shoemakers and shoe repairers', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Occupations in sales and services'},
-    {'NOC': '63221', 'Title (FR)': 'Tapissiers-garnisseurs/tapissières-garnisseuses', 'Title (EN)': 'Upholsterers', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Occupations in sales and services'},
-    {'NOC': '64100', 'Title (FR)': 'Vendeurs et décorateurs-étalagistes – commerce de détail', 'Title (EN)': 'Retail salespersons and visual merchandisers', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64101', 'Title (FR)': 'Représentants des ventes et des comptes – commerce de gros (non technique)', 'Title (EN)': 'Wholesale sales representatives and account representatives (non-technical)', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64200', 'Title (FR)': 'Tailleurs, couturiers, fourreurs et modistes', 'Title (EN)': 'Tailors, dressmakers, furriers and milliners', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64201', 'Title (FR)': 'Conseillers imagistes et autres conseillers en soins personnalisés', 'Title (EN)': 'Image consultants and other personal care advisors', 'Diagnosis': 'Non publié', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64300', 'Title (FR)': 'Maîtres d’hôtel et hôtes/hôtesses', 'Title (EN)': 'Maîtres d’hôtel and hosts/hostesses', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64301', 'Title (FR)': 'Barmans/barmaids', 'Title (EN)': 'Bartenders', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64310', 'Title (FR)': 'Conseillers en voyages', 'Title (EN)': 'Travel counsellors', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64311', 'Title (FR)': 'Commissaires et agents de bord', 'Title (EN)': 'Airline stewards and flight attendants', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64312', 'Title (FR)': 'Agents à la billetterie et aux services aériens', 'Title (EN)': 'Airline ticket and customer service agents', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64313', 'Title (FR)': 'Agents à la billetterie et personnel du service de fret – transport routier et maritime', 'Title (EN)': 'Transportation ticket agents and cargo service representatives', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64314', 'Title (FR)': 'Réceptionnistes d’hôtel', 'Title (EN)': 'Hotel front desk clerks', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64320', 'Title (FR)': 'Guides touristiques et guides itinérants', 'Title (EN)': 'Tour and travel guides', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64321', 'Title (FR)': 'Travailleurs dans les casinos', 'Title (EN)': 'Casino workers', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64322', 'Title (FR)': 'Guides d’activités récréatives et sportives de plein air', 'Title (EN)': 'Outdoor recreation and sports guides', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64400', 'Title (FR)': 'Représentants au service à la clientèle – institutions financières', 'Title (EN)': 'Customer service representatives – financial institutions', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64401', 'Title (FR)': 'Représentants des services postaux', 'Title (EN)': 'Postal service representatives', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64409', 'Title (FR)': 'Autres préposés aux services d’information et à la clientèle', 'Title (EN)': 'Other information and customer service clerks', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '64410', 'Title (FR)': 'Agents de sécurité et personnel assimilé', 'Title (EN)': 'Security guards and related security service occupations', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service representatives and other customer and personal services occupations'},
-    {'NOC': '65100', 'Title (FR)': 'Caissiers', 'Title (EN)': 'Cashiers', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65101', 'Title (FR)': 'Préposés de stations-service', 'Title (EN)': 'Gas station attendants', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65102', 'Title (FR)': 'Garnisseurs de tablettes, commis et préposés aux commandes', 'Title (EN)': 'Shelf stockers, store clerks and order fillers', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65109', 'Title (FR)': 'Autre personnel assimilé des ventes', 'Title (EN)': 'Other sales support occupations', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65200', 'Title (FR)': 'Serveurs d’aliments et de boissons', 'Title (EN)': 'Food and beverage servers', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65201', 'Title (FR)': 'Serveurs au comptoir, aides de cuisine et personnel de soutien', 'Title (EN)': 'Food counter attendants, kitchen helpers and related support occupations', 'Diagnosis': 'Déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65202', 'Title (FR)': 'Coupeurs de viande et poissonniers – commerce de gros et de détail', 'Title (EN)': 'Meat cutters and fishmongers – retail and wholesale', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65210', 'Title (FR)': 'Personnel de soutien en hébergement, voyages et services de montage', 'Title (EN)': 'Accommodation, travel and set-up service support workers', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65211', 'Title (FR)': 'Opérateurs et préposés aux sports, aux loisirs et aux parcs d’attractions', 'Title (EN)': 'Sports, recreation and amusement park attendants and operators', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65220', 'Title (FR)': 'Soigneurs d’animaux et travailleurs en soins des animaux', 'Title (EN)': 'Animal caretakers and animal care workers', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65229', 'Title (FR)': 'Autres professions de soutien dans les services personnels', 'Title (EN)': 'Other personal service support occupations', 'Diagnosis': 'Non publié', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65310', 'Title (FR)': 'Préposés à l’entretien ménager et au nettoyage – travaux légers', 'Title (EN)': 'Light-duty cleaners', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65311', 'Title (FR)': 'Nettoyeurs spécialisés', 'Title (EN)': 'Specialized cleaners', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65312', 'Title (FR)': 'Concierges et nettoyeurs – gros travaux', 'Title (EN)': 'Janitors, caretakers and heavy-duty cleaners', 'Diagnosis': 'Équilibre', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65320', 'Title (FR)': 'Personnel de blanchisseries et de nettoyage à sec', 'Title (EN)': 'Laundry and dry-cleaning workers', 'Diagnosis': 'Léger déficit', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '65329', 'Title (FR)': 'Autre personnel de soutien en service', 'Title (EN)': 'Other service support occupations', 'Diagnosis': 'Non publié', 'Category': 'Sales and service occupations', 'Sub category': 'Sales and service support occupations'},
-    {'NOC': '70010', 'Title (FR)': 'Directeurs de la construction', 'Title (EN)': 'Construction managers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Middle management occupations in trades and transportation'},
-    {'NOC': '70011', 'Title (FR)': 'Gestionnaires en construction et rénovation domiciliaire', 'Title (EN)': 'Construction and home renovation managers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Middle management occupations in trades and transportation'},
-    {'NOC': '70012', 'Title (FR)': 'Directeurs de l’exploitation et de l’entretien d’immeubles', 'Title (EN)': 'Facilities operation and maintenance managers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Middle management occupations in trades and transportation'},
-    {'NOC': '70020', 'Title (FR)': 'Directeurs des transports', 'Title (EN)': 'Transportation managers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Middle management occupations in trades and transportation'},
-    {'NOC': '70021', 'Title (FR)': 'Directeurs des services postaux et de messageries', 'Title (EN)': 'Postal and courier service managers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Middle management occupations in trades and transportation'},
-    {'NOC': '72010', 'Title (FR)': 'Entrepreneurs et contremaîtres – métiers du métal', 'Title (EN)': 'Contractors and supervisors – metal forming, shaping and assembling trades', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72011', 'Title (FR)': 'Entrepreneurs et contremaîtres en électricité et télécommunications', 'Title (EN)': 'Electrical and telecommunications contractors and supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72012', 'Title (FR)': 'Entrepreneurs et contremaîtres en tuyauterie', 'Title (EN)': 'Plumbing contractors and supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72013', 'Title (FR)': 'Entrepreneurs et contremaîtres en charpenterie', 'Title (EN)': 'Carpentry contractors and supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72014', 'Title (FR)': 'Entrepreneurs et contremaîtres – autres métiers de la construction', 'Title (EN)': 'Contractors and supervisors – other construction and repair trades', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72020', 'Title (FR)': 'Entrepreneurs et contremaîtres en mécanique', 'Title (EN)': 'Mechanical contractors and supervisors', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72021', 'Title (FR)': 'Entrepreneurs et contremaîtres des équipes d’opérateurs d’équipement lourd', 'Title (EN)': 'Heavy equipment operator contractors and supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72022', 'Title (FR)': 'Surveillants de l’imprimerie', 'Title (EN)': 'Printing supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72023', 'Title (FR)': 'Surveillants des opérations du transport ferroviaire', 'Title (EN)': 'Railway operations supervisors', 'Diagnosis': 'Non publié', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72024', 'Title (FR)': 'Surveillants du transport routier et du transport en commun', 'Title (EN)': 'Road transportation and public transit supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72025', 'Title (FR)': 'Superviseurs de services postaux et de messageries', 'Title (EN)': 'Postal and courier services supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72100', 'Title (FR)': 'Machinistes et vérificateurs d’usinage et d’outillage', 'Title (EN)': 'Machinists and tooling inspectors', 'Diagnosis': 'Déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72101', 'Title (FR)': 'Outilleurs-ajusteurs', 'Title (EN)': 'Tool and die makers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72102', 'Title (FR)': 'Tôliers', 'Title (EN)': 'Sheet metal workers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72103', 'Title (FR)': 'Chaudronniers', 'Title (EN)': 'Boilermakers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72104', 'Title (FR)': 'Assembleurs et ajusteurs de plaques et de charpentes métalliques', 'Title (EN)': 'Structural metal and platework fabricators and fitters', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72105', 'Title (FR)': 'Monteurs de charpentes métalliques', 'Title (EN)': 'Ironworkers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72106', 'Title (FR)': 'Soudeurs et opérateurs de machines à souder et à braser', 'Title (EN)': 'Welders and brazing machine operators', 'Diagnosis': 'Déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72200', 'Title (FR)': 'Électriciens (sauf industriels et réseaux électriques)', 'Title (EN)': 'Electricians (except industrial and power system)', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72201', 'Title (FR)': 'Électriciens industriels', 'Title (EN)': 'Industrial electricians', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72202', 'Title (FR)': 'Électriciens de réseaux électriques', 'Title (EN)': 'Power system electricians', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72203', 'Title (FR)': 'Monteurs de lignes électriques et de câbles', 'Title (EN)': 'Power line and cable installers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72204', 'Title (FR)': 'Installateurs et réparateurs de lignes et câbles de télécommunications', 'Title (EN)': 'Telecommunications line and cable installers and repairers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72205', 'Title (FR)': 'Techniciens en installation de matériel de télécommunication et services de câblodistribution', 'Title (EN)': 'Telecommunications equipment installation and cable TV technicians', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72300', 'Title (FR)': 'Plombiers', 'Title (EN)': 'Plumbers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72301', 'Title (FR)': 'Tuyauteurs, monteurs d’appareils de chauffage et poseurs de gicleurs', 'Title (EN)': 'Steamfitters, pipefitters, sprinkler system installers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72302', 'Title (FR)': 'Monteurs d’installations au gaz', 'Title (EN)': 'Gas fitters', 'Diagnosis': 'Non publié', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72310', 'Title (FR)': 'Charpentiers-menuisiers', 'Title (EN)': 'Carpenters', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72311', 'Title (FR)': 'Ébénistes', 'Title (EN)': 'Cabinetmakers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72320', 'Title (FR)': 'Briqueteurs-maçons', 'Title (EN)': 'Bricklayers and stonemasons', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72321', 'Title (FR)': 'Calorifugeurs', 'Title (EN)': 'Insulators', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72400', 'Title (FR)': 'Mécaniciens de chantier et mécaniciens industriels', 'Title (EN)': 'Industrial and construction millwrights', 'Diagnosis': 'Déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72401', 'Title (FR)': 'Mécaniciens d’équipement lourd', 'Title (EN)': 'Heavy-duty equipment mechanics', 'Diagnosis': 'Déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72402', 'Title (FR)': 'Mécaniciens en chauffage, réfrigération et climatisation', 'Title (EN)': 'Heating, refrigeration and air conditioning mechanics', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72403', 'Title (FR)': 'Réparateurs de wagons', 'Title (EN)': 'Railway car repairers', 'Diagnosis': 'Non publié', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72404', 'Title (FR)': 'Mécaniciens et contrôleurs d’aéronefs', 'Title (EN)': 'Aircraft mechanics and inspectors', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72405', 'Title (FR)': 'Ajusteurs de machines', 'Title (EN)': 'Machine fitters', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72406', 'Title (FR)': 'Constructeurs et mécaniciens d’ascenseurs', 'Title (EN)': 'Elevator constructors and mechanics', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72410', 'Title (FR)': 'Mécaniciens et réparateurs de véhicules automobiles, de camions et d’autobus', 'Title (EN)': 'Automotive, truck and bus mechanics', 'Diagnosis': 'Déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72411', 'Title (FR)': 'Techniciens en collision, carrosserie, peinture et vitrage automobile et estimateurs de dommages', 'Title (EN)': 'Automotive body repairers, painters, glass installers and damage estimators', 'Diagnosis': 'Déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72420', 'Title (FR)': 'Installateurs de brûleurs à l’huile et à combustibles solides', 'Title (EN)': 'Oil and solid fuel heating mechanics', 'Diagnosis': 'Non publié', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72421', 'Title (FR)': 'Réparateurs et préposés à l’entretien d’appareils', 'Title (EN)': 'Appliance servicers and repairers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72422', 'Title (FR)': 'Électromécaniciens', 'Title (EN)': 'Electromechanics', 'Diagnosis': 'Déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72423', 'Title (FR)': 'Mécaniciens de motocyclettes et de véhicules tout-terrain', 'Title (EN)': 'Motorcycle and all-terrain vehicle mechanics', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72429', 'Title (FR)': 'Autres réparateurs de petits moteurs et de petits équipements', 'Title (EN)': 'Other small engine and small equipment repairers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72500', 'Title (FR)': 'Grutiers', 'Title (EN)': 'Crane operators', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72501', 'Title (FR)': 'Foreurs de puits d’eau', 'Title (EN)': 'Water well drillers', 'Diagnosis': 'Non publié', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72600', 'Title (FR)': 'Pilotes, navigateurs et instructeurs de pilotage – transport aérien', 'Title (EN)': 'Airline pilots, flight engineers and flight instructors', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72601', 'Title (FR)': 'Contrôleurs aériens et personnel assimilé', 'Title (EN)': 'Air traffic controllers and related personnel', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72602', 'Title (FR)': 'Officiers de pont – transport par voies navigables', 'Title (EN)': 'Deck officers – water transport', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72603', 'Title (FR)': 'Officiers mécaniciens – transport par voies navigables', 'Title (EN)': 'Marine engineers and officers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72604', 'Title (FR)': 'Contrôleurs de la circulation ferroviaire et régulateurs de la circulation maritime', 'Title (EN)': 'Railway traffic controllers and marine traffic regulators', 'Diagnosis': 'Non publié', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '72999', 'Title (FR)': 'Autres métiers techniques et personnel assimilé', 'Title (EN)': 'Other technical trades and related occupations', 'Diagnosis': 'Non publié', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Technical trades and transportation officers and controllers'},
-    {'NOC': '73100', 'Title (FR)': 'Finisseurs de béton', 'Title (EN)': 'Concrete finishers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73101', 'Title (FR)': 'Carreleurs', 'Title (EN)': 'Tilesetters', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73102', 'Title (FR)': 'Plâtriers, poseurs et finisseurs de systèmes intérieurs et latteurs', 'Title (EN)': 'Plasterers, drywall installers and finishers, and lathers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73110', 'Title (FR)': 'Couvreurs et poseurs de bardeaux', 'Title (EN)': 'Roofers and shinglers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73111', 'Title (FR)': 'Vitriers', 'Title (EN)': 'Glaziers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73112', 'Title (FR)': 'Peintres et décorateurs (sauf décorateurs d’intérieur)', 'Title (EN)': 'Painters and decorators (except interior decorators)', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73113', 'Title (FR)': 'Poseurs de revêtements d’intérieur', 'Title (EN)': 'Floor covering installers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73200', 'Title (FR)': 'Personnel d’installation, d’entretien et de réparation d’équipement résidentiel et commercial', 'Title (EN)': 'Residential and commercial equipment installers and servicers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73201', 'Title (FR)': 'Préposés à l’entretien général et surintendants', 'Title (EN)': 'General maintenance workers and building superintendents', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73202', 'Title (FR)': 'Fumigateurs et préposés au contrôle de la vermine', 'Title (EN)': 'Pest control workers and fumigators', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73209', 'Title (FR)': 'Autres réparateurs et préposés à l’entretien', 'Title (EN)': 'Other maintenance repairers and maintenance workers', 'Diagnosis': 'Non publié', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73300', 'Title (FR)': 'Conducteurs de camions de transport', 'Title (EN)': 'Transport truck drivers', 'Diagnosis': 'Déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73301', 'Title (FR)': 'Conducteurs d’autobus et opérateurs de métro et autres transports en commun', 'Title (EN)': 'Bus drivers and subway and other transit operators', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73310', 'Title (FR)': 'Mécaniciens de locomotive et de cour de triage', 'Title (EN)': 'Locomotive engineers and yard service operators', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73311', 'Title (FR)': 'Chefs de train et serre-freins', 'Title (EN)': 'Railway conductors and brakemen/women', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73400', 'Title (FR)': 'Conducteurs d’équipement lourd', 'Title (EN)': 'Heavy equipment operators', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73401', 'Title (FR)': 'Opérateurs de presses à imprimer', 'Title (EN)': 'Printing press operators', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '73402', 'Title (FR)': 'Foreurs et dynamiteurs – mines à ciel ouvert, carrières et chantiers', 'Title (EN)': 'Drillers and blasters – surface mining, quarrying and construction', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'General trades'},
-    {'NOC': '74100', 'Title (FR)': 'Trieurs de courrier et de colis', 'Title (EN)': 'Mail and parcel sorters and related occupations', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Mail and message distribution, other transport equipment operators and related maintenance workers'},
-    {'NOC': '74101', 'Title (FR)': 'Facteurs', 'Title (EN)': 'Letter carriers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Mail and message distribution, other transport equipment operators and related maintenance workers'},
-    {'NOC': '74102', 'Title (FR)': 'Messagers', 'Title (EN)': 'Couriers and messengers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Mail and message distribution, other transport equipment operators and related maintenance workers'},
-    {'NOC': '74200', 'Title (FR)': 'Ouvriers de gares de triage et d’entretien des voies ferrées', 'Title (EN)': 'Railway yard workers and track maintenance workers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Mail and message distribution, other transport equipment operators and related maintenance workers'},
-    {'NOC': '74201', 'Title (FR)': 'Matelots de pont et de salle des machines', 'Title (EN)': 'Deckhands and engine room hands – water transport', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Mail and message distribution, other transport equipment operators and related maintenance workers'},
-    {'NOC': '74202', 'Title (FR)': 'Agents de piste – transport aérien', 'Title (EN)': 'Air transport ramp attendants', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Mail and message distribution, other transport equipment operators and related maintenance workers'},
-    {'NOC': '74203', 'Title (FR)': 'Préposés à la pose et à l’entretien des pièces mécaniques – autos, camions et équipement lourd', 'Title (EN)': 'Automotive, truck and heavy equipment mechanical assemblers and service workers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Mail and message distribution, other transport equipment operators and related maintenance workers'},
-    {'NOC': '74204', 'Title (FR)': 'Personnel d’entretien des services publics', 'Title (EN)': 'Utilities maintenance workers', 'Diagnosis': 'Non publié', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Mail and message distribution, other transport equipment operators and related maintenance workers'},
-    {'NOC': '74205', 'Title (FR)': 'Conducteurs de machinerie d’entretien public', 'Title (EN)': 'Public works maintenance equipment operators', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Mail and message distribution, other transport equipment operators and related maintenance workers'},
-    {'NOC': '75100', 'Title (FR)': 'Débardeurs', 'Title (EN)': 'Longshore workers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Helpers and labourers and other transport drivers, operators and labourers'},
-    {'NOC': '75101', 'Title (FR)': 'Manutentionnaires', 'Title (EN)': 'Material handlers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Helpers and labourers and other transport drivers, operators and labourers'},
-    {'NOC': '75110', 'Title (FR)': 'Aides de soutien des métiers et manœuvres en construction', 'Title (EN)': 'Construction trades helpers and labourers', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Helpers and labourers and other transport drivers, operators and labourers'},
-    {'NOC': '75119', 'Title (FR)': 'Autres manœuvres et aides de soutien de métiers', 'Title (EN)': 'Other trades helpers and labourers', 'Diagnosis': 'Non publié', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Helpers and labourers and other transport drivers, operators and labourers'},
-    {'NOC': '75200', 'Title (FR)': 'Chauffeurs de taxi, de limousine et chauffeurs', 'Title (EN)': 'Taxi drivers, limousine drivers and chauffeurs', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Helpers and labourers and other transport drivers, operators and labourers'},
-    {'NOC': '75201', 'Title (FR)': 'Chauffeurs-livreurs et distributeurs porte-à-porte', 'Title (EN)': 'Delivery drivers and door-to-door distributors', 'Diagnosis': 'Léger déficit', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Helpers and labourers and other transport drivers, operators and labourers'},
-    {'NOC': '75210', 'Title (FR)': 'Opérateurs de bateaux à moteur et de bacs à câble', 'Title (EN)': 'Motor boat and cable ferry operators', 'Diagnosis': 'Non publié', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Helpers and labourers and other transport drivers, operators and labourers'},
-    {'NOC': '75211', 'Title (FR)': 'Manœuvres dans le transport ferroviaire et routier', 'Title (EN)': 'Railway and road transport labourers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Helpers and labourers and other transport drivers, operators and labourers'},
-    {'NOC': '75212', 'Title (FR)': 'Manœuvres à l’entretien des travaux publics', 'Title (EN)': 'Public works maintenance labourers', 'Diagnosis': 'Équilibre', 'Category': 'Trades, transport and equipment operators and related occupations', 'Sub category': 'Helpers and labourers and other transport drivers, operators and labourers'},
-    {'NOC': '80010', 'Title (FR)': 'Directeurs de l’exploitation des ressources naturelles et de la pêche', 'Title (EN)': 'Natural resources and fishing managers', 'Diagnosis': 'Équilibre', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Middle management occupations in production and agriculture'},
-    {'NOC': '80020', 'Title (FR)': 'Gestionnaires en agriculture', 'Title (EN)': 'Agricultural managers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Middle management occupations in production and agriculture'},
-    {'NOC': '80021', 'Title (FR)': 'Gestionnaires en horticulture', 'Title (EN)': 'Horticultural managers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Middle management occupations in production and agriculture'},
-    {'NOC': '80022', 'Title (FR)': 'Gestionnaires en aquaculture', 'Title (EN)': 'Aquaculture managers', 'Diagnosis': 'Non publié', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Middle management occupations in production and agriculture'},
-    {'NOC': '82010', 'Title (FR)': 'Surveillants de l’exploitation forestière', 'Title (EN)': 'Forestry supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Supervisors in natural resources, agriculture and related production'},
-    {'NOC': '82020', 'Title (FR)': 'Surveillants de l’exploitation des mines et carrières', 'Title (EN)': 'Mining and quarrying supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Supervisors in natural resources, agriculture and related production'},
-    {'NOC': '82021', 'Title (FR)': 'Entrepreneurs et surveillants – forage et services liés au pétrole et au gaz', 'Title (EN)': 'Oil and gas drilling and related services contractors and supervisors', 'Diagnosis': 'Non publié', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Supervisors in natural resources, agriculture and related production'},
-    {'NOC': '82030', 'Title (FR)': 'Entrepreneurs de services agricoles et surveillants d’exploitations agricoles', 'Title (EN)': 'Agricultural service contractors and farm supervisors', 'Diagnosis': 'Léger déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Supervisors in natural resources, agriculture and related production'},
-    {'NOC': '82031', 'Title (FR)': 'Entrepreneurs et superviseurs – aménagement paysager, entretien des terrains et horticulture', 'Title (EN)': 'Landscaping, grounds maintenance and horticulture contractors and supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Supervisors in natural resources, agriculture and related production'},
-    {'NOC': '83100', 'Title (FR)': 'Mineurs d’extraction et de préparation – mines souterraines', 'Title (EN)': 'Underground mining production and development miners', 'Diagnosis': 'Équilibre', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Occupations in natural resources and related production'},
-    {'NOC': '83101', 'Title (FR)': 'Foreurs et personnel d’essai et services liés à l’extraction de pétrole et de gaz', 'Title (EN)': 'Oil and gas drilling workers and testing service workers', 'Diagnosis': 'Non publié', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Occupations in natural resources and related production'},
-    {'NOC': '83110', 'Title (FR)': 'Conducteurs de machines d’abattage d’arbres', 'Title (EN)': 'Logging machinery operators', 'Diagnosis': 'Léger déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Occupations in natural resources and related production'},
-    {'NOC': '83120', 'Title (FR)': 'Capitaines et officiers de bâtiments de pêche', 'Title (EN)': 'Fishing vessel masters and officers', 'Diagnosis': 'Non publié', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Occupations in natural resources and related production'},
-    {'NOC': '83121', 'Title (FR)': 'Pêcheurs indépendants', 'Title (EN)': 'Independent fishermen and women', 'Diagnosis': 'Équilibre', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Occupations in natural resources and related production'},
-    {'NOC': '84100', 'Title (FR)': 'Travailleurs d’entretien et de soutien – mines souterraines', 'Title (EN)': 'Underground mine service and support workers', 'Diagnosis': 'Équilibre', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Workers in natural resources, agriculture and related production'},
-    {'NOC': '84101', 'Title (FR)': 'Travailleurs du forage et de l’entretien des puits de pétrole et de gaz', 'Title (EN)': 'Oil and gas well drilling and servicing workers', 'Diagnosis': 'Non publié', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Workers in natural resources, agriculture and related production'},
-    {'NOC': '84110', 'Title (FR)': 'Opérateurs de scies à chaîne et d’engins de débardage', 'Title (EN)': 'Chainsaw operators and skidder operators', 'Diagnosis': 'Léger déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Workers in natural resources, agriculture and related production'},
-    {'NOC': '84111', 'Title (FR)': 'Ouvriers en sylviculture et exploitation forestière', 'Title (EN)': 'Silviculture and forestry workers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Workers in natural resources, agriculture and related production'},
-    {'NOC': '84120', 'Title (FR)': 'Ouvriers spécialisés en élevage et opérateurs de machineries agricoles', 'Title (EN)': 'Livestock labourers and farm machinery operators', 'Diagnosis': 'Déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Workers in natural resources, agriculture and related production'},
-    {'NOC': '84121', 'Title (FR)': 'Matelots de pont sur bateaux de pêche', 'Title (EN)': 'Fishing vessel deckhands', 'Diagnosis': 'Équilibre', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Workers in natural resources, agriculture and related production'},
-    {'NOC': '85100', 'Title (FR)': 'Manœuvres aux soins du bétail', 'Title (EN)': 'Livestock labourers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Harvesting, landscaping and natural resources labourers'},
-    {'NOC': '85101', 'Title (FR)': 'Manœuvres à la récolte', 'Title (EN)': 'Harvesting labourers', 'Diagnosis': 'Déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Harvesting, landscaping and natural resources labourers'},
-    {'NOC': '85102', 'Title (FR)': 'Manœuvres de l’aquaculture et de la mariculture', 'Title (EN)': 'Aquaculture and mariculture labourers', 'Diagnosis': 'Non publié', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Harvesting, landscaping and natural resources labourers'},
-    {'NOC': '85103', 'Title (FR)': 'Manœuvres de pépinières et de serres', 'Title (EN)': 'Nursery and greenhouse labourers', 'Diagnosis': 'Déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Harvesting, landscaping and natural resources labourers'},
-    {'NOC': '85104', 'Title (FR)': 'Trappeurs et chasseurs', 'Title (EN)': 'Trappers and hunters', 'Diagnosis': 'Non publié', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Harvesting, landscaping and natural resources labourers'},
-    {'NOC': '85110', 'Title (FR)': 'Manœuvres des mines', 'Title (EN)': 'Mining labourers', 'Diagnosis': 'Non publié', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Harvesting, landscaping and natural resources labourers'},
-    {'NOC': '85111', 'Title (FR)': 'Manœuvres de forage et d’entretien des puits de pétrole et de gaz, et personnel assimilé', 'Title (EN)': 'Oil and gas drilling and well servicing labourers', 'Diagnosis': 'Non publié', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Harvesting, landscaping and natural resources labourers'},
-    {'NOC': '85120', 'Title (FR)': 'Manœuvres de l’exploitation forestière', 'Title (EN)': 'Forestry labourers', 'Diagnosis': 'Léger déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Harvesting, landscaping and natural resources labourers'},
-    {'NOC': '85121', 'Title (FR)': 'Manœuvres en aménagement paysager et en entretien des terrains', 'Title (EN)': 'Landscaping and grounds maintenance labourers', 'Diagnosis': 'Déficit', 'Category': 'Natural resources, agriculture and related production occupations', 'Sub category': 'Harvesting, landscaping and natural resources labourers'},
-    {'NOC': '90010', 'Title (FR)': 'Directeurs de la fabrication', 'Title (EN)': 'Manufacturing managers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Middle management occupations in manufacturing and utilities'},
-    {'NOC': '90011', 'Title (FR)': 'Directeurs des services d’utilité publique', 'Title (EN)': 'Utilities managers', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Middle management occupations in manufacturing and utilities'},
-    {'NOC': '92010', 'Title (FR)': 'Surveillants – transformation des métaux et des minerais', 'Title (EN)': 'Metal and mineral processing supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92011', 'Title (FR)': 'Surveillants – raffinage du pétrole, traitement du gaz et produits chimiques, services publics', 'Title (EN)': 'Petroleum refining, gas and chemical processing and utilities supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92012', 'Title (FR)': 'Surveillants – transformation des aliments et des boissons', 'Title (EN)': 'Food and beverage processing supervisors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92013', 'Title (FR)': 'Surveillants – fabrication de produits en caoutchouc et plastique', 'Title (EN)': 'Rubber and plastics product manufacturing supervisors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92014', 'Title (FR)': 'Surveillants – transformation des produits forestiers', 'Title (EN)': 'Forest products processing supervisors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92015', 'Title (FR)': 'Surveillants – textiles, tissus, fourrure et cuir', 'Title (EN)': 'Textile, fabric, fur and leather processing supervisors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92020', 'Title (FR)': 'Surveillants – fabrication de véhicules automobiles', 'Title (EN)': 'Motor vehicle manufacturing supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92021', 'Title (FR)': 'Surveillants – fabrication de matériel électronique et appareils électriques', 'Title (EN)': 'Electronics and electrical equipment manufacturing supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92022', 'Title (FR)': 'Surveillants – fabrication de meubles et accessoires', 'Title (EN)': 'Furniture and fixture manufacturing supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92023', 'Title (FR)': 'Surveillants – autres produits métalliques et pièces mécaniques', 'Title (EN)': 'Other metal products and mechanical parts manufacturing supervisors', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92024', 'Title (FR)': 'Surveillants – fabrication et montage de produits divers', 'Title (EN)': 'Supervisors in miscellaneous manufacturing and assembly', 'Diagnosis': 'Non publié', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92100', 'Title (FR)': 'Mécaniciens de centrales et opérateurs de réseaux électriques', 'Title (EN)': 'Power station operators and electrical controllers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '92101', 'Title (FR)': 'Opérateurs d’installations de traitement de l’eau et des déchets', 'Title (EN)': 'Water and waste treatment plant operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Processing, manufacturing and utilities supervisors and utilities operators and controllers'},
-    {'NOC': '93100', 'Title (FR)': 'Opérateurs de postes centraux – traitement des métaux et minerais', 'Title (EN)': 'Central control and process operators – metal and mineral processing', 'Diagnosis': 'Non publié', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Central control and process operators and aircraft assembly assemblers and inspectors'},
-    {'NOC': '93101', 'Title (FR)': 'Opérateurs de salle de commande centrale – raffinage du pétrole, traitement du gaz et chimie', 'Title (EN)': 'Central control and process operators – petroleum, gas and chemical processing', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Central control and process operators and aircraft assembly assemblers and inspectors'},
-    {'NOC': '93102', 'Title (FR)': 'Opérateurs – pâtes et papiers (réduction en pâte, fabrication et couchage)', 'Title (EN)': 'Pulping, papermaking and coating plant operators', 'Diagnosis': 'Non publié', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Central control and process operators and aircraft assembly assemblers and inspectors'},
-    {'NOC': '93200', 'Title (FR)': 'Monteurs d’aéronefs et contrôleurs de montage d’aéronefs', 'Title (EN)': 'Aircraft assemblers and assembly inspectors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Central control and process operators and aircraft assembly assemblers and inspectors'},
-    {'NOC': '94100', 'Title (FR)': 'Opérateurs de machines – traitement des métaux et des minerais', 'Title (EN)': 'Metal and mineral processing machine operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94101', 'Title (FR)': 'Ouvriers de fonderies', 'Title (EN)': 'Foundry workers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94102', 'Title (FR)': 'Opérateurs de machines à former et finir le verre et coupeurs de verre', 'Title (EN)': 'Glass forming and finishing machine operators and glass cutters', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94103', 'Title (FR)': 'Opérateurs de machines – produits en béton, argile ou pierre', 'Title (EN)': 'Concrete, clay and stone forming and finishing machine operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94104', 'Title (FR)': 'Contrôleurs et essayeurs – transformation des métaux et minerais', 'Title (EN)': 'Testers and inspectors – metal and mineral processing', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94105', 'Title (FR)': 'Opérateurs de machines à forger et travailler les métaux', 'Title (EN)': 'Metal forging and metalworking machine operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94106', 'Title (FR)': 'Opérateurs de machines d’usinage', 'Title (EN)': 'Machining tool operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94107', 'Title (FR)': 'Opérateurs de machines – autres produits métalliques', 'Title (EN)': 'Operators of machines producing other metal products', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94110', 'Title (FR)': 'Opérateurs d’installations de traitement des produits chimiques', 'Title (EN)': 'Chemical plant machine operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94111', 'Title (FR)': 'Opérateurs de machines de traitement des matières plastiques', 'Title (EN)': 'Plastics processing machine operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94112', 'Title (FR)': 'Opérateurs de machines – transformation du caoutchouc', 'Title (EN)': 'Rubber processing machine operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94120', 'Title (FR)': 'Opérateurs de machines à scier – scieries', 'Title (EN)': 'Sawmill machine operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94121', 'Title (FR)': 'Opérateurs de machines – fabrication et finition du papier', 'Title (EN)': 'Pulp mill and paper finishing machine operators', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94122', 'Title (FR)': 'Opérateurs de machines à façonner le papier', 'Title (EN)': 'Paper converting machine operators', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94123', 'Title (FR)': 'Classeurs de bois d’œuvre et vérificateurs', 'Title (EN)': 'Lumber graders and inspectors', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94124', 'Title (FR)': 'Opérateurs de machines à travailler le bois', 'Title (EN)': 'Woodworking machine operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94129', 'Title (FR)': 'Autres opérateurs de machines – transformation du bois', 'Title (EN)': 'Other wood processing machine operators', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94130', 'Title (FR)': 'Opérateurs de machines et travailleurs – fibres et fils textiles, cuir et peaux', 'Title (EN)': 'Textile fibre, yarn, leather and hide processing machine operators and workers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94131', 'Title (FR)': 'Tisseurs, tricoteurs et autres opérateurs de machines textiles', 'Title (EN)': 'Weavers, knitters and other textile machine operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94132', 'Title (FR)': 'Opérateurs de machines à coudre industrielles', 'Title (EN)': 'Industrial sewing machine operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94133', 'Title (FR)': 'Contrôleurs et trieurs – fabrication de produits textiles, tissus, fourrure et cuir', 'Title (EN)': 'Textile, fabric, fur and leather manufacturing inspectors and graders', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94140', 'Title (FR)': 'Opérateurs de machines et de procédés industriels – transformation des aliments et boissons', 'Title (EN)': 'Food and beverage processing machine and process operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94141', 'Title (FR)': 'Bouchers industriels, dépeceurs et préparateurs de volaille', 'Title (EN)': 'Industrial butchers, meat cutters and poultry preparers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94142', 'Title (FR)': 'Ouvriers – transformation du poisson et fruits de mer', 'Title (EN)': 'Fish and seafood processing workers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94143', 'Title (FR)': 'Échantillonneurs et trieurs – transformation des aliments et boissons', 'Title (EN)': 'Food and beverage processing samplers and graders', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94150', 'Title (FR)': 'Opérateurs d’équipement d’impression sans plaque', 'Title (EN)': 'Plateless printing equipment operators', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94151', 'Title (FR)': 'Photograveurs, personnel de prépresse', 'Title (EN)': 'Photogravers and other prepress occupations', 'Diagnosis': 'Non publié', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94152', 'Title (FR)': 'Opérateurs de machines à relier et de finition', 'Title (EN)': 'Binding and finishing machine operators', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94153', 'Title (FR)': 'Développeurs de films et de photographies', 'Title (EN)': 'Film and photograph developers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94200', 'Title (FR)': 'Assembleurs, contrôleurs et vérificateurs – véhicules automobiles', 'Title (EN)': 'Motor vehicle assemblers and inspectors', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94201', 'Title (FR)': 'Assembleurs, monteurs et contrôleurs – matériel électronique', 'Title (EN)': 'Electronic equipment assemblers and inspectors', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94202', 'Title (FR)': 'Monteurs et contrôleurs – matériel, appareils et accessoires électriques', 'Title (EN)': 'Electrical equipment assemblers and inspectors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94203', 'Title (FR)': 'Monteurs et contrôleurs – transformateurs et moteurs électriques industriels', 'Title (EN)': 'Industrial electric motor and transformer assemblers and inspectors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94204', 'Title (FR)': 'Monteurs et contrôleurs de matériel mécanique', 'Title (EN)': 'Mechanical equipment assemblers and inspectors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94205', 'Title (FR)': 'Opérateurs de machines et contrôleurs – fabrication d’appareils électriques', 'Title (EN)': 'Electrical appliance machine operators and inspectors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94210', 'Title (FR)': 'Monteurs, finisseurs, restaurateurs et contrôleurs – meubles et accessoires', 'Title (EN)': 'Furniture assemblers, finishers, refinishers and inspectors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94211', 'Title (FR)': 'Monteurs et contrôleurs – autres produits en bois', 'Title (EN)': 'Wood product assemblers and inspectors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94212', 'Title (FR)': 'Assembleurs, finisseurs et contrôleurs – produits en plastique', 'Title (EN)': 'Plastics product assemblers, finishers and inspectors', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94213', 'Title (FR)': 'Peintres, enduiseurs et opérateurs de procédés – finissage du métal (industriel)', 'Title (EN)': 'Metal finishing, coating and process operators', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '94219', 'Title (FR)': 'Monteurs, finisseurs et contrôleurs – produits divers', 'Title (EN)': 'Assemblers, finishers and inspectors of other products', 'Diagnosis': 'Non publié', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Machine operators, assemblers and inspectors in processing, manufacturing and printing'},
-    {'NOC': '95100', 'Title (FR)': 'Manœuvres – traitement des métaux et minerais', 'Title (EN)': 'Labourers in metal and mineral processing', 'Diagnosis': 'Équilibre', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Labourers in processing, manufacturing and utilities'},
-    {'NOC': '95101', 'Title (FR)': 'Manœuvres en métallurgie', 'Title (EN)': 'Metallurgy labourers', 'Diagnosis': 'Déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Labourers in processing, manufacturing and utilities'},
-    {'NOC': '95102', 'Title (FR)': 'Manœuvres – traitement des produits chimiques et services publics', 'Title (EN)': 'Chemical processing and utilities labourers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Labourers in processing, manufacturing and utilities'},
-    {'NOC': '95103', 'Title (FR)': 'Manœuvres – pâtes et papiers et transformation du bois', 'Title (EN)': 'Pulp and paper processing and wood processing labourers', 'Diagnosis': 'Déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Labourers in processing, manufacturing and utilities'},
-    {'NOC': '95104', 'Title (FR)': 'Manœuvres – fabrication des produits en caoutchouc et plastique', 'Title (EN)': 'Rubber and plastic products manufacturing labourers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Labourers in processing, manufacturing and utilities'},
-    {'NOC': '95105', 'Title (FR)': 'Manœuvres – fabrication et coupe des produits textiles', 'Title (EN)': 'Textile manufacturing and cutting labourers', 'Diagnosis': 'Léger déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Labourers in processing, manufacturing and utilities'},
-    {'NOC': '95106', 'Title (FR)': 'Manœuvres – transformation des aliments et boissons', 'Title (EN)': 'Food and beverage processing labourers', 'Diagnosis': 'Déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Labourers in processing, manufacturing and utilities'},
-    {'NOC': '95107', 'Title (FR)': 'Manœuvres – transformation du poisson et fruits de mer', 'Title (EN)': 'Fish and seafood processing labourers', 'Diagnosis': 'Déficit', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Labourers in processing, manufacturing and utilities'},
-    {'NOC': '95109', 'Title (FR)': 'Autres manœuvres – transformation, fabrication et services publics', 'Title (EN)': 'Other processing, manufacturing and utilities labourers', 'Diagnosis': 'Non publié', 'Category': 'Occupations in manufacturing and utilities', 'Sub category': 'Labourers in processing, manufacturing and utilities'},
-]
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DATA_PATH = Path(__file__).with_name("job_data.npz")
+
+COLUMNS = ('NOC', 'Title (FR)', 'Title (EN)', 'Diagnosis', 'Category', 'Sub category')
+CATEGORICAL = ('Diagnosis', 'Category', 'Sub category')
+
+def clean_label(text):
+    """Trim a cell; a value repeated across tab-separated cells counts once."""
+    parts = [p.strip() for p in str(text).split('\t') if p.strip()]
+    if len(set(parts)) == 1:
+        return parts[0]
+    return ' '.join(parts)
+
+def _key(column):
+    """npz array name of a column ('Sub category' -> 'sub_category')."""
+    return column.lower().replace(' ', '_').replace('(', '').replace(')', '')
+
+def to_arrays(columns):
+    """{column: values} -> npz arrays (categoricals as <key>_codes + <key>_values)."""
+    arrays = {}
+    for col in COLUMNS:
+        values = [str(v) for v in columns[col]]
+        if col in CATEGORICAL:
+            distinct, codes = np.unique(np.array(values), return_inverse=True)
+            arrays[f"{_key(col)}_codes"] = codes.astype(np.int16)
+            arrays[f"{_key(col)}_values"] = distinct
+        else:
+            arrays[_key(col)] = np.array(values)
+    return arrays
+
+@lru_cache(maxsize=None)
+def load_columns(path=DATA_PATH):
+    """
+    {column: values} for every job, in file order. Text columns are object
+    arrays of str; Diagnosis / Category / Sub category are pd.Categorical.
+    """
+    with np.load(path) as npz:
+        columns = {}
+        for col in COLUMNS:
+            if col in CATEGORICAL:
+                columns[col] = pd.Categorical.from_codes(
+                    npz[f"{_key(col)}_codes"], npz[f"{_key(col)}_values"].astype(object))
+            else:
+                columns[col] = npz[_key(col)].astype(object)
+    return columns
+
+@lru_cache(maxsize=None)
+def _jobs():
+    columns = load_columns()
+    return [dict(zip(COLUMNS, row)) for row in zip(*(list(columns[c]) for c in COLUMNS))]
+
+def __getattr__(name):
+    # Compatibility: JOBS is still the list of row dicts, built on first access
+    if name == 'JOBS':
+        return _jobs()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,162 @@
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import logic.scoring as scoring
+from logic.cube import totals
+from logic.eligibility import STREAM_RULES, eligible_mask
+from logic.profile import INT_FIELDS, BOOL_FIELDS, KEYED_FIELDS
+from logic.simulation import clean_int
+
+# --- BULK SCORING ---
+# Offline scoring of large profile exports:
+#   python -m logic.bulk clients.csv scores.csv --workers 4 --chunk-size 50000
+# Input is streamed in chunks (CSV or JSONL), each chunk is coerced and
+# scored with the batch engine in a worker process, and results are written
+# in input order as they complete, so memory stays bounded by a few chunks.
+# With --totals-only the totals come from the memory-mapped score cube
+# (logic.cube), shared by every worker through the page cache.
+
+TRUE_STRINGS = {'1', 'true', 't', 'yes', 'y', 'oui', 'o', 'x'}
+
+def _coerce_int(col):
+    # Same rules as the simulator's safe_get: blanks/None/non-numeric text -> 0
+    if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+        return col.fillna(0).astype(np.int64)
+    return col.map(lambda v: 0 if v is None or (isinstance(v, float) and np.isnan(v)) else clean_int(v)).astype(np.int64)
+
+def _coerce_bool(col):
+    if pd.api.types.is_bool_dtype(col):
+        return col
+    if pd.api.types.is_numeric_dtype(col):
+        return col.fillna(0) != 0
+    return col.map(lambda v: v is True or (isinstance(v, str) and v.strip().lower() in TRUE_STRINGS))
+
+def coerce_frame(df):
+    """Profile frame with every field present and typed (missing columns take defaults)."""
+    out = pd.DataFrame(index=df.index)
+    for f in INT_FIELDS:
+        out[f] = _coerce_int(df[f]) if f in df else 0
+    for f in BOOL_FIELDS:
+        out[f] = _coerce_bool(df[f]).astype(bool) if f in df else False
+    for f, (_, _, _, default) in KEYED_FIELDS.items():
+        if f in df:
+            col = df[f].astype(object).where(df[f].notna(), default)
+            out[f] = col.map(lambda v: v.strip() if isinstance(v, str) else v)
+        else:
+            out[f] = default
+    return out
+
+def score_chunk(df, as_of=None, id_column=None, stream=None, totals_only=False):
+    """
+    Coerce and score one chunk -> frame of [id], 'total' and every audit column
+    (just [id], 'total' with `totals_only`, read from the score cube).
+    With `stream`, rows failing its eligibility rules are dropped before scoring
+    (optional 'noc' / 'feer' / 'regulated' input columns are used when present).
+    """
+    profiles = coerce_frame(df)
+    if stream:
+        keep = eligible_mask(profiles, stream, extra=df)
+        df, profiles = df[keep], profiles[keep]
+    if totals_only:
+        out = pd.DataFrame({'total': totals(profiles, as_of)}, index=df.index)
+    else:
+        audit = scoring.calculate_scores(profiles, as_of)
+        out = pd.DataFrame({k: np.asarray(v) for k, v in audit.items()}, index=df.index)
+        out = out[['total'] + [k for k in audit if k != 'total']]
+    if id_column:
+        out.insert(0, id_column, df[id_column].to_numpy())
+    return out
+
+def _score_task(args):
+    return score_chunk(*args)
+
+def _input_format(path, fmt):
+    if fmt:
+        return fmt
+    return 'jsonl' if Path(path).suffix.lower() in ('.jsonl', '.ndjson', '.json') else 'csv'
+
+def read_chunks(path, chunk_size, fmt=None):
+    """Yield DataFrame chunks of a CSV or JSONL file ('-' = stdin)."""
+    src = sys.stdin if path == '-' else path
+    if _input_format(path, fmt) == 'jsonl':
+        yield from pd.read_json(src, lines=True, chunksize=chunk_size, dtype=False)
+    else:
+        yield from pd.read_csv(src, chunksize=chunk_size)
+
+class ChunkWriter:
+    """Appends scored chunks to a CSV or JSONL file ('-' = stdout)."""
+
+    def __init__(self, path, fmt=None):
+        self.fmt = _input_format(path, fmt)
+        self.fh = sys.stdout if path == '-' else open(path, 'w', encoding='utf-8', newline='')
+        self.header = True
+
+    def write(self, df):
+        if self.fmt == 'jsonl':
+            df.to_json(self.fh, orient='records', lines=True)
+        else:
+            df.to_csv(self.fh, index=False, header=self.header)
+        self.header = False
+
+    def close(self):
+        if self.fh is not sys.stdout:
+            self.fh.close()
+
+def score_stream(chunks, workers=1, as_of=None, id_column=None, stream=None, totals_only=False):
+    """
+    Score an iterable of chunks, yielding results in input order.
+    With workers > 1, at most 2 * workers chunks are in flight at once.
+    """
+    tasks = ((df, as_of, id_column, stream, totals_only) for df in chunks)
+    if workers <= 1:
+        yield from map(_score_task, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = []
+        for task in tasks:
+            pending.append(pool.submit(_score_task, task))
+            if len(pending) >= 2 * workers:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV/JSONL export of profiles.")
+    parser.add_argument("input", help="CSV or JSONL file ('-' for stdin)")
+    parser.add_argument("output", help="CSV or JSONL file ('-' for stdout)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="input format (default: from extension)")
+    parser.add_argument("--output-format", choices=("csv", "jsonl"), help="output format (default: from extension)")
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default 1 = in process)")
+    parser.add_argument("--as-of", help="grid in force on this date (YYYY-MM-DD)")
+    parser.add_argument("--id-column", help="input column copied to the output")
+    parser.add_argument("--eligible-for", choices=tuple(STREAM_RULES),
+                        help="only score rows meeting this stream's requirements")
+    parser.add_argument("--totals-only", action="store_true",
+                        help="write only the total, read from the precomputed score cube")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    writer = ChunkWriter(args.output, args.output_format)
+    rows = 0
+    try:
+        chunks = read_chunks(args.input, args.chunk_size, args.format)
+        for out in score_stream(chunks, args.workers, args.as_of, args.id_column,
+                                args.eligible_for, args.totals_only):
+            writer.write(out)
+            rows += len(out)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - start
+    rate = rows / elapsed if elapsed > 0 else float('inf')
+    print(f"Scored {rows:,} profiles in {elapsed:.2f}s ({rate:,.0f} profiles/sec, "
+          f"{args.workers} worker{'s' if args.workers != 1 else ''})", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
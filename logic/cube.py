@@ -0,0 +1,228 @@
+import argparse
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+import logic.scoring as scoring
+from logic.grid import GRID_DIR, list_versions, load_grid, resolve_version
+from logic.profile import BOOL_FIELDS, FIELDS
+
+# --- PRECOMPUTED SCORE CUBE ---
+# Every input is discrete and bounded, and months/levels/ages only matter up
+# to their band (tier). Per category, the grid splits into a few small
+# partial tables indexed by tiers and codes:
+#   HC = hc_fr[spouse, l, s, r, w] + hc_profile[spouse, age, exp, edu]
+#   QN = qn_job[diag, prim_occ_exp, qc_exp, qc_dip, vjo, auth] + qn_out[res, work, study]
+#   AD = ad_fr[spouse, l, s, r, w] + ad_profile[spouse, family, sp_age, sp_qc_exp, sp_edu]
+# All tables (and the value -> tier maps) live in one int16 .npy per grid
+# version, opened with mmap_mode='r' so worker processes share the page cache.
+# totals() is the entry point: cube lookups for the rows the tables cover,
+# the batch engine for the rest (or for everything if no cube can be built).
+
+CUBE_DIR = Path(__file__).parent / "cube"
+DTYPE = np.int16
+
+# tier map name -> grid.tiers key
+TIER_MAPS = {
+    'fr': 'fr', 'age': 'age', 'exp': 'exp', 'prim_occ_exp': 'prim_occ_exp',
+    'qc_exp': 'qc_exp', 'out_res': 'out_res', 'out_work': 'out_work',
+    'out_study': 'out_study', 'sp_fr': 'sp_fr', 'sp_age': 'sp_age', 'sp_qc_exp': 'sp_qc_exp',
+}
+
+def _grid_sha(version):
+    return hashlib.sha256((GRID_DIR / f"{version}.json").read_bytes()).hexdigest()
+
+# Profile where every factor scores 0; each table cell sets only its own fields
+EMPTY_PROFILE = {
+    'age': -1, 'edu': None, 'gen_exp': 0, 'fr_l': 0, 'fr_s': 0, 'fr_r': 0, 'fr_w': 0,
+    'diag': None, 'prim_occ_exp': 0, 'qc_exp': 0, 'vjo': None, 'auth': False, 'qc_dip': None,
+    'out_res': 0, 'out_work': 0, 'out_study': 0,
+    'spouse': False, 'sp_age': -1, 'sp_edu': None, 'sp_qc_exp': 0,
+    'sp_fr_l': 0, 'sp_fr_s': 0, 'sp_fr_r': 0, 'sp_fr_w': 0, 'family': False,
+}
+
+def _table_specs(g):
+    """table -> (audit keys summed, [(profile field, value per table index)])"""
+    def rep(name):
+        # One value per tier: the first value that falls in it
+        return [int(v) for v in np.unique(np.asarray(g.tiers[TIER_MAPS[name]]), return_index=True)[1]]
+
+    def ages(name, top):
+        # The last tier of an age map is the "outside the table" slot (-1 scores 0)
+        return [a if a < top else -1 for a in rep(name)]
+
+    spouse, fr, sp_fr = [False, True], rep('fr'), rep('sp_fr')
+    keyed = lambda codes: [*codes, None]
+    return {
+        'hc_fr': (('hc_french',), [('spouse', spouse), ('fr_l', fr), ('fr_s', fr), ('fr_r', fr), ('fr_w', fr)]),
+        'hc_profile': (('hc_age', 'hc_exp', 'hc_edu'), [
+            ('spouse', spouse), ('age', ages('age', len(g.age[0]))), ('gen_exp', rep('exp')),
+            ('edu', keyed(scoring.EDU_CODES))]),
+        'qn_job': (('qn_diag', 'qn_qc_exp', 'qn_dip', 'qn_vjo', 'qn_auth'), [
+            ('diag', keyed(scoring.DIAG_CODES)), ('prim_occ_exp', rep('prim_occ_exp')),
+            ('qc_exp', rep('qc_exp')), ('qc_dip', keyed(scoring.QC_DIP_CODES)),
+            ('vjo', keyed(scoring.VJO_CODES)), ('auth', [False, True])]),
+        'qn_out': (('qn_out',), [('out_res', rep('out_res')), ('out_work', rep('out_work')),
+                                 ('out_study', rep('out_study'))]),
+        'ad_fr': (('ad_fr',), [('spouse', spouse), ('sp_fr_l', sp_fr), ('sp_fr_s', sp_fr),
+                               ('sp_fr_r', sp_fr), ('sp_fr_w', sp_fr)]),
+        'ad_profile': (('ad_fam', 'ad_age', 'ad_exp', 'ad_edu'), [
+            ('spouse', spouse), ('family', [False, True]), ('sp_age', ages('sp_age', len(g.sp_age))),
+            ('sp_qc_exp', rep('sp_qc_exp')), ('sp_edu', keyed(scoring.SP_EDU_CODES))]),
+    }
+
+def _partial_table(g, keys, axes):
+    fields = [f for f, _ in axes]
+    shape = tuple(len(values) for _, values in axes)
+    out = np.zeros(shape, dtype=np.int64)
+    for idx in np.ndindex(shape):
+        p = {**EMPTY_PROFILE, **{f: axes[d][1][i] for d, (f, i) in enumerate(zip(fields, idx))}}
+        audit = scoring.calculate_score(p, g.version, compact=True)[1]
+        out[idx] = sum(audit.get(k, 0) for k in keys)
+    return out
+
+def build_cube(version, out_dir=CUBE_DIR):
+    """Compute every partial table of one grid version and write <version>.npy + .json."""
+    g = load_grid(version)
+    tables = {f'tier_{name}': np.asarray(g.tiers[key]) for name, key in TIER_MAPS.items()}
+    for name, (keys, axes) in _table_specs(g).items():
+        tables[name] = _partial_table(g, keys, axes)
+
+    layout, offset = {}, 0
+    for name, arr in tables.items():
+        layout[name] = {'offset': offset, 'shape': list(arr.shape)}
+        offset += arr.size
+    flat = np.concatenate([arr.ravel() for arr in tables.values()]).astype(DTYPE)
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    npy_path, manifest_path = out_dir / f"{version}.npy", out_dir / f"{version}.json"
+    # Write-then-rename so a concurrent reader never maps a half-written file
+    tmp = out_dir / f".{version}.{os.getpid()}.npy"
+    np.save(tmp, flat)
+    os.replace(tmp, npy_path)
+    manifest = {
+        'version': version, 'grid_sha256': _grid_sha(version), 'dtype': np.dtype(DTYPE).name,
+        'caps': [g.cap_hc, g.cap_qn, g.cap_ad], 'tables': layout,
+    }
+    tmp = out_dir / f".{version}.{os.getpid()}.json"
+    tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(tmp, manifest_path)
+    return npy_path
+
+class ScoreCube:
+    """
+    Memory-mapped partial tables of one grid version. Scoring is a handful
+    of fancy-index lookups; the tables are views into the shared mapping.
+    """
+
+    def __init__(self, path, manifest):
+        self.version = manifest['version']
+        self.cap_hc, self.cap_qn, self.cap_ad = manifest['caps']
+        self.data = np.load(path, mmap_mode='r')
+        self.tables = {
+            name: self.data[t['offset']:t['offset'] + int(np.prod(t['shape']))].reshape(t['shape'])
+            for name, t in manifest['tables'].items()
+        }
+
+    def _tier(self, name, values):
+        tiers = self.tables[f'tier_{name}']
+        return tiers[np.clip(np.asarray(values), 0, len(tiers) - 1).astype(np.intp)]
+
+    def _age_tier(self, name, ages):
+        # Ages outside the grid table use the trailing zero slot
+        tiers = self.tables[f'tier_{name}']
+        ages = np.asarray(ages)
+        return tiers[np.where((ages >= 0) & (ages < len(tiers) - 1), ages, len(tiers) - 1).astype(np.intp)]
+
+    def covers(self, profiles):
+        """Rows the tables answer exactly (flags must be 0/1 to index them)."""
+        ok = True
+        for f in BOOL_FIELDS:
+            flags = np.asarray(profiles[f])
+            ok = ok & ((flags == 0) | (flags == 1))
+        return np.asarray(ok, dtype=bool)
+
+    def raw_totals(self, profiles):
+        """Uncapped (HC, QN, AD) arrays for a ProfileBatch / DataFrame / dict of arrays."""
+        T = self.tables
+        col = lambda k: np.asarray(profiles[k])
+        s = col('spouse').astype(np.intp)
+        code = lambda k, codes: scoring._code_batch(col(k), codes)
+
+        hc = (T['hc_fr'][s, self._tier('fr', col('fr_l')), self._tier('fr', col('fr_s')),
+                         self._tier('fr', col('fr_r')), self._tier('fr', col('fr_w'))]
+              + T['hc_profile'][s, self._age_tier('age', col('age')), self._tier('exp', col('gen_exp')),
+                                code('edu', scoring.EDU_CODES)])
+        qn = (T['qn_job'][code('diag', scoring.DIAG_CODES), self._tier('prim_occ_exp', col('prim_occ_exp')),
+                          self._tier('qc_exp', col('qc_exp')), code('qc_dip', scoring.QC_DIP_CODES),
+                          code('vjo', scoring.VJO_CODES), col('auth').astype(np.intp)]
+              + T['qn_out'][self._tier('out_res', col('out_res')), self._tier('out_work', col('out_work')),
+                            self._tier('out_study', col('out_study'))])
+        ad = (T['ad_fr'][s, self._tier('sp_fr', col('sp_fr_l')), self._tier('sp_fr', col('sp_fr_s')),
+                         self._tier('sp_fr', col('sp_fr_r')), self._tier('sp_fr', col('sp_fr_w'))]
+              + T['ad_profile'][s, col('family').astype(np.intp), self._age_tier('sp_age', col('sp_age')),
+                                self._tier('sp_qc_exp', col('sp_qc_exp')), code('sp_edu', scoring.SP_EDU_CODES)])
+        return hc.astype(np.int64), qn.astype(np.int64), ad.astype(np.int64)
+
+    def scores(self, profiles):
+        """Total score per row (same values as calculate_scores(...)['total'])."""
+        hc, qn, ad = self.raw_totals(profiles)
+        return np.minimum(hc, self.cap_hc) + np.minimum(qn, self.cap_qn) + np.minimum(ad, self.cap_ad)
+
+def _is_current(version, out_dir):
+    manifest_path = Path(out_dir) / f"{version}.json"
+    if not manifest_path.exists() or not (Path(out_dir) / f"{version}.npy").exists():
+        return None
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    return manifest if manifest.get('grid_sha256') == _grid_sha(version) else None
+
+@lru_cache(maxsize=None)
+def load_cube(version, out_dir=CUBE_DIR):
+    """Map one version's cube (building it first if missing or stale)."""
+    manifest = _is_current(version, out_dir)
+    if manifest is None:
+        build_cube(version, out_dir)
+        manifest = _is_current(version, out_dir)
+    return ScoreCube(Path(out_dir) / f"{version}.npy", manifest)
+
+def get_cube(as_of=None):
+    return load_cube(resolve_version(as_of))
+
+def _take(profiles, rows):
+    return {f: np.asarray(profiles[f])[rows] for f in FIELDS}
+
+def totals(profiles, as_of=None):
+    """
+    Total score per row, like calculate_scores(profiles, as_of)['total'].
+    Rows the cube covers are table lookups; any other row (or every row, if
+    the cube cannot be built or mapped) goes through the batch engine.
+    """
+    try:
+        cube = get_cube(as_of)
+    except OSError:
+        return np.asarray(scoring.calculate_scores(profiles, as_of)['total'], dtype=np.int64)
+    covered = cube.covers(profiles)
+    if covered.all():
+        return cube.scores(profiles)
+    total = np.zeros(len(covered), dtype=np.int64)
+    if covered.any():
+        total[covered] = cube.scores(_take(profiles, covered))
+    total[~covered] = scoring.calculate_scores(_take(profiles, ~covered), as_of)['total']
+    return total
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute the memory-mapped score cube.")
+    parser.add_argument("--version", action="append", help="grid version (default: every version)")
+    parser.add_argument("--out-dir", default=str(CUBE_DIR))
+    args = parser.parse_args(argv)
+    for version in args.version or list_versions():
+        path = build_cube(version, args.out_dir)
+        print(f"{version}: {path} ({path.stat().st_size / 1024:.1f} KiB)")
+
+if __name__ == "__main__":
+    main()
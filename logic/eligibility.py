@@ -0,0 +1,167 @@
+import numpy as np
+
+from logic.grid import EDU_KEYS, EDU_CODES
+import logic.scoring as scoring
+
+# --- STREAM ELIGIBILITY RULES ---
+# The hard requirements of each stream (see build_hard_rules in
+# tabs/simulator.py for the full wording) as named predicates over profile
+# columns, so whole client lists can be filtered before scoring.
+#
+# Profile fields cover French, experience, education, spouse and licence.
+# Occupation facts are optional extra columns: 'noc' (5-digit NOC 2021 code,
+# whose 2nd digit is the FEER) or 'feer' directly, and 'regulated' (bool).
+# Conditions whose columns are missing are reported as skipped, not failed;
+# rows whose value is unknown (FEER -1 from a malformed NOC) are reported as
+# unknown for that condition, and do not fail it either.
+
+# Translation keys of the stream names (as used in scoring.LATEST_DRAWS)
+STREAM_LABEL_KEYS = {
+    'stream1': 'stream1_label',
+    'stream2': 'stream2_label',
+    'stream3': 'stream3_label',
+}
+
+# Diplomas from a full-time program of >= 1 year leading to a profession
+# (DEP, AEC/DEC technical, university); general DEC, 600h DEP and high school do not
+STREAM1_EDU = ('PhD', 'MedSpec', 'Masters 2y', 'Masters 1y', 'Bach 5y', 'Bach 3y', 'Bach 2y',
+               'Bach 1y', 'Tech 3y', 'Tech 2y', 'Tech 900h', 'DEP 1y', 'DEP 900h')
+
+def _edu_in(keys):
+    allowed = np.zeros(len(EDU_KEYS) + 1, dtype=bool)
+    allowed[[EDU_CODES[k] for k in keys]] = True
+    return lambda c: allowed[c['edu']]
+
+def _feer_in(levels):
+    return lambda c: np.isin(c['feer'], levels)
+
+def _oral(level):
+    return lambda c: np.minimum(c['fr_l'], c['fr_s']) >= level
+
+def _spouse_oral_4(c):
+    return ~c['spouse'] | (np.minimum(c['sp_fr_l'], c['sp_fr_s']) >= 4)
+
+def _licence(c):
+    return ~c['regulated'] | c['auth']
+
+def _french_by_feer(c):
+    high = (np.minimum(c['fr_l'], c['fr_s']) >= 7) & (c['fr_w'] >= 5)
+    return np.where(c['feer'] <= 2, high, np.minimum(c['fr_l'], c['fr_s']) >= 5)
+
+# stream -> ((condition, predicate(columns) -> mask, columns it needs beyond the profile), ...)
+STREAM_RULES = {
+    'stream1': (
+        ('feer_0_2', _feer_in([0, 1, 2]), ('feer',)),
+        ('main_occ_12m', lambda c: c['prim_occ_exp'] >= 12, ()),
+        ('diploma_1y', _edu_in(STREAM1_EDU), ()),
+        ('oral_7', _oral(7), ()),
+        ('written_5', lambda c: c['fr_w'] >= 5, ()),
+        ('spouse_oral_4', _spouse_oral_4, ()),
+        ('licence', _licence, ('regulated',)),
+    ),
+    'stream2': (
+        ('feer_3_5', _feer_in([3, 4, 5]), ('feer',)),
+        ('main_occ_24m', lambda c: c['prim_occ_exp'] >= 24, ()),
+        ('quebec_12m', lambda c: c['qc_exp'] >= 12, ()),
+        ('schooling', _edu_in(EDU_KEYS), ()),
+        ('oral_5', _oral(5), ()),
+        ('spouse_oral_4', _spouse_oral_4, ()),
+        ('licence', _licence, ('regulated',)),
+    ),
+    'stream3': (
+        ('regulated', lambda c: c['regulated'], ('regulated',)),
+        ('authorization', lambda c: c['auth'], ()),
+        ('french_by_feer', _french_by_feer, ('feer',)),
+        ('spouse_oral_4', _spouse_oral_4, ()),
+    ),
+    # Historical PEQ-style threshold (comparison only)
+    'peq': (
+        ('quebec_24m', lambda c: c['qc_exp'] >= 24, ()),
+        ('oral_7', _oral(7), ()),
+    ),
+}
+
+def _feer_from_noc(noc):
+    # NOC 2021 codes are 5 digits (leading zeros may have been lost); -1 = unknown
+    code = str(noc).strip()
+    if not code.isdigit() or len(code) > 5:
+        return -1
+    return int(code.zfill(5)[1])
+
+# column -> rows whose value is unknown
+UNKNOWN_ROWS = {'feer': lambda v: v < 0}
+
+PROFILE_COLUMNS = ('fr_l', 'fr_s', 'fr_w', 'sp_fr_l', 'sp_fr_s', 'prim_occ_exp', 'qc_exp')
+
+def _columns(profiles, extra):
+    """Typed columns the predicates read (lazily: only those present)."""
+    src = {} if extra is None else extra
+    cols = {}
+    for k in PROFILE_COLUMNS:
+        if k in profiles:
+            cols[k] = np.asarray(profiles[k]).astype(np.int64)
+    for k in ('spouse', 'auth'):
+        if k in profiles:
+            cols[k] = np.asarray(profiles[k]).astype(bool)
+    if 'edu' in profiles:
+        cols['edu'] = scoring._code_batch(profiles['edu'], EDU_CODES)
+
+    def extra_col(k):
+        if k in src:
+            return np.asarray(src[k])
+        if k in profiles:
+            return np.asarray(profiles[k])
+        return None
+
+    feer = extra_col('feer')
+    noc = extra_col('noc')
+    if feer is not None:
+        cols['feer'] = feer.astype(np.int64)
+    elif noc is not None:
+        cols['feer'] = np.array([_feer_from_noc(n) for n in noc], dtype=np.int64)
+    regulated = extra_col('regulated')
+    if regulated is not None:
+        cols['regulated'] = regulated.astype(bool)
+    return cols
+
+def evaluate(profiles, streams=None, extra=None):
+    """
+    Evaluate stream rules over a batch (ProfileBatch, DataFrame or dict of
+    arrays; `extra` adds 'noc' / 'feer' / 'regulated' arrays).
+    Returns {stream: {'eligible': mask, 'failed': {condition: mask},
+    'unknown': {condition: mask of rows lacking its data},
+    'skipped': [conditions without data]}}. Skipped conditions and unknown
+    rows do not block eligibility.
+    """
+    cols = _columns(profiles, extra)
+    if not cols:
+        raise ValueError("No profile or occupation columns to evaluate the stream rules on")
+    shape = np.broadcast_shapes(*(c.shape for c in cols.values()))
+    results = {}
+    for stream in streams or STREAM_RULES:
+        eligible = np.ones(shape, dtype=bool)
+        failed, unknown, skipped = {}, {}, []
+        for name, predicate, needs in STREAM_RULES[stream]:
+            if any(k not in cols for k in needs):
+                skipped.append(name)
+                continue
+            missing = np.zeros(shape, dtype=bool)
+            for k in needs:
+                if k in UNKNOWN_ROWS:
+                    missing |= UNKNOWN_ROWS[k](cols[k])
+            ok = np.broadcast_to(np.asarray(predicate(cols), dtype=bool), shape) | missing
+            failed[name] = ~ok
+            if missing.any():
+                unknown[name] = missing
+            eligible &= ok
+        results[stream] = {'eligible': eligible, 'failed': failed, 'unknown': unknown,
+                           'skipped': skipped}
+    return results
+
+def eligible_mask(profiles, stream, extra=None):
+    """Boolean mask of rows meeting every (evaluable) requirement of `stream`."""
+    return evaluate(profiles, [stream], extra)[stream]['eligible']
+
+def failed_conditions(result, i):
+    """Names of the conditions row `i` fails, from one stream's evaluate() result."""
+    return [name for name, mask in result['failed'].items() if mask[i]]
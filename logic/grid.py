@@ -0,0 +1,250 @@
+import json
+import time
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+# --- VERSIONED GRID FILES ---
+# One JSON file per grid version in logic/grids/, named by effective date
+# (YYYY-MM-DD.json). Each version is parsed and compiled once per process.
+
+GRID_DIR = Path(__file__).parent / "grids"
+
+# Upper bound stored for the open-ended top band (null in the JSON files)
+OPEN_ENDED = 10**9
+
+# --- KEY VOCABULARIES (codes = position, shared by every grid version) ---
+
+EDU_KEYS = (
+    'PhD', 'MedSpec', 'Masters 2y', 'Masters 1y', 'Bach 5y', 'Bach 3y',
+    'Bach 2y', 'Bach 1y', 'Tech 3y', 'Tech 2y', 'Tech 900h',
+    'College Gen', 'DEP 1y', 'DEP 900h', 'DEP 600h', 'HS'
+)
+QC_DIP_KEYS = (
+    'PhD', 'MedSpec', 'Masters 2y', 'Masters 1y', 'Bach 5y', 'Bach 3y',
+    'Bach 2y', 'Bach 1y', 'Tech 3y', 'Tech 900h',
+    'College Gen', 'DEP 900h', 'DEP 600h', 'HS', 'None'
+)
+DIAG_KEYS = ('None', 'Slight', 'Deficit')
+VJO_KEYS = ('None', 'Inside Montreal', 'Outside Montreal')
+SP_EDU_KEYS = ('PhD', 'Masters', 'Bachelors', 'Tech Diploma', 'High School', 'None')
+
+EDU_CODES = {k: i for i, k in enumerate(EDU_KEYS)}
+QC_DIP_CODES = {k: i for i, k in enumerate(QC_DIP_KEYS)}
+DIAG_CODES = {k: i for i, k in enumerate(DIAG_KEYS)}
+VJO_CODES = {k: i for i, k in enumerate(VJO_KEYS)}
+SP_EDU_CODES = {k: i for i, k in enumerate(SP_EDU_KEYS)}
+
+# --- COMPILE STEP ---
+# Month bands become dense tables indexed by month (clamped at the open-ended
+# top band), age/level tables are indexed by value, and keyed tables by code
+# (last slot = unknown key -> 0).
+
+def compile_bands(bands):
+    top = bands[-1][0]
+    table = [0] * (top + 1)
+    for lo, hi, pts in bands:
+        table[lo:min(hi, top + 1)] = [pts] * (min(hi, top + 1) - lo)
+    return table
+
+def compile_ages(ages):
+    table = [0] * (max(ages) + 1)
+    for age, pts in ages.items():
+        table[age] = pts
+    return table
+
+def compile_levels(thresholds):
+    """Dense table over levels 0..top, where top is the highest threshold."""
+    table = [0] * (max(thresholds) + 1)
+    for lvl in sorted(thresholds):
+        table[lvl:] = [thresholds[lvl]] * (len(table) - lvl)
+    return table
+
+def compile_keys(points, keys):
+    return [points.get(k, 0) for k in keys] + [0]
+
+def compile_tiers(rows):
+    """
+    Tier index per value for one or more dense tables: the tier only moves
+    where at least one row changes points, so equivalent values share a tier.
+    """
+    tiers = [0]
+    for i in range(1, len(rows[0])):
+        changed = any(row[i] != row[i - 1] for row in rows)
+        tiers.append(tiers[-1] + 1 if changed else tiers[-1])
+    return tiers
+
+def _pad_rows(rows, fill_last=True):
+    # Month rows are clamped at their last value; age rows score 0 past the end
+    width = max(len(r) for r in rows)
+    return [r + [r[-1] if fill_last else 0] * (width - len(r)) for r in rows]
+
+class CompiledGrid:
+    """
+    Dense lookup tables for one scoring grid.
+    Tables are plain lists for the scalar engine (row 0 = single, row 1 = with
+    spouse where the grid differs); `arrays` holds the same tables as NumPy
+    arrays for the batch engine.
+    """
+    TABLES = (
+        'fr', 'age', 'exp', 'edu',
+        'diag', 'qc_exp', 'qc_dip', 'out_res', 'out_work', 'out_study', 'vjo',
+        'sp_fr', 'sp_age', 'sp_qc_exp', 'sp_edu',
+    )
+
+    def __init__(self, spec, version=None):
+        self.spec = spec
+        self.version = version
+
+        self.fr = _pad_rows([compile_levels({k: v[0] for k, v in spec['fr'].items()}),
+                             compile_levels({k: v[1] for k, v in spec['fr'].items()})])
+        self.age = _pad_rows([compile_ages(spec['age_single']), compile_ages(spec['age_spouse'])], fill_last=False)
+        self.exp = _pad_rows([compile_bands(spec['exp_single']), compile_bands(spec['exp_spouse'])])
+        self.edu = [compile_keys({k: v[0] for k, v in spec['edu'].items()}, EDU_KEYS),
+                    compile_keys({k: v[1] for k, v in spec['edu'].items()}, EDU_KEYS)]
+
+        # One row per DIAG_KEYS entry, plus an all-zero row for unknown diagnoses
+        diag = [compile_bands(spec['diag'][k]) for k in DIAG_KEYS]
+        self.diag = _pad_rows(diag + [[0]])
+        self.qc_exp = compile_bands(spec['qc_exp'])
+        self.qc_dip = compile_keys(spec['qc_dip'], QC_DIP_KEYS)
+        self.out_res = compile_bands(spec['out_res'])
+        self.out_work = compile_bands(spec['out_work'])
+        self.out_study = compile_bands(spec['out_study'])
+        self.vjo = compile_keys(spec['vjo'], VJO_KEYS)
+        self.auth = spec['auth']
+
+        self.family = spec['family']
+        self.sp_fr = compile_levels(spec['sp_fr'])
+        self.sp_age = compile_ages(spec['sp_age'])
+        self.sp_qc_exp = compile_bands(spec['sp_qc_exp'])
+        self.sp_edu = compile_keys(spec['sp_edu'], SP_EDU_KEYS)
+
+        self.cap_hc, self.cap_qn, self.cap_ad = spec['caps']
+
+        # Tier tables (value -> tier) used to build canonical memo keys. Ages
+        # get one extra zero slot standing for "outside the table".
+        self.tiers = {
+            'fr': compile_tiers(self.fr),
+            'age': compile_tiers([row + [0] for row in self.age]),
+            'exp': compile_tiers(self.exp),
+            'prim_occ_exp': compile_tiers(self.diag),
+            'qc_exp': compile_tiers([self.qc_exp]),
+            'out_res': compile_tiers([self.out_res]),
+            'out_work': compile_tiers([self.out_work]),
+            'out_study': compile_tiers([self.out_study]),
+            'sp_fr': compile_tiers([self.sp_fr]),
+            'sp_age': compile_tiers([self.sp_age + [0]]),
+            'sp_qc_exp': compile_tiers([self.sp_qc_exp]),
+        }
+        self.arrays = {name: np.array(getattr(self, name), dtype=np.int64) for name in self.TABLES}
+
+    def maxima(self, spouse):
+        """Maximum points per audit key (used for the dashboard '/ max' bars)."""
+        s = 1 if spouse else 0
+        fr_skill = max(self.fr[s])
+        return {
+            'fr_l_pts': fr_skill, 'fr_s_pts': fr_skill, 'fr_r_pts': fr_skill, 'fr_w_pts': fr_skill,
+            'hc_french': fr_skill * 4, 'hc_age': max(self.age[s]),
+            'hc_exp': max(self.exp[s]), 'hc_edu': max(self.edu[s]),
+            'total_hc': self.cap_hc,
+            'qn_diag': max(max(row) for row in self.diag), 'qn_qc_exp': max(self.qc_exp),
+            'qn_dip': max(self.qc_dip), 'out_res_pts': max(self.out_res),
+            'out_work_pts': max(self.out_work), 'out_study_pts': max(self.out_study),
+            'qn_out': max(self.out_res) + max(self.out_work) + max(self.out_study),
+            'qn_vjo': max(self.vjo), 'qn_auth': self.auth,
+            'total_qn': self.cap_qn,
+            'ad_fam': self.family, 'ad_fr': max(self.sp_fr) * 4, 'ad_age': max(self.sp_age),
+            'ad_exp': max(self.sp_qc_exp), 'ad_edu': max(self.sp_edu),
+            'total_ad': self.cap_ad,
+        }
+
+# --- LOADER ---
+
+def _bands(rows):
+    return [(lo, OPEN_ENDED if hi is None else hi, pts) for lo, hi, pts in rows]
+
+def _int_keys(d):
+    return {int(k): v for k, v in d.items()}
+
+def _check_keys(version, name, points, keys):
+    unknown = set(points) - set(keys)
+    if unknown:
+        raise ValueError(f"Grid {version}: unknown {name} keys {sorted(unknown)}")
+
+def parse_spec(raw, version=None):
+    """Turn one grid file (sectioned JSON) into the flat spec CompiledGrid expects."""
+    hc, qn, ad = raw['human_capital'], raw['quebec_needs'], raw['adaptation']
+    spec = {
+        'fr': {int(k): tuple(v) for k, v in hc['fr'].items()},
+        'age_single': _int_keys(hc['age_single']),
+        'age_spouse': _int_keys(hc['age_spouse']),
+        'exp_single': _bands(hc['exp_single']),
+        'exp_spouse': _bands(hc['exp_spouse']),
+        'edu': {k: tuple(v) for k, v in hc['edu'].items()},
+        'diag': {k: _bands(v) for k, v in qn['diag'].items()},
+        'qc_exp': _bands(qn['qc_exp']),
+        'qc_dip': dict(qn['qc_dip']),
+        'out_res': _bands(qn['out_res']),
+        'out_work': _bands(qn['out_work']),
+        'out_study': _bands(qn['out_study']),
+        'vjo': dict(qn['vjo']),
+        'auth': qn['auth'],
+        'family': ad['family'],
+        'sp_fr': _int_keys(ad['sp_fr']),
+        'sp_age': _int_keys(ad['sp_age']),
+        'sp_qc_exp': _bands(ad['sp_qc_exp']),
+        'sp_edu': dict(ad['sp_edu']),
+        'caps': (raw['caps']['hc'], raw['caps']['qn'], raw['caps']['ad']),
+    }
+    _check_keys(version, 'edu', spec['edu'], EDU_KEYS)
+    _check_keys(version, 'qc_dip', spec['qc_dip'], QC_DIP_KEYS)
+    _check_keys(version, 'diag', spec['diag'], DIAG_KEYS)
+    _check_keys(version, 'vjo', spec['vjo'], VJO_KEYS)
+    _check_keys(version, 'sp_edu', spec['sp_edu'], SP_EDU_KEYS)
+    return spec
+
+@lru_cache(maxsize=None)
+def list_versions():
+    """Effective dates (YYYY-MM-DD) of every grid file, oldest first."""
+    return tuple(sorted(p.stem for p in GRID_DIR.glob("*.json")))
+
+def _to_iso(as_of):
+    if as_of is None:
+        return date.today().isoformat()
+    if isinstance(as_of, datetime):
+        return as_of.date().isoformat()
+    if isinstance(as_of, date):
+        return as_of.isoformat()
+    return str(as_of)[:10]
+
+def resolve_version(as_of=None):
+    """Version in force on `as_of` (date, datetime or 'YYYY-MM-DD'; default today)."""
+    iso = _to_iso(as_of)
+    versions = list_versions()
+    i = bisect_right(versions, iso)
+    if i == 0:
+        raise ValueError(f"No scoring grid in force on {iso}")
+    return versions[i - 1]
+
+@lru_cache(maxsize=None)
+def load_grid(version):
+    """Parse and compile one grid version (cached for the life of the process)."""
+    raw = json.loads((GRID_DIR / f"{version}.json").read_text(encoding="utf-8"))
+    return CompiledGrid(parse_spec(raw, version), version)
+
+# Grid in force today and the time (next midnight) after which to re-resolve it
+_today = [None, float('-inf')]
+
+def get_grid(as_of=None):
+    """Grid in force on `as_of`; the default follows the date, so long-running processes switch over."""
+    if as_of is not None:
+        return load_grid(resolve_version(as_of))
+    if time.time() >= _today[1]:
+        today = date.today()
+        _today[:] = [load_grid(resolve_version(today)),
+                     datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()]
+    return _today[0]
@@ -0,0 +1,73 @@
+from functools import lru_cache
+
+import numpy as np
+
+import job_data
+
+# --- JOB FACETS ---
+# Filter state as int bitsets over row ids, built once per process:
+# every (facet, value) has the bitset of its rows, and a count cube
+# category x sub category x diagnosis answers the unfiltered counts.
+# Combining the search hits with any filters is an AND of ints, and the
+# live count next to each dropdown option is one popcount.
+
+FACETS = ('Category', 'Sub category', 'Diagnosis')
+
+def popcount(bits):
+    return bits.bit_count()
+
+def ids_to_bits(ids):
+    """Bitset with the given row ids set."""
+    bits = 0
+    for i in ids:
+        bits |= 1 << int(i)
+    return bits
+
+class FacetIndex:
+    """Per-value row bitsets of each facet, plus the facet count cube."""
+
+    def __init__(self, columns, facets=FACETS):
+        self.n = len(columns['NOC'])
+        self.all = (1 << self.n) - 1
+        self.facets = facets
+        self.values = {}
+        self.bits = {}
+        codes = []
+        for facet in facets:
+            col = columns[facet]
+            self.values[facet] = list(col.categories)
+            bits = [0] * len(col.categories)
+            for row, code in enumerate(col.codes):
+                bits[code] |= 1 << row
+            self.bits[facet] = dict(zip(col.categories, bits))
+            codes.append(np.asarray(col.codes, dtype=np.intp))
+        self.cube = np.zeros(tuple(len(self.values[f]) for f in facets), dtype=np.int32)
+        np.add.at(self.cube, tuple(codes), 1)
+
+    def value_bits(self, facet, value):
+        """Rows where `facet` == `value` (0 if no row has it)."""
+        return self.bits[facet].get(value, 0)
+
+    def option_counts(self, facet, within=None):
+        """value -> number of rows with it among `within` (default: all rows)."""
+        if within is None or within == self.all:
+            axes = tuple(d for d, f in enumerate(self.facets) if f != facet)
+            return dict(zip(self.values[facet], self.cube.sum(axis=axes).tolist()))
+        return {value: popcount(within & bits) for value, bits in self.bits[facet].items()}
+
+    def cube_counts(self, **fixed):
+        """
+        Counts from the cube with some facets fixed, e.g.
+        cube_counts(Category=...) -> Sub category x Diagnosis array.
+        Keyword names are facet names with spaces as underscores.
+        """
+        index = []
+        for facet in self.facets:
+            value = fixed.get(facet.replace(' ', '_'))
+            index.append(slice(None) if value is None else self.values[facet].index(value))
+        return self.cube[tuple(index)]
+
+@lru_cache(maxsize=None)
+def get_facets():
+    """The facet index of job_data (built on first use)."""
+    return FacetIndex(job_data.load_columns())
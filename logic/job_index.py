@@ -0,0 +1,150 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+
+import numpy as np
+
+import job_data
+
+# --- JOB SEARCH INDEX ---
+# Inverted index over the job table, built once per process. Text is
+# normalized (case, accents, ligatures) so "metier" matches "Métier", and
+# every query token matches as a prefix, for typeahead. Postings are Python
+# ints used as bitsets over row ids: AND / OR of two postings is one
+# big-int operation, whatever the number of indexed columns.
+
+INDEX_FIELDS = ('NOC', 'Title (FR)', 'Title (EN)', 'Diagnosis', 'Category', 'Sub category')
+
+# Letters NFKD does not decompose
+LIGATURES = str.maketrans({'œ': 'oe', 'Œ': 'oe', 'æ': 'ae', 'Æ': 'ae', 'ß': 'ss'})
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+def normalize(text):
+    """Lowercase, accent-free text ("Œuvres d'Été" -> "oeuvres d'ete")."""
+    text = unicodedata.normalize('NFKD', str(text).translate(LIGATURES))
+    return ''.join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+
+def tokenize(text):
+    return TOKEN_RE.findall(normalize(text))
+
+def bits_to_ids(bits, n):
+    """Sorted row ids of the set bits of `bits` (n rows)."""
+    raw = np.frombuffer(bits.to_bytes((n + 7) // 8, 'little'), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder='little')[:n])
+
+class TokenIndex:
+    """Normalized token -> bitset of the rows containing it, with prefix lookup."""
+
+    def __init__(self, columns, fields=INDEX_FIELDS):
+        self.n = len(columns[fields[0]])
+        postings = {}
+        for field in fields:
+            for row, value in enumerate(columns[field]):
+                for token in tokenize(value):
+                    postings[token] = postings.get(token, 0) | (1 << row)
+        self.tokens = sorted(postings)
+        self.postings = [postings[t] for t in self.tokens]
+        self.all = (1 << self.n) - 1
+
+    def prefix_bits(self, prefix):
+        """Rows with a token starting with `prefix` (already normalized)."""
+        lo = bisect_left(self.tokens, prefix)
+        # Every token >= prefix and < prefix + U+FFFF starts with prefix
+        hi = bisect_left(self.tokens, prefix + '\uffff', lo)
+        bits = 0
+        for posting in self.postings[lo:hi]:
+            bits |= posting
+        return bits
+
+    def match_bits(self, query):
+        """Rows matching every query token as a prefix (all rows for an empty query)."""
+        bits = self.all
+        for token in tokenize(query):
+            bits &= self.prefix_bits(token)
+            if not bits:
+                break
+        return bits
+
+    def search(self, query):
+        """Sorted row ids matching `query`."""
+        return bits_to_ids(self.match_bits(query), self.n)
+
+    def mask(self, query):
+        """Boolean row mask of `query`'s matches."""
+        mask = np.zeros(self.n, dtype=bool)
+        mask[self.search(query)] = True
+        return mask
+
+@lru_cache(maxsize=None)
+def get_index():
+    """The token index of job_data (built on first use)."""
+    return TokenIndex(job_data.load_columns())
+
+# --- FUZZY TITLE SEARCH ---
+# Ranked, typo-tolerant search over both titles: each title is a bag of
+# character trigrams (words padded with spaces, so word starts and ends
+# weigh in) scored with BM25. The French and English titles are separate
+# documents and a job takes the better of its two scores. Candidates are
+# exactly the documents sharing a trigram with the query.
+
+TITLE_FIELDS = ('Title (FR)', 'Title (EN)')
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+def trigrams(text):
+    """Character trigrams of every normalized token of `text` (with repeats)."""
+    grams = []
+    for token in tokenize(text):
+        padded = f" {token} "
+        grams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+class TrigramIndex:
+    """BM25 over title trigrams; document d = row d % n, title field d // n."""
+
+    def __init__(self, columns, fields=TITLE_FIELDS):
+        self.n = len(columns[fields[0]])
+        docs = [trigrams(value) for field in fields for value in columns[field]]
+        lengths = np.array([len(d) for d in docs], dtype=np.float64)
+        postings = {}
+        for doc, grams in enumerate(docs):
+            for gram in grams:
+                counts = postings.setdefault(gram, {})
+                counts[doc] = counts.get(doc, 0) + 1
+        n_docs = len(docs)
+        # Per-document part of the BM25 denominator
+        self.norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / max(lengths.mean(), 1))
+        self.postings = {}
+        for gram, counts in postings.items():
+            ids = np.fromiter(counts, dtype=np.intp, count=len(counts))
+            tf = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+            idf = np.log1p((n_docs - len(ids) + 0.5) / (len(ids) + 0.5))
+            # Precomputed BM25 term weight of this trigram in each document
+            self.postings[gram] = (ids, idf * tf * (BM25_K1 + 1) / (tf + self.norm[ids]))
+        self.n_docs = n_docs
+
+    def scores(self, query):
+        """BM25 score of every row (best title), 0 where no trigram is shared."""
+        total = np.zeros(self.n_docs)
+        for gram in trigrams(query):
+            posting = self.postings.get(gram)
+            if posting is not None:
+                ids, weights = posting
+                total[ids] += weights
+        return total.reshape(-1, self.n).max(axis=0)
+
+    def search(self, query, k=10):
+        """(row ids, scores) of the `k` best matches, best first (positive scores only)."""
+        scores = self.scores(query)
+        hits = np.flatnonzero(scores > 0)
+        if len(hits) > k:
+            hits = hits[np.argpartition(-scores[hits], k - 1)[:k]]
+        # Ties keep file order
+        hits = hits[np.lexsort((hits, -scores[hits]))]
+        return hits, scores[hits]
+
+@lru_cache(maxsize=None)
+def get_trigram_index():
+    """The title trigram index of job_data (built on first use)."""
+    return TrigramIndex(job_data.load_columns())
@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+import job_data
+from logic.job_index import tokenize
+from logic.occupations import DIAGNOSIS_DIAG
+
+# --- OCCUPATION SIMILARITY ---
+# "Jobs like mine with a better diagnosis", computed locally. Each job is a
+# TF-IDF vector of the character 3-4-grams of its two titles and sub
+# category, kept sparse: CSR rows plus the transposed gram -> (rows,
+# weights) postings, so one job's cosines only touch the grams it has.
+# Similarity is that cosine blended with NOC proximity: the share of leading
+# digits two codes have in common (broad category, major group, TEER...).
+# Only the TOP_K neighbours of each job are kept, cached on disk and keyed by
+# the hash of job_data.npz and the parameters below; a lookup needing more
+# than those recomputes its one row.
+
+CACHE_DIR = Path(__file__).parent / "cache"
+TEXT_FIELDS = ('Title (FR)', 'Title (EN)', 'Sub category')
+NGRAM_SIZES = (3, 4)
+NOC_WEIGHT = 0.3
+TOP_K = 50
+
+# Diagnoses worth recommending (the ones earning shortage points)
+SHORTAGE_DIAGNOSES = tuple(DIAGNOSIS_DIAG)
+
+def char_ngrams(text):
+    grams = []
+    for token in tokenize(text):
+        padded = f" {token} "
+        for size in NGRAM_SIZES:
+            grams.extend(padded[i:i + size] for i in range(len(padded) - size + 1))
+    return grams
+
+def tfidf_matrix(docs):
+    """
+    L2-normalized TF-IDF rows (sublinear tf, smoothed idf) of n-gram lists,
+    as CSR arrays (indptr, indices, data) plus the vocabulary size.
+    """
+    vocab, rows = {}, []
+    for grams in docs:
+        counts = {}
+        for gram in grams:
+            col = vocab.setdefault(gram, len(vocab))
+            counts[col] = counts.get(col, 0) + 1
+        rows.append(counts)
+
+    indptr = np.zeros(len(docs) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(r) for r in rows])
+    indices = np.fromiter((c for r in rows for c in r), dtype=np.int64, count=indptr[-1])
+    tf = np.fromiter((n for r in rows for n in r.values()), dtype=np.float64, count=indptr[-1])
+    df = np.bincount(indices, minlength=len(vocab))
+    idf = np.log((1 + len(docs)) / (1 + df)) + 1
+    data = (1 + np.log(tf)) * idf[indices]
+    row_of = np.repeat(np.arange(len(docs)), np.diff(indptr))
+    norms = np.sqrt(np.bincount(row_of, weights=data ** 2, minlength=len(docs)))
+    data /= np.maximum(norms, 1e-12)[row_of]
+    return (indptr, indices, data), len(vocab)
+
+def transpose(csr, n_cols):
+    """Column-major (CSC) arrays of a CSR matrix: each column's (rows, weights) postings."""
+    indptr, indices, data = csr
+    row_of = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    order = np.argsort(indices, kind='stable')
+    colptr = np.zeros(n_cols + 1, dtype=np.int64)
+    colptr[1:] = np.cumsum(np.bincount(indices, minlength=n_cols))
+    return colptr, row_of[order], data[order]
+
+def noc_digits(nocs):
+    return np.array([[int(ch) for ch in str(noc).zfill(5)] for noc in nocs])
+
+class SimilarityModel:
+    """Sparse TF-IDF rows, their postings and the NOC digits of every job."""
+
+    def __init__(self, columns):
+        docs = [char_ngrams(' '.join(str(columns[f][i]) for f in TEXT_FIELDS))
+                for i in range(len(columns['NOC']))]
+        self.csr, n_cols = tfidf_matrix(docs)
+        self.csc = transpose(self.csr, n_cols)
+        self.digits = noc_digits(columns['NOC'])
+        self.n = len(docs)
+
+    def cosines(self, row):
+        """Cosine of `row` with every job, from the postings of its grams only."""
+        indptr, indices, data = self.csr
+        colptr, col_rows, col_data = self.csc
+        cols, weights = indices[indptr[row]:indptr[row + 1]], data[indptr[row]:indptr[row + 1]]
+        starts, lengths = colptr[cols], np.diff(colptr)[cols]
+        # Flat positions of every posting of those grams
+        pos = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        return np.bincount(col_rows[pos], weights=np.repeat(weights, lengths) * col_data[pos],
+                           minlength=self.n)
+
+    def noc_proximity(self, row):
+        """Share of leading NOC digits `row` has in common with every job (1.0 = same code)."""
+        same = self.digits == self.digits[row]
+        # Leading digits shared = length of the all-True prefix
+        return np.cumprod(same, axis=1).sum(axis=1) / self.digits.shape[1]
+
+    def similarities(self, row):
+        return (1 - NOC_WEIGHT) * self.cosines(row) + NOC_WEIGHT * self.noc_proximity(row)
+
+def ranked(sim, exclude, k=None):
+    """Indices of the `k` largest similarities (all if None) but `exclude`, best first."""
+    sim = np.asarray(sim, dtype=np.float64).copy()
+    sim[exclude] = -np.inf
+    k = len(sim) - 1 if k is None else min(k, len(sim) - 1)
+    top = np.argpartition(-sim, k - 1)[:k] if k > 0 else np.arange(0)
+    # Ties keep file order
+    return top[np.lexsort((top, -sim[top]))]
+
+def build_neighbors(model, k=TOP_K):
+    """(ids, scores): each job's `k` most similar other jobs, best first."""
+    k = min(k, model.n - 1)
+    ids = np.zeros((model.n, k), dtype=np.int32)
+    scores = np.zeros((model.n, k), dtype=np.float32)
+    for row in range(model.n):
+        sim = model.similarities(row)
+        ids[row] = ranked(sim, row, k)
+        scores[row] = sim[ids[row]]
+    return ids, scores
+
+def _source_sha():
+    return hashlib.sha256(job_data.DATA_PATH.read_bytes()).hexdigest()
+
+def _manifest(sha):
+    return {'source_sha256': sha, 'text_fields': list(TEXT_FIELDS), 'ngram_sizes': list(NGRAM_SIZES),
+            'noc_weight': NOC_WEIGHT, 'top_k': TOP_K}
+
+@lru_cache(maxsize=None)
+def get_model():
+    """The sparse similarity model of job_data (built on first use)."""
+    return SimilarityModel(job_data.load_columns())
+
+@lru_cache(maxsize=None)
+def load_neighbors(cache_dir=CACHE_DIR):
+    """(ids, scores) of every job's TOP_K neighbours (read from the disk cache, rebuilt if stale)."""
+    cache_dir = Path(cache_dir)
+    npz_path, manifest_path = cache_dir / "job_similarity.npz", cache_dir / "job_similarity.json"
+    manifest = _manifest(_source_sha())
+    if npz_path.exists() and manifest_path.exists():
+        if json.loads(manifest_path.read_text(encoding="utf-8")) == manifest:
+            with np.load(npz_path) as npz:
+                return npz['ids'], npz['scores']
+
+    ids, scores = build_neighbors(get_model())
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent sessions never read a partial file
+        tmp = cache_dir / f".job_similarity.{os.getpid()}.npz"
+        np.savez(tmp, ids=ids, scores=scores)
+        os.replace(tmp, npz_path)
+        tmp = cache_dir / f".job_similarity.{os.getpid()}.json"
+        tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp, manifest_path)
+    except OSError:
+        pass  # read-only deploy: serve the in-memory neighbours
+    return ids, scores
+
+@lru_cache(maxsize=None)
+def _row_of_noc():
+    return {str(noc): i for i, noc in enumerate(job_data.load_columns()['NOC'])}
+
+def similar_jobs(noc, k=5, diagnoses=SHORTAGE_DIAGNOSES):
+    """
+    The `k` occupations most similar to `noc` whose Diagnosis is in
+    `diagnoses` (default: the shortage ones), best first, as dicts:
+    'noc', 'title_fr', 'title_en', 'diagnosis', 'similarity'.
+    """
+    row = _row_of_noc().get(str(noc).strip())
+    if row is None:
+        raise KeyError(f"Unknown NOC: {noc!r}")
+    columns = job_data.load_columns()
+    wanted = np.isin(np.asarray(columns['Diagnosis']), diagnoses)
+    ids, scores = load_neighbors()
+    keep = wanted[ids[row]]
+    if keep.sum() >= k:
+        best, sims = ids[row][keep][:k], scores[row][keep][:k]
+    else:
+        # Fewer than k matches among the cached neighbours: rank the whole row
+        sim = get_model().similarities(row)
+        best = ranked(np.where(wanted, sim, -np.inf), row)
+        best = best[wanted[best]][:k]
+        sims = sim[best]
+    return [{
+        'noc': columns['NOC'][i],
+        'title_fr': columns['Title (FR)'][i],
+        'title_en': columns['Title (EN)'][i],
+        'diagnosis': columns['Diagnosis'][i],
+        'similarity': float(score),
+    } for i, score in zip(best, sims)]
@@ -0,0 +1,95 @@
+from functools import lru_cache
+
+import job_data
+from logic.job_index import bits_to_ids
+
+# --- NOC HIERARCHY ---
+# NOC 2021 codes are positional: 1st digit = broad category, 2nd = TEER,
+# 2 digits = major group, 3 = sub-major, 4 = minor, 5 = unit group. The tree
+# is built once per process with every node's rows (int bitset over row ids)
+# and Diagnosis counts rolled up from its children, so any drill-down is a
+# dictionary hit instead of a filter + value_counts() over the table.
+
+# level -> NOC prefix length
+LEVELS = {'broad': 1, 'major': 2, 'sub_major': 3, 'minor': 4, 'unit': 5}
+
+class NocNode:
+    """One NOC prefix: its rows, per-Diagnosis counts and child prefixes."""
+    __slots__ = ('prefix', 'label', 'bits', 'size', 'counts', 'children')
+
+    def __init__(self, prefix, label=None):
+        self.prefix = prefix
+        self.label = label
+        self.bits = 0
+        self.size = 0
+        self.counts = {}
+        self.children = []
+
+    def add(self, row, diagnosis):
+        self.bits |= 1 << row
+        self.size += 1
+        self.counts[diagnosis] = self.counts.get(diagnosis, 0) + 1
+
+    def __repr__(self):
+        return f"NocNode({self.prefix!r}, {self.label!r}, size={self.size}, counts={self.counts})"
+
+class NocTree:
+    """
+    Every NOC prefix ('' = all jobs) -> NocNode, plus the same roll-ups per
+    TEER (2nd digit), which cuts across broad categories.
+    """
+
+    def __init__(self, columns):
+        self.n = len(columns['NOC'])
+        self.nodes = {'': NocNode('')}
+        self.teers = {}
+        # Labels: broad category = Category, major group = Sub category, unit = title
+        labels = {1: columns['Category'], 2: columns['Sub category'], 5: columns['Title (EN)']}
+        for row, (noc, diagnosis) in enumerate(zip(columns['NOC'], columns['Diagnosis'])):
+            code = str(noc).zfill(5)
+            self.nodes[''].add(row, diagnosis)
+            for length in LEVELS.values():
+                prefix = code[:length]
+                node = self.nodes.get(prefix)
+                if node is None:
+                    label = labels[length][row] if length in labels else None
+                    node = self.nodes[prefix] = NocNode(prefix, label)
+                    self.nodes[prefix[:-1]].children.append(prefix)
+                node.add(row, diagnosis)
+            teer = int(code[1])
+            if teer not in self.teers:
+                self.teers[teer] = NocNode(f"TEER {teer}")
+            self.teers[teer].add(row, diagnosis)
+
+    def node(self, prefix=''):
+        """NocNode of a NOC prefix (KeyError if no job has it)."""
+        return self.nodes[str(prefix)]
+
+    def counts(self, prefix=''):
+        """Diagnosis -> number of jobs under `prefix`."""
+        return self.nodes[str(prefix)].counts
+
+    def children(self, prefix=''):
+        """Child NocNodes of `prefix`, in NOC order."""
+        return [self.nodes[p] for p in self.nodes[str(prefix)].children]
+
+    def level(self, name):
+        """Every NocNode of one level ('broad', 'major', ..., 'unit'), in NOC order."""
+        length = LEVELS[name]
+        return [node for prefix, node in self.nodes.items() if len(prefix) == length]
+
+    def teer(self, teer):
+        """NocNode of every job with this TEER."""
+        return self.teers[int(teer)]
+
+    def rows(self, prefix='', teer=None):
+        """Sorted row ids under `prefix`, optionally restricted to one TEER."""
+        bits = self.nodes[str(prefix)].bits
+        if teer is not None:
+            bits &= self.teers[int(teer)].bits
+        return bits_to_ids(bits, self.n)
+
+@lru_cache(maxsize=None)
+def get_tree():
+    """The NOC tree of job_data (built on first use)."""
+    return NocTree(job_data.load_columns())
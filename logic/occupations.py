@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+import job_data
+from logic.grid import DIAG_KEYS
+from logic.simulation import TIME_AXIS, clean_profile, sweep
+from logic.timeline import HORIZON
+
+# --- OCCUPATION SWITCH SWEEP ---
+# "What if my primary occupation were NOC X?" for every job in job_data.
+# An occupation only enters the score through its labour-market diagnosis,
+# so the whole list is one sweep over the diagnosis keys x months of time
+# travel; each occupation then reads its row of that small cube.
+
+# job_data Diagnosis -> scoring diag key (anything else earns no shortage points)
+DIAGNOSIS_DIAG = {
+    'Déficit': 'Deficit',
+    'Léger déficit': 'Slight',
+}
+
+def job_diag(diagnosis):
+    """Scoring diag key for a job_data Diagnosis value."""
+    return DIAGNOSIS_DIAG.get(diagnosis, 'None')
+
+RANK_BY = ('score', 'time')
+
+def occupation_sweep(profile, target=None, top=10, rank_by='score', keep_experience=True,
+                     horizon=HORIZON, as_of=None, jobs=None):
+    """
+    Score `profile` as if its primary occupation were each job in `jobs`
+    (columns as from job_data.load_columns(), the default) and return the
+    `top` best (None = all) as dicts: 'noc', 'title_fr', 'title_en',
+    'diagnosis', 'diag', 'score' (today) and 'months_to_target' (first month
+    within `horizon` reaching `target`, or None).
+    rank_by='score' sorts by score then time; rank_by='time' by time then score.
+    Without `keep_experience`, months in the main occupation restart at 0.
+    """
+    if rank_by not in RANK_BY:
+        raise ValueError(f"rank_by must be one of {RANK_BY}, got {rank_by!r}")
+    jobs = job_data.load_columns() if jobs is None else jobs
+    base = clean_profile(profile)
+    if not keep_experience:
+        base['prim_occ_exp'] = 0
+
+    cube = sweep(base, ('diag_target', TIME_AXIS),
+                 {'diag_target': list(DIAG_KEYS), TIME_AXIS: list(range(horizon + 1))}, as_of)
+    # Drop the KEEP entries: rows follow DIAG_KEYS, columns are months 0..horizon
+    curves = cube['score'][1:, 1:]
+    diagnosis = pd.Categorical(jobs['Diagnosis'])
+    # One lookup per distinct diagnosis, then index by the category codes
+    diag_rows = np.array([DIAG_KEYS.index(job_diag(d)) for d in diagnosis.categories], dtype=np.intp)
+    diags = np.array(DIAG_KEYS, dtype=object)[diag_rows][diagnosis.codes]
+    rows = diag_rows[diagnosis.codes]
+    scores = curves[rows, 0]
+
+    if target is None:
+        months = np.full(len(rows), -1)
+    else:
+        reached = curves >= target
+        per_diag = np.where(reached.any(axis=1), reached.argmax(axis=1), -1)
+        months = per_diag[rows]
+
+    # Unreached targets sort after every reachable month
+    time_key = np.where(months < 0, horizon + 1, months)
+    if rank_by == 'score':
+        order = np.lexsort((time_key, -scores))
+    else:
+        order = np.lexsort((-scores, time_key))
+    if top is not None:
+        order = order[:top]
+
+    return [{
+        'noc': jobs['NOC'][i],
+        'title_fr': jobs['Title (FR)'][i],
+        'title_en': jobs['Title (EN)'][i],
+        'diagnosis': diagnosis[i],
+        'diag': diags[i],
+        'score': int(scores[i]),
+        'months_to_target': int(months[i]) if months[i] >= 0 else None,
+    } for i in order]
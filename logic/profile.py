@@ -0,0 +1,219 @@
+import re
+from enum import IntEnum
+from operator import attrgetter
+
+import numpy as np
+
+from logic.grid import (
+    EDU_KEYS, QC_DIP_KEYS, DIAG_KEYS, VJO_KEYS, SP_EDU_KEYS,
+    EDU_CODES, QC_DIP_CODES, DIAG_CODES, VJO_CODES, SP_EDU_CODES,
+)
+
+# --- ENUM CODES ---
+# Small-int codes for the keyed fields. Values are the grid vocabulary
+# positions (so they index the compiled tables directly); UNKNOWN is the
+# zero-points slot at the end of every keyed table.
+
+def _code_enum(name, keys):
+    members = {re.sub(r'\W+', '_', k).upper(): i for i, k in enumerate(keys)}
+    members['UNKNOWN'] = len(keys)
+    return IntEnum(name, members)
+
+Edu = _code_enum('Edu', EDU_KEYS)
+QcDip = _code_enum('QcDip', QC_DIP_KEYS)
+Diag = _code_enum('Diag', DIAG_KEYS)
+Vjo = _code_enum('Vjo', VJO_KEYS)
+SpEdu = _code_enum('SpEdu', SP_EDU_KEYS)
+
+# field -> (enum, keys, key -> code, default key)
+KEYED_FIELDS = {
+    'edu': (Edu, EDU_KEYS, EDU_CODES, None),
+    'qc_dip': (QcDip, QC_DIP_KEYS, QC_DIP_CODES, 'None'),
+    'diag': (Diag, DIAG_KEYS, DIAG_CODES, 'None'),
+    'vjo': (Vjo, VJO_KEYS, VJO_CODES, 'None'),
+    'sp_edu': (SpEdu, SP_EDU_KEYS, SP_EDU_CODES, 'None'),
+}
+
+BOOL_FIELDS = ('auth', 'spouse', 'family')
+
+INT_FIELDS = (
+    'age', 'gen_exp', 'fr_l', 'fr_s', 'fr_r', 'fr_w',
+    'prim_occ_exp', 'qc_exp', 'out_res', 'out_work', 'out_study',
+    'sp_age', 'sp_qc_exp', 'sp_fr_l', 'sp_fr_s', 'sp_fr_r', 'sp_fr_w',
+)
+
+# Same order as the profile dict built in app.py
+FIELDS = (
+    'age', 'edu', 'gen_exp', 'fr_l', 'fr_s', 'fr_r', 'fr_w',
+    'diag', 'prim_occ_exp', 'qc_exp', 'vjo', 'auth', 'qc_dip',
+    'out_res', 'out_work', 'out_study',
+    'spouse', 'sp_age', 'sp_edu', 'sp_qc_exp',
+    'sp_fr_l', 'sp_fr_s', 'sp_fr_r', 'sp_fr_w',
+    'family',
+)
+
+def to_code(field, key):
+    enum, keys, codes, _ = KEYED_FIELDS[field]
+    if isinstance(key, enum):
+        return key
+    return codes.get(key, len(keys))
+
+def to_key(field, code):
+    _, keys, _, _ = KEYED_FIELDS[field]
+    return keys[code] if 0 <= code < len(keys) else None
+
+
+_get_all = attrgetter(*FIELDS)
+
+
+class Profile:
+    """
+    Compact applicant profile (one slot per field of the app's profile dict).
+    Keyed fields are stored as enum codes; item access (p['edu'], p.get(...),
+    p['age'] = ...) speaks the dict form, so scoring code accepts either.
+    Profiles are mutable and compare by value, so they are unhashable.
+    """
+    __slots__ = FIELDS
+
+    def __init__(self, **fields):
+        for f in INT_FIELDS:
+            setattr(self, f, fields.get(f, 0))
+        for f in BOOL_FIELDS:
+            setattr(self, f, bool(fields.get(f, False)))
+        for f, (enum, _, _, default) in KEYED_FIELDS.items():
+            setattr(self, f, enum(to_code(f, fields.get(f, default))))
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(**d)
+
+    def to_dict(self):
+        d = {f: getattr(self, f) for f in FIELDS}
+        for f in KEYED_FIELDS:
+            d[f] = to_key(f, d[f])
+        return d
+
+    def copy(self):
+        # Spelled out: a setattr loop over FIELDS is several times slower
+        p = Profile.__new__(Profile)
+        (p.age, p.edu, p.gen_exp, p.fr_l, p.fr_s, p.fr_r, p.fr_w,
+         p.diag, p.prim_occ_exp, p.qc_exp, p.vjo, p.auth, p.qc_dip,
+         p.out_res, p.out_work, p.out_study,
+         p.spouse, p.sp_age, p.sp_edu, p.sp_qc_exp,
+         p.sp_fr_l, p.sp_fr_s, p.sp_fr_r, p.sp_fr_w,
+         p.family) = _get_all(self)
+        return p
+
+    # --- dict-style access (keyed fields as strings) ---
+    def __getitem__(self, key):
+        val = getattr(self, key)
+        if key in KEYED_FIELDS:
+            return to_key(key, val)
+        return val
+
+    def __setitem__(self, key, val):
+        if key in KEYED_FIELDS:
+            val = KEYED_FIELDS[key][0](to_code(key, val))
+        setattr(self, key, val)
+
+    def get(self, key, default=None):
+        if key not in FIELDS:
+            return default
+        return self[key]
+
+    def __eq__(self, other):
+        if not isinstance(other, Profile):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Profile({', '.join(f'{f}={getattr(self, f)!r}' for f in FIELDS)})"
+
+
+class ProfileBatch:
+    """
+    Struct-of-arrays profile table: one NumPy array per field (int16 for
+    months/levels/ages, bool for flags, int8 enum codes for keyed fields).
+    batch['edu'] returns the code array; calculate_scores reads codes directly.
+    """
+    DTYPES = {
+        **{f: np.int16 for f in INT_FIELDS},
+        **{f: np.bool_ for f in BOOL_FIELDS},
+        **{f: np.int8 for f in KEYED_FIELDS},
+    }
+
+    def __init__(self, columns):
+        self.columns = {f: np.asarray(columns[f], dtype=self.DTYPES[f]) for f in FIELDS}
+
+    @classmethod
+    def from_dicts(cls, dicts):
+        dicts = list(dicts)
+        cols = {}
+        for f in INT_FIELDS:
+            cols[f] = [d.get(f, 0) for d in dicts]
+        for f in BOOL_FIELDS:
+            cols[f] = [bool(d.get(f, False)) for d in dicts]
+        for f, (_, _, _, default) in KEYED_FIELDS.items():
+            cols[f] = [to_code(f, d.get(f, default)) for d in dicts]
+        return cls(cols)
+
+    @classmethod
+    def from_profiles(cls, profiles):
+        profiles = list(profiles)
+        return cls({f: [getattr(p, f) for p in profiles] for f in FIELDS})
+
+    @classmethod
+    def from_frame(cls, df):
+        """DataFrame in dict form (string keys for keyed fields)."""
+        cols = {}
+        for f in INT_FIELDS:
+            cols[f] = df[f].to_numpy() if f in df else np.zeros(len(df))
+        for f in BOOL_FIELDS:
+            cols[f] = df[f].fillna(False).to_numpy(dtype=bool) if f in df else np.zeros(len(df), dtype=bool)
+        for f, (_, keys, codes, default) in KEYED_FIELDS.items():
+            if f in df:
+                cols[f] = df[f].map(codes).fillna(len(keys)).to_numpy()
+            else:
+                cols[f] = np.full(len(df), to_code(f, default))
+        return cls(cols)
+
+    @classmethod
+    def repeat(cls, profile, n):
+        """n copies of one profile (e.g. the starting point of a simulator grid)."""
+        if not isinstance(profile, Profile):
+            profile = Profile.from_dict(profile)
+        return cls({f: np.full(n, getattr(profile, f)) for f in FIELDS})
+
+    def __len__(self):
+        return len(self.columns['age'])
+
+    def __getitem__(self, key):
+        return self.columns[key]
+
+    def __setitem__(self, key, values):
+        self.columns[key] = np.broadcast_to(
+            np.asarray(values, dtype=self.DTYPES[key]), (len(self),)).copy()
+
+    def __contains__(self, key):
+        return key in self.columns
+
+    def row(self, i):
+        p = Profile.__new__(Profile)
+        for f in INT_FIELDS:
+            setattr(p, f, int(self.columns[f][i]))
+        for f in BOOL_FIELDS:
+            setattr(p, f, bool(self.columns[f][i]))
+        for f, (enum, _, _, _) in KEYED_FIELDS.items():
+            setattr(p, f, enum(int(self.columns[f][i])))
+        return p
+
+    def to_dicts(self):
+        cols = {f: self.columns[f].tolist() for f in FIELDS}
+        for f in KEYED_FIELDS:
+            cols[f] = [to_key(f, c) for c in cols[f]]
+        return [dict(zip(FIELDS, vals)) for vals in zip(*(cols[f] for f in FIELDS))]
+
+    def copy(self):
+        return ProfileBatch({f: a.copy() for f, a in self.columns.items()})
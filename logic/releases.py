@@ -0,0 +1,162 @@
+import argparse
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+import job_data
+
+# --- DIAGNOSTIC RELEASES ---
+# Several labour-market diagnostic releases in one columnar store: a long
+# table (release, NOC, diagnosis) of int codes sharing one NOC dictionary and
+# one diagnosis dictionary. Loading builds two indexes:
+#   - a NOC x release matrix of diagnosis codes (-1 = absent), so "which NOCs
+#     changed between A and B" is one vectorized comparison of two columns;
+#   - the NOC dictionary itself (sorted), so "history of NOC X" is a
+#     binary search and one matrix row.
+#   python -m logic.releases add 2024-2028          (from job_data.npz)
+#   python -m logic.releases diff 2024-2028 2025-2029
+#   python -m logic.releases history 21232
+
+STORE_PATH = Path(__file__).parent.parent / "job_releases.npz"
+
+# Release described by the bundled job_data.npz
+CURRENT_RELEASE = "2024-2028"
+
+MISSING = -1
+
+class ReleaseStore:
+    """Diagnosis of every NOC in every release, indexed by NOC and release."""
+
+    def __init__(self, releases, nocs, diagnoses, matrix):
+        self.releases = list(releases)    # release ids, in the order added
+        self.nocs = np.asarray(nocs)      # sorted NOC dictionary
+        self.diagnoses = list(diagnoses)  # diagnosis dictionary
+        self.matrix = matrix              # (noc, release) -> diagnosis code or MISSING
+
+    @classmethod
+    def empty(cls):
+        return cls([], np.array([], dtype=str), [], np.zeros((0, 0), dtype=np.int8))
+
+    @classmethod
+    def load(cls, path=STORE_PATH):
+        with np.load(path) as npz:
+            releases = npz['release_values'].tolist()
+            nocs = npz['noc_values']
+            diagnoses = npz['diagnosis_values'].tolist()
+            matrix = np.full((len(nocs), len(releases)), MISSING, dtype=np.int8)
+            matrix[npz['noc_codes'], npz['release_codes']] = npz['diagnosis_codes']
+        return cls(releases, nocs, diagnoses, matrix)
+
+    def save(self, path=STORE_PATH):
+        """Write the long (release, NOC, diagnosis) table; write-then-rename."""
+        noc_codes, release_codes = np.nonzero(self.matrix != MISSING)
+        arrays = {
+            'release_values': np.array(self.releases),
+            'noc_values': self.nocs,
+            'diagnosis_values': np.array(self.diagnoses),
+            'release_codes': release_codes.astype(np.int16),
+            'noc_codes': noc_codes.astype(np.int32),
+            'diagnosis_codes': self.matrix[noc_codes, release_codes],
+        }
+        path = Path(path)
+        tmp = path.with_name(f".{path.stem}.{os.getpid()}.npz")
+        np.savez_compressed(tmp, **arrays)
+        os.replace(tmp, path)
+
+    def add_release(self, release, nocs, diagnoses):
+        """Store with `release` added (or replaced): parallel NOC / Diagnosis lists."""
+        nocs = [str(n) for n in nocs]
+        all_nocs = np.union1d(self.nocs, np.array(nocs, dtype=str))
+        dictionary = list(self.diagnoses)
+        for d in diagnoses:
+            if d not in dictionary:
+                dictionary.append(d)
+        # A replaced release keeps its place
+        releases = self.releases if release in self.releases else self.releases + [release]
+
+        matrix = np.full((len(all_nocs), len(releases)), MISSING, dtype=np.int8)
+        matrix[np.searchsorted(all_nocs, self.nocs), :len(self.releases)] = self.matrix
+        col = releases.index(release)
+        matrix[:, col] = MISSING
+        codes = {d: i for i, d in enumerate(dictionary)}
+        matrix[np.searchsorted(all_nocs, nocs), col] = [codes[d] for d in diagnoses]
+        return ReleaseStore(releases, all_nocs, dictionary, matrix)
+
+    def _label(self, code):
+        return None if code == MISSING else self.diagnoses[code]
+
+    def _row(self, noc):
+        noc = str(noc).strip()
+        i = int(np.searchsorted(self.nocs, noc))
+        return i if i < len(self.nocs) and self.nocs[i] == noc else None
+
+    def history(self, noc):
+        """[(release, diagnosis or None)] of one NOC, in release order."""
+        row = self._row(noc)
+        codes = self.matrix[row] if row is not None else [MISSING] * len(self.releases)
+        return [(r, self._label(c)) for r, c in zip(self.releases, codes)]
+
+    def _col(self, release):
+        if release not in self.releases:
+            raise KeyError(f"Unknown release: {release!r}")
+        return self.releases.index(release)
+
+    def changed(self, a, b):
+        """[(NOC, diagnosis in a, diagnosis in b)] for every NOC whose diagnosis differs (None = absent)."""
+        col_a, col_b = self.matrix[:, self._col(a)], self.matrix[:, self._col(b)]
+        rows = np.flatnonzero(col_a != col_b)
+        return [(str(self.nocs[i]), self._label(col_a[i]), self._label(col_b[i])) for i in rows]
+
+    def histories(self, nocs):
+        """Diagnosis codes (len(nocs) x releases, MISSING where absent) of many NOCs at once."""
+        nocs = np.asarray([str(n) for n in nocs])
+        if not len(self.nocs):
+            return np.full((len(nocs), len(self.releases)), MISSING, dtype=np.int8)
+        rows = np.minimum(np.searchsorted(self.nocs, nocs), len(self.nocs) - 1)
+        found = self.nocs[rows] == nocs
+        return np.where(found[:, None], self.matrix[rows], MISSING)
+
+def _current_store():
+    columns = job_data.load_columns()
+    return ReleaseStore.empty().add_release(
+        CURRENT_RELEASE, columns['NOC'], [str(d) for d in columns['Diagnosis']])
+
+@lru_cache(maxsize=None)
+def get_store(path=STORE_PATH):
+    """The release store (just the bundled release if no store file exists)."""
+    return ReleaseStore.load(path) if Path(path).exists() else _current_store()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the diagnostic release store.")
+    parser.add_argument("--store", default=str(STORE_PATH))
+    sub = parser.add_subparsers(dest="command", required=True)
+    add = sub.add_parser("add", help="add (or replace) a release from a job_data .npz")
+    add.add_argument("release")
+    add.add_argument("--data", default=str(job_data.DATA_PATH))
+    diff = sub.add_parser("diff", help="NOCs whose diagnosis changed between two releases")
+    diff.add_argument("a")
+    diff.add_argument("b")
+    hist = sub.add_parser("history", help="diagnosis of one NOC in every release")
+    hist.add_argument("noc")
+    args = parser.parse_args(argv)
+
+    store = ReleaseStore.load(args.store) if Path(args.store).exists() else ReleaseStore.empty()
+    if args.command == "add":
+        columns = job_data.load_columns(Path(args.data))
+        store = store.add_release(args.release, columns['NOC'], [str(d) for d in columns['Diagnosis']])
+        store.save(args.store)
+        print(f"{args.store}: {len(store.releases)} releases, {len(store.nocs)} NOCs")
+    elif args.command == "diff":
+        for release in (args.a, args.b):
+            if release not in store.releases:
+                parser.error(f"unknown release {release!r} (known: {', '.join(store.releases) or 'none'})")
+        for noc, a, b in store.changed(args.a, args.b):
+            print(f"{noc}\t{a or '-'}\t{b or '-'}")
+    else:
+        for release, diagnosis in store.history(args.noc):
+            print(f"{release}\t{diagnosis or '-'}")
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,14 @@
+from collections import OrderedDict
+from threading import Lock
+
+import numpy as np
+import pandas as pd
+
 import translations as tr
+from logic.grid import (
+    get_grid,
+    EDU_CODES, QC_DIP_CODES, DIAG_CODES, VJO_CODES, SP_EDU_CODES,
+)
 
 # --- CONSTANTS (The "Grid") ---
 
@@ -107,170 +117,380 @@ LATEST_DRAWS = [
 
 
 
-DIAG_MATRIX = {
-    "None": [(0, 12, 0), (12, 24, 5), (24, 36, 10), (36, 48, 15), (48, 10**9, 25)],
-    "Slight": [(0, 12, 0), (12, 24, 70), (24, 36, 80), (36, 48, 90), (48, 10**9, 100)],
-    "Deficit": [(0, 12, 0), (12, 24, 90), (24, 36, 100), (36, 48, 110), (48, 10**9, 120)]
-}
+# The grid itself lives in logic/grids/<effective date>.json (see logic.grid).
+# Engines score against the version in force today (resolved per call, so a
+# long-running process picks up the next grid on its effective date); pass
+# `as_of` to score against another version. GRID and the constants below
+# mirror today's version for the reference tab, read on each access.
 
-AGE_SINGLE = {18:110, 19:110, 20:120, 21:120, 22:120, 23:120, 24:120, 25:120, 26:120, 27:120, 28:120, 29:120, 30:120, 31:110, 32:100, 33:90, 34:80, 35:75, 36:70, 37:65, 38:60, 39:55, 40:50, 41:40, 42:30, 43:20, 44:10, 45:0}
-AGE_SPOUSE_PA = {18:90, 19:90, 20:100, 21:100, 22:100, 23:100, 24:100, 25:100, 26:100, 27:100, 28:100, 29:100, 30:100, 31:95, 32:90, 33:81, 34:72, 35:68, 36:63, 37:59, 38:54, 39:50, 40:45, 41:36, 42:27, 43:18, 44:9, 45:0}
-SP_AGE_ADAPT = {16:18, 17:18, 18:18, 19:18, 20:20, 21:20, 22:20, 23:20, 24:20, 25:20, 26:20, 27:20, 28:20, 29:20, 30:20, 31:18, 32:17, 33:16, 34:15, 35:14, 36:12, 37:10, 38:8, 39:7, 40:6, 41:5, 42:4, 43:3, 44:2, 45:0}
-
-EXP_PA_SINGLE = [(0, 12, 0), (12, 24, 20), (24, 36, 40), (36, 48, 50), (48, 10**9, 70)]
-EXP_PA_SPOUSE = [(0, 12, 0), (12, 24, 15), (24, 36, 30), (36, 48, 35), (48, 10**9, 50)]
-QC_EXP_PA = [(0, 12, 0), (12, 24, 40), (24, 36, 80), (36, 48, 120), (48, 10**9, 160)]
-SP_QC_EXP_TABLE = [(0, 6, 0), (6, 12, 5), (12, 24, 10), (24, 36, 15), (36, 48, 23), (48, 10**9, 30)]
-
-OUT_CMM_RES = [(0, 6, 0), (6, 12, 6), (12, 24, 16), (24, 36, 24), (36, 48, 32), (48, 10**9, 40)]
-OUT_CMM_WORK = [(0, 6, 0), (6, 12, 9), (12, 24, 24), (24, 36, 36), (36, 48, 48), (48, 10**9, 60)]
-OUT_CMM_STUDY = [(0, 6, 0), (6, 12, 3), (12, 24, 8), (24, 36, 12), (36, 48, 16), (48, 10**9, 20)]
-
-# Updated from our Reference Tab work
-EDU_POINTS_UI = {
-    'PhD': (130, 110), 'MedSpec': (130, 110), 'Masters 2y': (117, 99), 'Masters 1y': (110, 93),
-    'Bach 5y': (110, 93), 'Bach 3y': (104, 88), 'Bach 2y': (91, 77), 'Bach 1y': (78, 66),
-    'Tech 3y': (78, 66), 'Tech 2y': (52, 44), 'Tech 900h': (52, 44), 'College Gen': (39, 33),
-    'DEP 1y': (26, 22), 'DEP 900h': (26, 22), 'DEP 600h': (13, 11), 'HS': (13, 11)
+_SPEC_CONSTANTS = {
+    'DIAG_MATRIX': 'diag',
+    'AGE_SINGLE': 'age_single', 'AGE_SPOUSE_PA': 'age_spouse', 'SP_AGE_ADAPT': 'sp_age',
+    'EXP_PA_SINGLE': 'exp_single', 'EXP_PA_SPOUSE': 'exp_spouse',
+    'QC_EXP_PA': 'qc_exp', 'SP_QC_EXP_TABLE': 'sp_qc_exp',
+    'OUT_CMM_RES': 'out_res', 'OUT_CMM_WORK': 'out_work', 'OUT_CMM_STUDY': 'out_study',
+    'EDU_POINTS_UI': 'edu', 'QC_DIPLOMA_POINTS': 'qc_dip', 'EDU_SPOUSE_UI': 'sp_edu',
+    # French: minimum level -> points per skill (principal: (single, with spouse))
+    'FR_POINTS_UI': 'fr', 'SP_FR_POINTS_UI': 'sp_fr',
+    'VJO_POINTS': 'vjo',
 }
 
-QC_DIPLOMA_POINTS = {
-    'PhD': 200, 'MedSpec': 200, 'Masters 2y': 180, 'Masters 1y': 170,
-    'Bach 5y': 170, 'Bach 3y': 160, 'Bach 2y': 140, 'Bach 1y': 120,
-    'Tech 3y': 120, 'Tech 900h': 80, 'College Gen': 60,
-    'DEP 900h': 40, 'DEP 600h': 20, 'HS': 20, 'None': 0
-}
+def __getattr__(name):
+    if name == 'GRID':
+        return get_grid()
+    if name in _SPEC_CONSTANTS:
+        return get_grid().spec[_SPEC_CONSTANTS[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def month_points(table, months):
+    if months < 0: return 0
+    return table[int(months)] if months < len(table) else table[-1]
 
-EDU_SPOUSE_UI = {'PhD': 20, 'Masters': 18, 'Bachelors': 16, 'Tech Diploma': 12, 'High School': 2, 'None': 0}
+def level_points(table, lvl):
+    if lvl <= 0: return table[0]
+    return table[int(lvl)] if lvl < len(table) else table[-1]
+
+def age_points(table, age):
+    return table[int(age)] if 0 <= age < len(table) else 0
 
 # --- CALCULATION ENGINE ---
 
-def band_points(months, bands):
-    for lo, hi, pts in bands:
-        if lo <= months < hi: return pts
-    return 0
+# Fixed audit layout shared by every compact Audit
+AUDIT_KEYS = (
+    'fr_l_pts', 'fr_s_pts', 'fr_r_pts', 'fr_w_pts', 'hc_french',
+    'hc_age', 'hc_exp', 'hc_edu', 'total_hc',
+    'qn_diag', 'qn_qc_exp', 'qn_dip',
+    'out_res_pts', 'out_work_pts', 'out_study_pts', 'qn_out',
+    'qn_vjo', 'qn_auth', 'total_qn',
+    'ad_fam', 'ad_fr', 'ad_age', 'ad_exp', 'ad_edu', 'total_ad',
+)
+AUDIT_INDEX = {k: i for i, k in enumerate(AUDIT_KEYS)}
+# Only present in the audit dict of applicants with a spouse
+SPOUSE_AUDIT_KEYS = frozenset(('ad_fr', 'ad_age', 'ad_exp', 'ad_edu'))
+
+class Audit:
+    """
+    Compact score breakdown: one tuple of values in AUDIT_KEYS order.
+    Reads like the audit dict (audit['hc_age'], audit.get(...)); to_dict()
+    builds the real dict for callers that need one.
+    """
+    __slots__ = ('values', 'spouse')
+
+    def __init__(self, values, spouse):
+        self.values = values
+        self.spouse = spouse
+
+    def __getitem__(self, key):
+        return self.values[AUDIT_INDEX[key]]
 
-def calculate_score(p):
+    def get(self, key, default=None):
+        if key not in AUDIT_INDEX or (not self.spouse and key in SPOUSE_AUDIT_KEYS):
+            return default
+        return self.values[AUDIT_INDEX[key]]
+
+    def to_dict(self):
+        d = dict(zip(AUDIT_KEYS, self.values))
+        if not self.spouse:
+            for k in SPOUSE_AUDIT_KEYS:
+                del d[k]
+        return d
+
+    def __eq__(self, other):
+        if not isinstance(other, Audit):
+            return NotImplemented
+        return self.values == other.values and self.spouse == other.spouse
+
+    def __repr__(self):
+        return f"Audit({self.to_dict()!r})"
+
+def calculate_score(p, as_of=None, compact=False):
     """
     Core Scoring Engine.
-    Input: 'p' dictionary (profile).
-    Output: (Total Score, Audit Dictionary).
+    Input: 'p' dictionary (profile), optional 'as_of' date selecting the grid version.
+    Output: (Total Score, Audit Dictionary), or (Total Score, Audit) with compact=True.
     """
-    audit = {}
+    g = get_grid(as_of)
     spouse = p['spouse']
+    s = 1 if spouse else 0
 
     # --- 1. HUMAN CAPITAL ---
-    hc = 0
-    def get_fr_pts(lvl):
-        if lvl >= 9: return 40 if spouse else 50
-        if lvl >= 7: return 35 if spouse else 44
-        if lvl >= 5: return 30 if spouse else 38
-        return 0
-
-    p_fr_l = get_fr_pts(p['fr_l'])
-    p_fr_s = get_fr_pts(p['fr_s'])
-    p_fr_r = get_fr_pts(p['fr_r'])
-    p_fr_w = get_fr_pts(p['fr_w'])
-
-    audit['fr_l_pts'] = p_fr_l
-    audit['fr_s_pts'] = p_fr_s
-    audit['fr_r_pts'] = p_fr_r
-    audit['fr_w_pts'] = p_fr_w
-
+    fr_table = g.fr[s]
+    p_fr_l = level_points(fr_table, p['fr_l'])
+    p_fr_s = level_points(fr_table, p['fr_s'])
+    p_fr_r = level_points(fr_table, p['fr_r'])
+    p_fr_w = level_points(fr_table, p['fr_w'])
     fr_pts = p_fr_l + p_fr_s + p_fr_r + p_fr_w
-    audit['hc_french'] = fr_pts
-    hc += fr_pts
-
-    # Age
-    age_table = AGE_SPOUSE_PA if spouse else AGE_SINGLE
-    # Handle ages > 45 safely
-    hc_age = age_table.get(p['age'], 0)
-    audit['hc_age'] = hc_age
-    hc += hc_age
 
+    # Age (ages outside the table, e.g. > 45, score 0)
+    hc_age = age_points(g.age[s], p['age'])
     # Experience
-    hc_exp = band_points(p['gen_exp'], EXP_PA_SPOUSE if spouse else EXP_PA_SINGLE)
-    audit['hc_exp'] = hc_exp
-    hc += hc_exp
-
+    hc_exp = month_points(g.exp[s], p['gen_exp'])
     # Education
-    hc_edu = EDU_POINTS_UI.get(p['edu'], (0,0))[1 if spouse else 0]
-    audit['hc_edu'] = hc_edu
-    hc += hc_edu
+    hc_edu = g.edu[s][EDU_CODES.get(p['edu'], -1)]
 
-    final_hc = min(hc, 520)
-    audit['total_hc'] = final_hc
+    final_hc = min(fr_pts + hc_age + hc_exp + hc_edu, g.cap_hc)
 
     # --- 2. QUEBEC NEEDS ---
-    qn = 0
-    qn_diag = band_points(p['prim_occ_exp'], DIAG_MATRIX.get(p['diag'], []))
-    audit['qn_diag'] = qn_diag
-    qn += qn_diag
+    qn_diag = month_points(g.diag[DIAG_CODES.get(p['diag'], -1)], p['prim_occ_exp'])
+    qn_qc_exp = month_points(g.qc_exp, p['qc_exp'])
+    qn_dip = g.qc_dip[QC_DIP_CODES.get(p['qc_dip'], -1)]
+
+    pts_out_res = month_points(g.out_res, p['out_res'])
+    pts_out_work = month_points(g.out_work, p['out_work'])
+    pts_out_study = month_points(g.out_study, p['out_study'])
+    qn_out = pts_out_res + pts_out_work + pts_out_study
 
-    qn_qc_exp = band_points(p['qc_exp'], QC_EXP_PA)
-    audit['qn_qc_exp'] = qn_qc_exp
-    qn += qn_qc_exp
+    qn_vjo = g.vjo[VJO_CODES.get(p['vjo'], -1)]
+    qn_auth = g.auth if p['auth'] else 0
 
-    qn_dip = QC_DIPLOMA_POINTS.get(p['qc_dip'], 0)
-    audit['qn_dip'] = qn_dip
-    qn += qn_dip
+    final_qn = min(qn_diag + qn_qc_exp + qn_dip + qn_out + qn_vjo + qn_auth, g.cap_qn)
 
-    pts_out_res = band_points(p['out_res'], OUT_CMM_RES)
-    pts_out_work = band_points(p['out_work'], OUT_CMM_WORK)
-    pts_out_study = band_points(p['out_study'], OUT_CMM_STUDY)
+    # --- 3. ADAPTATION ---
+    ad_fam = g.family if p['family'] else 0
+    sp_fr = sp_age_pts = sp_qc_pts = sp_edu_pts = 0
+    if spouse:
+        sp_fr = (level_points(g.sp_fr, p['sp_fr_l']) + level_points(g.sp_fr, p['sp_fr_s'])
+                 + level_points(g.sp_fr, p['sp_fr_r']) + level_points(g.sp_fr, p['sp_fr_w']))
+        # Spouse Age
+        sp_age_pts = age_points(g.sp_age, p['sp_age'])
+        # Spouse QC Work
+        sp_qc_pts = month_points(g.sp_qc_exp, p['sp_qc_exp'])
+        # Spouse Edu
+        sp_edu_pts = g.sp_edu[SP_EDU_CODES.get(p['sp_edu'], -1)]
+
+    final_ad = min(ad_fam + sp_fr + sp_age_pts + sp_qc_pts + sp_edu_pts, g.cap_ad)
+
+    audit = Audit((
+        p_fr_l, p_fr_s, p_fr_r, p_fr_w, fr_pts,
+        hc_age, hc_exp, hc_edu, final_hc,
+        qn_diag, qn_qc_exp, qn_dip,
+        pts_out_res, pts_out_work, pts_out_study, qn_out,
+        qn_vjo, qn_auth, final_qn,
+        ad_fam, sp_fr, sp_age_pts, sp_qc_pts, sp_edu_pts, final_ad,
+    ), bool(spouse))
+    return final_hc + final_qn + final_ad, audit if compact else audit.to_dict()
+
+def score_total(p, as_of=None):
+    """Total score only: calculate_score without building any audit."""
+    g = get_grid(as_of)
+    s = 1 if p['spouse'] else 0
+
+    fr_table = g.fr[s]
+    hc = (level_points(fr_table, p['fr_l']) + level_points(fr_table, p['fr_s'])
+          + level_points(fr_table, p['fr_r']) + level_points(fr_table, p['fr_w'])
+          + age_points(g.age[s], p['age']) + month_points(g.exp[s], p['gen_exp'])
+          + g.edu[s][EDU_CODES.get(p['edu'], -1)])
+
+    qn = (month_points(g.diag[DIAG_CODES.get(p['diag'], -1)], p['prim_occ_exp'])
+          + month_points(g.qc_exp, p['qc_exp']) + g.qc_dip[QC_DIP_CODES.get(p['qc_dip'], -1)]
+          + month_points(g.out_res, p['out_res']) + month_points(g.out_work, p['out_work'])
+          + month_points(g.out_study, p['out_study'])
+          + g.vjo[VJO_CODES.get(p['vjo'], -1)] + (g.auth if p['auth'] else 0))
+
+    ad = g.family if p['family'] else 0
+    if s:
+        ad += (level_points(g.sp_fr, p['sp_fr_l']) + level_points(g.sp_fr, p['sp_fr_s'])
+               + level_points(g.sp_fr, p['sp_fr_r']) + level_points(g.sp_fr, p['sp_fr_w'])
+               + age_points(g.sp_age, p['sp_age']) + month_points(g.sp_qc_exp, p['sp_qc_exp'])
+               + g.sp_edu[SP_EDU_CODES.get(p['sp_edu'], -1)])
+
+    return min(hc, g.cap_hc) + min(qn, g.cap_qn) + min(ad, g.cap_ad)
+
+def raw_totals(audit):
+    """Uncapped (HC, QN, AD) sums of an audit (dict of scalars or of arrays)."""
+    hc = audit['hc_french'] + audit['hc_age'] + audit['hc_exp'] + audit['hc_edu']
+    qn = (audit['qn_diag'] + audit['qn_qc_exp'] + audit['qn_dip']
+          + audit['qn_out'] + audit['qn_vjo'] + audit['qn_auth'])
+    ad = (audit['ad_fam'] + audit.get('ad_fr', 0) + audit.get('ad_age', 0)
+          + audit.get('ad_exp', 0) + audit.get('ad_edu', 0))
+    return (hc, qn, ad)
+
+
+# --- MEMOIZED SCORING ---
+# Streamlit reruns score the same (or scoring-equivalent) profile over and over.
+# Profiles are first reduced to a canonical key (months -> band tier, French
+# level -> tier, spouse-only fields dropped for singles) so equivalent inputs
+# share one entry of a bounded LRU cache.
+
+def _tier(tiers, value):
+    if value <= 0: return 0
+    return tiers[int(value)] if value < len(tiers) else tiers[-1]
+
+def canonical_key(p, as_of=None):
+    g = get_grid(as_of)
+    t = g.tiers
+    spouse = bool(p['spouse'])
+    age = p['age']
+    key = (
+        g.version, spouse,
+        _tier(t['fr'], p['fr_l']), _tier(t['fr'], p['fr_s']),
+        _tier(t['fr'], p['fr_r']), _tier(t['fr'], p['fr_w']),
+        # Ages past the table share the trailing "outside" tier
+        _tier(t['age'], age if age < len(t['age']) - 1 else len(t['age']) - 1),
+        _tier(t['exp'], p['gen_exp']), EDU_CODES.get(p['edu'], -1),
+        DIAG_CODES.get(p['diag'], -1), _tier(t['prim_occ_exp'], p['prim_occ_exp']),
+        _tier(t['qc_exp'], p['qc_exp']), QC_DIP_CODES.get(p['qc_dip'], -1),
+        _tier(t['out_res'], p['out_res']), _tier(t['out_work'], p['out_work']),
+        _tier(t['out_study'], p['out_study']),
+        VJO_CODES.get(p['vjo'], -1), bool(p['auth']), bool(p['family']),
+    )
+    if spouse:
+        sp_age = p['sp_age']
+        key += (
+            _tier(t['sp_fr'], p['sp_fr_l']), _tier(t['sp_fr'], p['sp_fr_s']),
+            _tier(t['sp_fr'], p['sp_fr_r']), _tier(t['sp_fr'], p['sp_fr_w']),
+            _tier(t['sp_age'], sp_age if sp_age < len(t['sp_age']) - 1 else len(t['sp_age']) - 1),
+            _tier(t['sp_qc_exp'], p['sp_qc_exp']), SP_EDU_CODES.get(p['sp_edu'], -1),
+        )
+    return key
+
+class ScoreCache:
+    """Bounded LRU of canonical key -> (total, Audit), with hit/miss counters."""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def info(self):
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._data), 'maxsize': self.maxsize}
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+SCORE_CACHE = ScoreCache()
+
+def cached_score(p, as_of=None):
+    """
+    Memoized calculate_score. Returns (Total Score, Audit); the compact Audit
+    is immutable, so cached entries are shared without copying.
+    """
+    key = canonical_key(p, as_of)
+    entry = SCORE_CACHE.get(key)
+    if entry is None:
+        entry = calculate_score(p, as_of, compact=True)
+        SCORE_CACHE.put(key, entry)
+    return entry
+
+def score_cache_info():
+    return SCORE_CACHE.info()
+
+
+# --- BATCH ENGINE ---
+# Same compiled tables as calculate_score, read column-wise over a whole table
+# of profiles (DataFrame or dict of arrays keyed like the app's profile dict).
+
+PROFILE_KEYS = (
+    'age', 'edu', 'gen_exp', 'fr_l', 'fr_s', 'fr_r', 'fr_w',
+    'diag', 'prim_occ_exp', 'qc_exp', 'vjo', 'auth', 'qc_dip',
+    'out_res', 'out_work', 'out_study',
+    'spouse', 'sp_age', 'sp_edu', 'sp_qc_exp',
+    'sp_fr_l', 'sp_fr_s', 'sp_fr_r', 'sp_fr_w',
+    'family',
+)
+
+def _column(profiles, key):
+    return np.asarray(profiles[key])
+
+def _month_idx(months, table):
+    # Negative months fall on month 0, which is worth 0 in every band table
+    return np.clip(np.asarray(months), 0, table.shape[-1] - 1).astype(np.int64)
+
+def _level_idx(levels, table):
+    return np.clip(np.asarray(levels), 0, table.shape[-1] - 1).astype(np.int64)
+
+def _age_batch(table, ages):
+    ages = np.asarray(ages)
+    inside = (ages >= 0) & (ages < table.shape[-1])
+    return np.where(inside, table[np.where(inside, ages, 0).astype(np.int64)], 0)
+
+def _code_batch(values, codes):
+    # Integer columns already hold codes (ProfileBatch); strings are mapped.
+    # Unknown keys map to the last slot of the keyed table (0 points).
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.integer):
+        return np.where((values >= 0) & (values < len(codes)), values, len(codes)).astype(np.int64)
+    return pd.Series(values, dtype=object).map(codes).fillna(len(codes)).to_numpy(dtype=np.int64)
+
+def calculate_scores(profiles, as_of=None):
+    """
+    Batch Scoring Engine.
+    Input: DataFrame, dict of arrays or ProfileBatch with the same keys as the
+    profile dict, optional 'as_of' date selecting the grid version.
+    Output: dict of arrays -> 'total' plus every audit key of calculate_score.
+    Spouse-only components are 0 for single applicants.
+    """
+    g = get_grid(as_of)
+    A = g.arrays
+    spouse = _column(profiles, 'spouse').astype(bool)
+    s = spouse.astype(np.int64)
+    audit = {}
 
-    audit['out_res_pts'] = pts_out_res
-    audit['out_work_pts'] = pts_out_work
-    audit['out_study_pts'] = pts_out_study
+    # --- 1. HUMAN CAPITAL ---
+    for skill in ('l', 's', 'r', 'w'):
+        audit[f'fr_{skill}_pts'] = A['fr'][s, _level_idx(_column(profiles, f'fr_{skill}'), A['fr'])]
+    audit['hc_french'] = audit['fr_l_pts'] + audit['fr_s_pts'] + audit['fr_r_pts'] + audit['fr_w_pts']
 
-    qn_out = pts_out_res + pts_out_work + pts_out_study
-    audit['qn_out'] = qn_out
-    qn += qn_out
+    ages = _column(profiles, 'age')
+    audit['hc_age'] = np.where(spouse, _age_batch(A['age'][1], ages), _age_batch(A['age'][0], ages))
 
-    qn_vjo = 50 if p['vjo'] == 'Outside Montreal' else (30 if p['vjo'] == 'Inside Montreal' else 0)
-    audit['qn_vjo'] = qn_vjo
-    qn += qn_vjo
+    audit['hc_exp'] = A['exp'][s, _month_idx(_column(profiles, 'gen_exp'), A['exp'])]
+    audit['hc_edu'] = A['edu'][s, _code_batch(_column(profiles, 'edu'), EDU_CODES)]
 
-    qn_auth = 50 if p['auth'] else 0
-    audit['qn_auth'] = qn_auth
-    qn += qn_auth
+    hc = audit['hc_french'] + audit['hc_age'] + audit['hc_exp'] + audit['hc_edu']
+    audit['total_hc'] = np.minimum(hc, g.cap_hc)
 
-    final_qn = min(qn, 700)
-    audit['total_qn'] = final_qn
+    # --- 2. QUEBEC NEEDS ---
+    diag = _code_batch(_column(profiles, 'diag'), DIAG_CODES)
+    audit['qn_diag'] = A['diag'][diag, _month_idx(_column(profiles, 'prim_occ_exp'), A['diag'])]
+    audit['qn_qc_exp'] = A['qc_exp'][_month_idx(_column(profiles, 'qc_exp'), A['qc_exp'])]
+    audit['qn_dip'] = A['qc_dip'][_code_batch(_column(profiles, 'qc_dip'), QC_DIP_CODES)]
 
-    # --- 3. ADAPTATION ---
-    ad = 0
-    ad_fam = 10 if p['family'] else 0
-    audit['ad_fam'] = ad_fam
-    ad += ad_fam
+    audit['out_res_pts'] = A['out_res'][_month_idx(_column(profiles, 'out_res'), A['out_res'])]
+    audit['out_work_pts'] = A['out_work'][_month_idx(_column(profiles, 'out_work'), A['out_work'])]
+    audit['out_study_pts'] = A['out_study'][_month_idx(_column(profiles, 'out_study'), A['out_study'])]
+    audit['qn_out'] = audit['out_res_pts'] + audit['out_work_pts'] + audit['out_study_pts']
 
-    if spouse:
-        def get_sp_fr_pts(lvl):
-            if lvl >= 9: return 10
-            if lvl >= 7: return 8
-            if lvl >= 5: return 6
-            if lvl == 4: return 4
-            return 0
-        sp_fr = sum([get_sp_fr_pts(p[k]) for k in ['sp_fr_l', 'sp_fr_s', 'sp_fr_r', 'sp_fr_w']])
-        audit['ad_fr'] = sp_fr
-        ad += sp_fr
+    audit['qn_vjo'] = A['vjo'][_code_batch(_column(profiles, 'vjo'), VJO_CODES)]
+    audit['qn_auth'] = np.where(_column(profiles, 'auth').astype(bool), g.auth, 0)
 
-        # Spouse Age
-        sp_age_pts = SP_AGE_ADAPT.get(p['sp_age'], 0)
-        audit['ad_age'] = sp_age_pts
-        ad += sp_age_pts
+    qn = (audit['qn_diag'] + audit['qn_qc_exp'] + audit['qn_dip']
+          + audit['qn_out'] + audit['qn_vjo'] + audit['qn_auth'])
+    audit['total_qn'] = np.minimum(qn, g.cap_qn)
 
-        # Spouse QC Work
-        sp_qc_pts = band_points(p['sp_qc_exp'], SP_QC_EXP_TABLE)
-        audit['ad_exp'] = sp_qc_pts
-        ad += sp_qc_pts
+    # --- 3. ADAPTATION ---
+    audit['ad_fam'] = np.where(_column(profiles, 'family').astype(bool), g.family, 0)
 
-        # Spouse Edu
-        sp_edu_pts = EDU_SPOUSE_UI.get(p['sp_edu'], 0)
-        audit['ad_edu'] = sp_edu_pts
-        ad += sp_edu_pts
+    sp_fr = sum(A['sp_fr'][_level_idx(_column(profiles, k), A['sp_fr'])] for k in ['sp_fr_l', 'sp_fr_s', 'sp_fr_r', 'sp_fr_w'])
+    audit['ad_fr'] = np.where(spouse, sp_fr, 0)
+    audit['ad_age'] = np.where(spouse, _age_batch(A['sp_age'], _column(profiles, 'sp_age')), 0)
+    audit['ad_exp'] = np.where(spouse, A['sp_qc_exp'][_month_idx(_column(profiles, 'sp_qc_exp'), A['sp_qc_exp'])], 0)
+    audit['ad_edu'] = np.where(spouse, A['sp_edu'][_code_batch(_column(profiles, 'sp_edu'), SP_EDU_CODES)], 0)
 
-    final_ad = min(ad, 180)
-    audit['total_ad'] = final_ad
+    ad = audit['ad_fam'] + audit['ad_fr'] + audit['ad_age'] + audit['ad_exp'] + audit['ad_edu']
+    audit['total_ad'] = np.minimum(ad, g.cap_ad)
 
-    return final_hc + final_qn + final_ad, audit
+    audit['total'] = audit['total_hc'] + audit['total_qn'] + audit['total_ad']
+    return audit
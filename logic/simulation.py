@@ -0,0 +1,254 @@
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+import logic.scoring as scoring
+from logic.eligibility import eligible_mask
+from logic.grid import get_grid, VJO_KEYS, QC_DIP_KEYS, DIAG_KEYS
+from logic.profile import INT_FIELDS, ProfileBatch, to_code
+from logic.timeline import time_travel_changes
+
+# --- HEADLESS SIMULATION KERNEL ---
+# The simulator heatmap without Streamlit: every cell is the profile with one
+# value per axis applied, scored and flagged. Results are plain NumPy arrays
+# (rows = y values, columns = x values) so batch jobs and benchmarks can use it.
+
+TIME_AXIS = 'time_travel'
+
+def clean_int(val):
+    """Form value -> int (None, blanks and non-numeric text count as 0)."""
+    if val is None: return 0
+    if isinstance(val, (int, float)): return int(val)
+    if isinstance(val, str):
+        val = val.strip()
+        if not val: return 0
+        if not val.isnumeric(): return 0
+    return int(float(val))
+
+def clean_profile(p):
+    """Copy of `p` with every numeric field coerced by clean_int."""
+    return {**p, **{k: clean_int(p.get(k, 0)) for k in INT_FIELDS}}
+
+def peq_mask(batch):
+    """PEQ threshold (>= 24 months in Quebec, oral French >= 7) for every row of a ProfileBatch (or dict of arrays)."""
+    return eligible_mask(batch, 'peq')
+
+@lru_cache(maxsize=8)
+def _month_dates(year, month, n):
+    labels = []
+    for m in range(n):
+        y, mo = divmod(month - 1 + m, 12)
+        labels.append(date(year + y, mo + 1, 1).strftime("%b %Y"))
+    return np.array(labels, dtype=object)
+
+def month_dates(n, start=None):
+    """Labels like "Nov 2026" for 0..n-1 months after `start` (default today)."""
+    start = start or date.today()
+    return _month_dates(start.year, start.month, n)
+
+# --- SCENARIO AXES ---
+# Each axis is a transform of the starting profile, applied to whole
+# ProfileBatch columns. Every sweep axis also gets a leading KEEP entry
+# (profile unchanged), so one cube holds every lower-dimensional view.
+
+KEEP = None
+
+def _time_travel(batch, base, col):
+    # KEEP (-1) is the same as 0 months
+    for field, v in time_travel_changes(base, np.maximum(col, 0)).items():
+        batch[field] = v
+
+def _set_fields(*fields):
+    def apply(batch, base, col):
+        for field in fields:
+            batch[field] = np.where(col < 0, batch[field], col)
+    return apply
+
+FR_LEVELS = [4, 5, 6, 7, 8, 9, 10, 12]
+OUT_MONTHS = [0, 6, 12, 24, 36, 48]
+FR = ('fr_l', 'fr_s', 'fr_r', 'fr_w')
+SP_FR = ('sp_fr_l', 'sp_fr_s', 'sp_fr_r', 'sp_fr_w')
+TIME_FIELDS = ('age', 'gen_exp', 'prim_occ_exp', 'qc_exp', 'sp_age', 'sp_qc_exp', 'out_res', 'out_work')
+
+# axis -> (default values, apply(batch, base, column), keyed field or None,
+# fields written). Keyed values are profile keys; columns hold their codes.
+# Axes are applied in this order, time travel first.
+AXES = {
+    TIME_AXIS: ([0, 6, 12, 18, 24, 30, 36, 48, 60], _time_travel, None, TIME_FIELDS),
+    'fr_target': (FR_LEVELS, _set_fields(*FR), None, FR),
+    'fr_l_target': (FR_LEVELS, _set_fields('fr_l'), None, ('fr_l',)),
+    'fr_s_target': (FR_LEVELS, _set_fields('fr_s'), None, ('fr_s',)),
+    'fr_r_target': (FR_LEVELS, _set_fields('fr_r'), None, ('fr_r',)),
+    'fr_w_target': (FR_LEVELS, _set_fields('fr_w'), None, ('fr_w',)),
+    'sp_fr_target': (FR_LEVELS, _set_fields(*SP_FR), None, SP_FR),
+    'out_res_target': (OUT_MONTHS, _set_fields('out_res'), None, ('out_res',)),
+    'out_work_target': (OUT_MONTHS, _set_fields('out_work'), None, ('out_work',)),
+    'out_study_target': (OUT_MONTHS, _set_fields('out_study'), None, ('out_study',)),
+    'vjo_target': (list(VJO_KEYS), _set_fields('vjo'), 'vjo', ('vjo',)),
+    'qc_dip_target': (list(QC_DIP_KEYS), _set_fields('qc_dip'), 'qc_dip', ('qc_dip',)),
+    'diag_target': (list(DIAG_KEYS), _set_fields('diag'), 'diag', ('diag',)),
+}
+
+# Fields scored together by one grid factor (shortage points read both)
+JOINT_FIELDS = (('diag', 'prim_occ_exp'),)
+
+def axis_range(key):
+    """Default sample values for a simulator axis."""
+    return list(AXES[key][0]) if key in AXES else []
+
+def _encode(key, values):
+    field = AXES[key][2]
+    return np.array([-1 if v is KEEP else (to_code(field, v) if field else v) for v in values], dtype=np.int64)
+
+def _apply_axes(base, axes, axis_values):
+    """ProfileBatch with one row per cell of the product of `axis_values` (row-major)."""
+    shape = tuple(len(v) for v in axis_values)
+    cells = np.indices(shape).reshape(len(axes), -1)
+    columns = {k: _encode(k, v)[cells[d]] for d, (k, v) in enumerate(zip(axes, axis_values))}
+    batch = ProfileBatch.repeat(base, cells.shape[1])
+    for key in AXES:
+        if key in columns:
+            AXES[key][1](batch, base, columns[key])
+    return batch
+
+def _factor_fields(key):
+    fields = set(AXES[key][3])
+    for joint in JOINT_FIELDS:
+        if fields & set(joint):
+            fields |= set(joint)
+    return fields
+
+def separable_groups(axes):
+    """
+    Partition axis positions into groups that touch disjoint grid factors.
+    Axes in different groups add independent points to each category.
+    """
+    groups = []
+    for d, key in enumerate(axes):
+        fields = _factor_fields(key)
+        merged = [g for g in groups if g[1] & fields]
+        for g in merged:
+            groups.remove(g)
+        groups.append((sorted([d] + [i for g in merged for i in g[0]]),
+                       fields.union(*(g[1] for g in merged))))
+    return [dims for dims, _ in sorted(groups)]
+
+def _separable(base, axes, axis_values, as_of):
+    """
+    Total score and the peq/age fields over the full product, from one small
+    batch per group of coupled axes: per-category point deltas are combined
+    by broadcast outer sums and capped with np.minimum at the end.
+    """
+    g = get_grid(as_of)
+    shape = tuple(len(v) for v in axis_values)
+    base_raw = scoring.raw_totals(scoring.calculate_score(base, as_of, compact=True)[1])
+    raw = [np.int64(r) for r in base_raw]
+    fields = {f: np.int64(base[f]) for f in ('age', 'qc_exp', 'fr_l', 'fr_s')}
+
+    for dims in separable_groups(axes):
+        sub_shape = tuple(shape[d] if d in dims else 1 for d in range(len(shape)))
+        batch = _apply_axes(base, [axes[d] for d in dims], [axis_values[d] for d in dims])
+        audit = scoring.calculate_scores(batch, as_of)
+        for c, (r, b) in enumerate(zip(scoring.raw_totals(audit), base_raw)):
+            raw[c] = raw[c] + (r - b).reshape(sub_shape)
+        written = set().union(*(AXES[axes[d]][3] for d in dims))
+        for f in fields:
+            if f in written:
+                fields[f] = fields[f] + (batch[f].astype(np.int64) - base[f]).reshape(sub_shape)
+
+    caps = (g.cap_hc, g.cap_qn, g.cap_ad)
+    total = sum(np.minimum(r, cap) for r, cap in zip(raw, caps))
+    return np.broadcast_to(total, shape), {f: np.broadcast_to(v, shape) for f, v in fields.items()}
+
+def sweep(profile, axes, values=None, as_of=None, start=None, separable=True):
+    """
+    Score the Cartesian product of several scenario axes.
+    `values` optionally overrides the sample values per axis. Returns a dict:
+    'axes', 'values' (per axis, KEEP first) and N-D arrays 'score', 'age',
+    'months', 'peq', 'date' with one dimension per axis, in `axes` order.
+    With `separable` (default) axes touching different grid factors are scored
+    separately and combined by outer sums; otherwise every cell is scored.
+    """
+    axes = tuple(axes)
+    if len(set(axes)) != len(axes):
+        raise ValueError(f"Duplicate sweep axes: {axes}")
+    values = values or {}
+    axis_values = [[KEEP] + list(values.get(k, axis_range(k))) for k in axes]
+    shape = tuple(len(v) for v in axis_values)
+    base = clean_profile(profile)
+
+    if separable:
+        score, fields = _separable(base, axes, axis_values, as_of)
+    else:
+        batch = _apply_axes(base, axes, axis_values)
+        score = scoring.calculate_scores(batch, as_of)['total'].reshape(shape)
+        fields = {f: batch[f].astype(np.int64).reshape(shape) for f in ('age', 'qc_exp', 'fr_l', 'fr_s')}
+
+    if TIME_AXIS in axes:
+        d = axes.index(TIME_AXIS)
+        months = np.maximum(_encode(TIME_AXIS, axis_values[d]), 0)
+        months = np.broadcast_to(months.reshape([-1 if i == d else 1 for i in range(len(axes))]), shape)
+    else:
+        months = np.zeros(shape, dtype=np.int64)
+    return {
+        'axes': axes, 'values': axis_values,
+        'score': score,
+        'age': fields['age'],
+        'months': months,
+        'peq': peq_mask(fields),
+        'date': month_dates(int(months.max(initial=0)) + 1, start)[months],
+    }
+
+CUBE_ARRAYS = ('score', 'age', 'months', 'peq', 'date')
+
+def _cube_index(cube, shown, fixed):
+    # Shown axes drop their KEEP entry; other axes sit at their fixed value (default KEEP)
+    fixed = fixed or {}
+    index = []
+    for key, vals in zip(cube['axes'], cube['values']):
+        index.append(slice(1, None) if key in shown else vals.index(fixed.get(key, KEEP)))
+    return tuple(index)
+
+def slice_grid(cube, x_axis, y_axis, fixed=None):
+    """2-D view of a sweep cube in simulate_grid's format (rows = y, columns = x)."""
+    index = _cube_index(cube, (x_axis, y_axis), fixed)
+    transpose = cube['axes'].index(y_axis) > cube['axes'].index(x_axis)
+    grid = {
+        'x': np.array(cube['values'][cube['axes'].index(x_axis)][1:]),
+        'y': np.array(cube['values'][cube['axes'].index(y_axis)][1:]),
+    }
+    for name in CUBE_ARRAYS:
+        view = cube[name][index]
+        grid[name] = view.T if transpose else view
+    return grid
+
+def slice_curve(cube, axis, fixed=None):
+    """1-D view of a sweep cube along one axis: 'x' plus the per-value arrays."""
+    index = _cube_index(cube, (axis,), fixed)
+    curve = {'x': np.array(cube['values'][cube['axes'].index(axis)][1:])}
+    for name in CUBE_ARRAYS:
+        curve[name] = cube[name][index]
+    return curve
+
+def simulate_grid(profile, x_axis, y_axis, x_values=None, y_values=None, as_of=None, start=None):
+    """
+    Score every (y, x) cell of a two-axis scenario grid.
+    Returns a dict of arrays shaped (len(y), len(x)): 'score', 'age', 'months'
+    (months in the future), 'peq' (bool) and 'date' (month labels), plus the
+    axis values 'x' and 'y'.
+    """
+    values = {}
+    if x_values is not None: values[x_axis] = x_values
+    if y_values is not None: values[y_axis] = y_values
+    cube = sweep(profile, (y_axis, x_axis), values, as_of, start)
+    return slice_grid(cube, x_axis, y_axis)
+
+def milestone_ranges(grid, milestones=(12, 24, 36, 48, 60)):
+    """[(month, lowest score, highest score)] over the cells at each milestone month."""
+    ranges = []
+    for m in milestones:
+        at_m = grid['score'][grid['months'] == m]
+        if at_m.size:
+            ranges.append((m, int(at_m.min()), int(at_m.max())))
+    return ranges
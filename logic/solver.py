@@ -0,0 +1,243 @@
+import logic.scoring as scoring
+from logic.grid import get_grid
+
+# --- INVERSE SOLVER ---
+# "What is the least I need to do to reach N points?"
+# Each lever (French per skill, months in the main occupation, VJO, Québec
+# diploma, regional ties, licence, spouse French) touches its own set of grid
+# factors, so a plan's score is exactly
+#     sum over categories of min(cap, base_raw + sum of lever deltas)
+# which lets branch-and-bound prune with per-category cap bounds instead of
+# enumerating every combination.
+
+# Effort costs (roughly "months of effort"); override per call with `costs`.
+DEFAULT_COSTS = {
+    'fr_level': 2,          # per French level gained, per skill
+    'sp_fr_level': 2,       # same, spouse
+    'month': 1,             # per extra month worked in the main occupation
+    'out_month': 1,         # per month of residence/work/study outside the CMM
+    'vjo': {'Inside Montreal': 6, 'Outside Montreal': 6},
+    'auth': 12,
+    'qc_dip': {
+        'PhD': 48, 'MedSpec': 60, 'Masters 2y': 24, 'Masters 1y': 12,
+        'Bach 5y': 60, 'Bach 3y': 36, 'Bach 2y': 24, 'Bach 1y': 12,
+        'Tech 3y': 36, 'Tech 900h': 12, 'College Gen': 24,
+        'DEP 900h': 12, 'DEP 600h': 8, 'HS': 12,
+    },
+}
+
+LEVERS = (
+    'fr_l', 'fr_s', 'fr_r', 'fr_w', 'months', 'vjo', 'qc_dip',
+    'out_res', 'out_work', 'out_study', 'auth',
+    'sp_fr_l', 'sp_fr_s', 'sp_fr_r', 'sp_fr_w',
+)
+
+MAX_MONTHS = 60
+
+def _steps(table, current, horizon):
+    """Values above `current` (up to `horizon`) where `table` changes points."""
+    top = len(table) - 1
+    start = max(int(current), 0)
+    return [v for v in range(start + 1, min(top, horizon) + 1) if table[v] != table[v - 1]]
+
+def _months_changes(p, m):
+    years = m // 12
+    changes = {
+        'gen_exp': p['gen_exp'] + m,
+        'prim_occ_exp': p['prim_occ_exp'] + m,
+        'qc_exp': p['qc_exp'] + m,
+        'age': p['age'] + years,
+    }
+    if p['spouse']:
+        changes['sp_age'] = p['sp_age'] + years
+        changes['sp_qc_exp'] = p['sp_qc_exp'] + m
+    return changes
+
+def _lever_options(p, lever, g, costs, max_months):
+    """[(cost, changes)] for one lever, excluding the no-change option."""
+    options = []
+    if lever in ('fr_l', 'fr_s', 'fr_r', 'fr_w'):
+        table = g.fr[1 if p['spouse'] else 0]
+        for lvl in _steps(table, p[lever], len(table) - 1):
+            options.append(((lvl - p[lever]) * costs['fr_level'], {lever: lvl}))
+
+    elif lever in ('sp_fr_l', 'sp_fr_s', 'sp_fr_r', 'sp_fr_w'):
+        if p['spouse']:
+            for lvl in _steps(g.sp_fr, p[lever], len(g.sp_fr) - 1):
+                options.append(((lvl - p[lever]) * costs['sp_fr_level'], {lever: lvl}))
+
+    elif lever == 'months':
+        # Only months where some band (or a birthday) moves can change the score
+        tables = [(g.exp[1 if p['spouse'] else 0], 'gen_exp'), (g.qc_exp, 'qc_exp'),
+                  (g.diag[scoring.DIAG_CODES.get(p['diag'], -1)], 'prim_occ_exp')]
+        if p['spouse']:
+            tables.append((g.sp_qc_exp, 'sp_qc_exp'))
+        breaks = set(range(12, max_months + 1, 12))
+        for table, key in tables:
+            breaks.update(v - int(p[key]) for v in _steps(table, p[key], int(p[key]) + max_months))
+        for m in sorted(b for b in breaks if 0 < b <= max_months):
+            options.append((m * costs['month'], _months_changes(p, m)))
+
+    elif lever in ('out_res', 'out_work', 'out_study'):
+        table = getattr(g, lever)
+        for v in _steps(table, p[lever], int(p[lever]) + max_months):
+            options.append(((v - p[lever]) * costs['out_month'], {lever: v}))
+
+    elif lever == 'vjo':
+        for key, cost in costs['vjo'].items():
+            if key != p['vjo']:
+                options.append((cost, {'vjo': key}))
+
+    elif lever == 'qc_dip':
+        for key, cost in costs['qc_dip'].items():
+            if key != p['qc_dip']:
+                options.append((cost, {'qc_dip': key}))
+
+    elif lever == 'auth':
+        if not p['auth']:
+            options.append((costs['auth'], {'auth': True}))
+
+    return options
+
+def _prune_dominated(options):
+    """Drop options that cost at least as much as another and gain no more anywhere."""
+    options = sorted(options, key=lambda o: (o[0], [-d for d in o[1]]))
+    kept = []
+    for cost, delta, changes in options:
+        if any(all(kd >= d for kd, d in zip(k[1], delta)) for k in kept):
+            continue
+        kept.append((cost, delta, changes))
+    return kept
+
+def solve(p, target, levers=LEVERS, costs=None, max_months=MAX_MONTHS, as_of=None):
+    """
+    Cheapest set of changes that lifts profile `p` to `target` points.
+    Returns a dict: reachable, cost, score, changes (one entry per lever used:
+    {'lever', 'cost', 'set'}), profile (the resulting dict); when the target is
+    out of reach, 'max_score' is the best score the levers allow.
+    """
+    g = get_grid(as_of)
+    costs = {**DEFAULT_COSTS, **(costs or {})}
+    p = dict(p)
+    caps = (g.cap_hc, g.cap_qn, g.cap_ad)
+
+    base_score, base_audit = scoring.calculate_score(p, as_of, compact=True)
+    base = scoring.raw_totals(base_audit)
+
+    # Per-lever options as exact per-category deltas
+    lever_opts = []
+    for lever in levers:
+        opts = []
+        for cost, changes in _lever_options(p, lever, g, costs, max_months):
+            _, audit = scoring.calculate_score({**p, **changes}, as_of, compact=True)
+            delta = tuple(r - b for r, b in zip(scoring.raw_totals(audit), base))
+            if any(d > 0 for d in delta):
+                opts.append((cost, delta, changes))
+        if opts:
+            lever_opts.append((lever, _prune_dominated(opts)))
+
+    # Levers that can cost points (ageing in 'months') go first; after them
+    # every delta is >= 0, so category sums can be clipped at the caps and
+    # equivalent states merged. Then biggest potential first: tighter bounds early.
+    def signature(opts):
+        return [(o[0], o[1]) for o in opts]
+
+    lever_opts.sort(key=lambda lo: (
+        not any(d < 0 for o in lo[1] for d in o[1]), -max(sum(o[1]) for o in lo[1]), signature(lo[1])))
+    n = len(lever_opts)
+    # Interchangeable levers (e.g. four French skills at the same level) are
+    # adjacent after sorting; picking non-decreasing option indices across a
+    # run of them visits each multiset of choices once.
+    same_as_prev = [i > 0 and signature(lever_opts[i][1]) == signature(lever_opts[i - 1][1]) for i in range(n)]
+    clip_from = sum(1 for _, opts in lever_opts if any(d < 0 for o in opts for d in o[1]))
+
+    # suffix_gain[i][c] = best positive gain in category c from levers i..n-1
+    suffix_gain = [(0, 0, 0)] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        top = [max(0, max(o[1][c] for o in lever_opts[i][1])) for c in range(3)]
+        suffix_gain[i] = tuple(t + s for t, s in zip(top, suffix_gain[i + 1]))
+
+    # Cost lower bound: each remaining lever buys at most its best points gain,
+    # at no better than its best points-per-cost ratio (fractional knapsack).
+    def gain(opt):
+        return sum(d for d in opt[1] if d > 0)
+
+    def ratio(opt):
+        return gain(opt) / opt[0] if opt[0] > 0 else float('inf')
+
+    lever_rates = [(max(ratio(o) for o in opts), max(gain(o) for o in opts)) for _, opts in lever_opts]
+    suffix_rates = [sorted(lever_rates[i:], reverse=True) for i in range(n + 1)]
+
+    def min_cost(i, needed):
+        cost = 0
+        for rate, most in suffix_rates[i]:
+            take = min(most, needed)
+            if rate != float('inf'):
+                cost += take / rate
+            needed -= take
+            if needed <= 0:
+                return cost
+        return float('inf')
+
+    def capped(raw):
+        return sum(min(cap, r) for cap, r in zip(caps, raw))
+
+    max_score = capped(tuple(b + s for b, s in zip(base, suffix_gain[0])))
+    best = {'cost': None, 'picks': None}
+    # (lever index, clipped sums) -> cheapest cost that reached it
+    seen = {}
+
+    def search(i, cost, raw, picks, prev=0):
+        if best['cost'] is not None and cost >= best['cost']:
+            return
+        first = prev if i < n and same_as_prev[i] else 0
+        if i >= clip_from:
+            raw = tuple(min(cap, r) for cap, r in zip(caps, raw))
+            state = (i, raw, first)
+            if seen.get(state, float('inf')) <= cost:
+                return
+            seen[state] = cost
+        score = capped(raw)
+        if score >= target:
+            best['cost'], best['picks'] = cost, list(picks)
+            return
+        if i == n:
+            return
+        if capped(tuple(r + s for r, s in zip(raw, suffix_gain[i]))) < target:
+            return
+        if best['cost'] is not None and cost + min_cost(i, target - score) >= best['cost']:
+            return
+        lever, opts = lever_opts[i]
+        for k in range(first, len(opts)):
+            opt = opts[k]
+            picks.append((lever, opt))
+            search(i + 1, cost + opt[0], tuple(r + d for r, d in zip(raw, opt[1])), picks, k)
+            picks.pop()
+        search(i + 1, cost, raw, picks, len(opts))
+
+    # Greedy plan (best points-per-cost option of each lever) as first incumbent
+    raw, cost, picks = base, 0, []
+    for lever, opts in sorted(lever_opts, key=lambda lo: -max(ratio(o) for o in lo[1])):
+        if capped(raw) >= target:
+            break
+        opt = max(opts, key=ratio)
+        raw = tuple(r + d for r, d in zip(raw, opt[1]))
+        cost += opt[0]
+        picks.append((lever, opt))
+    if capped(raw) >= target:
+        best['cost'], best['picks'] = cost, picks
+
+    search(0, 0, base, [])
+
+    if best['picks'] is None:
+        return {'reachable': False, 'cost': None, 'score': base_score,
+                'changes': [], 'profile': p, 'max_score': max_score}
+
+    result = dict(p)
+    changes = []
+    for lever, (cost, _, sets) in best['picks']:
+        result.update(sets)
+        changes.append({'lever': lever, 'cost': cost, 'set': sets})
+    score = scoring.score_total(result, as_of)
+    return {'reachable': True, 'cost': best['cost'], 'score': score,
+            'changes': changes, 'profile': result, 'max_score': max_score}
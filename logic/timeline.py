@@ -0,0 +1,100 @@
+from bisect import bisect_right
+
+import numpy as np
+
+import logic.scoring as scoring
+from logic.grid import get_grid
+
+# --- EXACT SCORE TIMELINE ---
+# Under "time travel" every factor is piecewise-constant in months: experience
+# bands step at their band edges, ages drop on birthdays (every 12 months).
+# So the score only needs computing at the months where some factor changes
+# band; between two breakpoints it is flat.
+
+HORIZON = 60
+
+def time_travel_changes(p, months):
+    """
+    Fields of `p` that change after `months` more months in the current job
+    (same rules as the simulator). `months` may be an int or an array.
+    """
+    years = months // 12
+    changes = {
+        'age': p['age'] + years,
+        'gen_exp': p['gen_exp'] + months,
+        'prim_occ_exp': p['prim_occ_exp'] + months,
+        'qc_exp': p['qc_exp'] + months,
+    }
+    if p['spouse']:
+        changes['sp_age'] = p['sp_age'] + years
+        changes['sp_qc_exp'] = p['sp_qc_exp'] + months
+    # Regional ties only keep growing if the applicant already has them
+    if p['out_res'] > 0: changes['out_res'] = p['out_res'] + months
+    if p['out_work'] > 0: changes['out_work'] = p['out_work'] + months
+    return changes
+
+def time_travel(p, months):
+    """Profile `p` after `months` more months in the current job."""
+    return {**p, **time_travel_changes(p, months)}
+
+def _month_steps(table, start, horizon):
+    """Months m in 1..horizon where month_points(table, start + m) changes."""
+    steps = []
+    for m in range(1, horizon + 1):
+        if start + m - 1 >= len(table):
+            break  # clamped at the open-ended top band from here on
+        if scoring.month_points(table, start + m) != scoring.month_points(table, start + m - 1):
+            steps.append(m)
+    return steps
+
+def _birthday_steps(table, age, horizon):
+    """Months (multiples of 12) where a birthday changes age_points(table, ...)."""
+    return [12 * k for k in range(1, horizon // 12 + 1)
+            if scoring.age_points(table, age + k) != scoring.age_points(table, age + k - 1)]
+
+def breakpoints(p, horizon=HORIZON, as_of=None):
+    """Sorted months in 0..horizon where the time-travelled score can change (0 included)."""
+    g = get_grid(as_of)
+    s = 1 if p['spouse'] else 0
+    months = {0}
+    months.update(_month_steps(g.exp[s], p['gen_exp'], horizon))
+    months.update(_month_steps(g.diag[scoring.DIAG_CODES.get(p['diag'], -1)], p['prim_occ_exp'], horizon))
+    months.update(_month_steps(g.qc_exp, p['qc_exp'], horizon))
+    months.update(_birthday_steps(g.age[s], p['age'], horizon))
+    if p['out_res'] > 0: months.update(_month_steps(g.out_res, p['out_res'], horizon))
+    if p['out_work'] > 0: months.update(_month_steps(g.out_work, p['out_work'], horizon))
+    if p['spouse']:
+        months.update(_birthday_steps(g.sp_age, p['sp_age'], horizon))
+        months.update(_month_steps(g.sp_qc_exp, p['sp_qc_exp'], horizon))
+    return sorted(months)
+
+def score_timeline(p, horizon=HORIZON, as_of=None):
+    """
+    Exact month-by-month score of `p` over 0..horizon months of time travel.
+    Returns a dict: 'months' (breakpoints), 'scores' (score from each
+    breakpoint until the next) and 'curve' (one score per month, length horizon+1).
+    """
+    months = breakpoints(p, horizon, as_of)
+    scores = [scoring.score_total(time_travel(p, m), as_of) for m in months]
+    lengths = np.diff(months + [horizon + 1])
+    return {
+        'months': months,
+        'scores': scores,
+        'curve': np.repeat(np.array(scores, dtype=np.int64), lengths),
+    }
+
+def first_month_reaching(timeline, target):
+    """First month whose score is >= target, or None within the horizon."""
+    for m, score in zip(timeline['months'], timeline['scores']):
+        if score >= target:
+            return m
+    return None
+
+def score_at(timeline, month):
+    """Score after `month` months (month must be within the timeline horizon)."""
+    return timeline['scores'][bisect_right(timeline['months'], month) - 1]
+
+def peak(timeline):
+    """(month, score) of the first month reaching the timeline's best score."""
+    best = max(timeline['scores'])
+    return timeline['months'][timeline['scores'].index(best)], best
@@ -1,13 +1,17 @@
 import streamlit as st
+import logic.scoring as scoring
+from logic.grid import get_grid
 
 def render(p, total, audit, t):
     """
     Renders the Dashboard Tab.
     p: Profile dictionary
     total: Total score (int)
-    audit: Audit dictionary (breakdown)
+    audit: Audit breakdown (compact scoring.Audit or dictionary)
     t: Translation helper function
     """
+    if isinstance(audit, scoring.Audit):
+        audit = audit.to_dict()
 
     # 1. COMPACT SCORE BANNER
     color = "green" if total >= 590 else "#d9534f"
@@ -20,24 +24,23 @@ def render(p, total, audit, t):
         </div>
     """, unsafe_allow_html=True)
 
-    # 2. CALCULATE DYNAMIC MAX SCORES (Local logic for display bars)
+    # 2. MAX SCORES (read from the scoring grid in force)
     is_spouse = p['spouse']
+    mx = get_grid().maxima(is_spouse)
 
     # Human Capital Max
-    m_age = 100 if is_spouse else 120
-    m_edu = 110 if is_spouse else 130
-    m_exp = 50 if is_spouse else 70
-    m_fr_skill = 40 if is_spouse else 50
-    m_fr_total = m_fr_skill * 4
+    m_age, m_edu, m_exp = mx['hc_age'], mx['hc_edu'], mx['hc_exp']
+    m_fr_skill = mx['fr_l_pts']
+    m_fr_total = mx['hc_french']
 
     # Quebec Needs Max
-    m_diag, m_qc_exp, m_qc_dip = 120, 160, 200
-    m_vjo, m_auth = 50, 50
-    m_reg_res, m_reg_work, m_reg_study = 40, 60, 20
+    m_diag, m_qc_exp, m_qc_dip = mx['qn_diag'], mx['qn_qc_exp'], mx['qn_dip']
+    m_vjo, m_auth = mx['qn_vjo'], mx['qn_auth']
+    m_reg_res, m_reg_work, m_reg_study = mx['out_res_pts'], mx['out_work_pts'], mx['out_study_pts']
 
     # Adaptation Max
-    m_sp_fr, m_sp_age, m_sp_exp, m_sp_edu = 40, 20, 30, 20
-    m_fam = 10
+    m_sp_fr, m_sp_age, m_sp_exp, m_sp_edu = mx['ad_fr'], mx['ad_age'], mx['ad_exp'], mx['ad_edu']
+    m_fam = mx['ad_fam']
 
     # Helper for rows
     def show_row(label, score, max_score, help_key=None):
@@ -50,7 +53,7 @@ def render(p, total, audit, t):
     # --- HUMAN CAPITAL ---
     with col_hc:
         st.markdown(f"### {t('hc')}")
-        st.markdown(f"<h3 style='color:#444; margin-top:-10px;'>{audit['total_hc']} <span style='font-size:1rem; color:#888'>/ 520</span></h3>", unsafe_allow_html=True)
+        st.markdown(f"<h3 style='color:#444; margin-top:-10px;'>{audit['total_hc']} <span style='font-size:1rem; color:#888'>/ {mx['total_hc']}</span></h3>", unsafe_allow_html=True)
         st.markdown("---")
 
         show_row(t('age'), audit['hc_age'], m_age, 'tip_age')
@@ -66,7 +69,7 @@ def render(p, total, audit, t):
     # --- QUEBEC NEEDS ---
     with col_qn:
         st.markdown(f"### {t('qn')}")
-        st.markdown(f"<h3 style='color:#444; margin-top:-10px;'>{audit['total_qn']} <span style='font-size:1rem; color:#888'>/ 700</span></h3>", unsafe_allow_html=True)
+        st.markdown(f"<h3 style='color:#444; margin-top:-10px;'>{audit['total_qn']} <span style='font-size:1rem; color:#888'>/ {mx['total_qn']}</span></h3>", unsafe_allow_html=True)
         st.markdown("---")
 
         show_row(t('shortage'), audit['qn_diag'], m_diag, 'tip_diag')
@@ -83,7 +86,7 @@ def render(p, total, audit, t):
     # --- ADAPTATION ---
     with col_ad:
         st.markdown(f"### {t('ad')}")
-        st.markdown(f"<h3 style='color:#444; margin-top:-10px;'>{audit['total_ad']} <span style='font-size:1rem; color:#888'>/ 180</span></h3>", unsafe_allow_html=True)
+        st.markdown(f"<h3 style='color:#444; margin-top:-10px;'>{audit['total_ad']} <span style='font-size:1rem; color:#888'>/ {mx['total_ad']}</span></h3>", unsafe_allow_html=True)
         st.markdown("---")
 
         show_row(t('sp_fr'), audit.get('ad_fr', 0), m_sp_fr, 'tip_sp_gen')
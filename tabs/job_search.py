@@ -1,25 +1,40 @@
 # tabs/job_search.py
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import job_data
 import translations as tr
+from logic.job_facets import get_facets, ids_to_bits, popcount
+from logic.job_index import bits_to_ids, get_index, get_trigram_index
+from logic.job_similarity import similar_jobs
+from logic.noc_tree import get_tree
+from logic.releases import get_store
 
 
-def _value_label(map_dict, raw_value: str) -> str:
-    """Return localized label for a raw value."""
-    lang = st.session_state.lang
-    return map_dict.get(raw_value, {}).get(lang, raw_value)
+LANGS = ("fr", "en")
+FUZZY_TOP_K = 10
 
 
-def _label_to_raw(map_dict, label: str) -> str:
-    """Map a localized label back to its raw value."""
-    lang = st.session_state.lang
-    for raw, langs in map_dict.items():
-        if langs.get(lang) == label:
-            return raw
-    # Fallback: assume it's already raw
-    return label
+def _localized(col: pd.Series, map_dict, lang: str) -> pd.Series:
+    """Localized labels of a categorical column (mapped once per category)."""
+    return col.map(lambda v: map_dict.get(v, {}).get(lang, v))
+
+
+@st.cache_resource(show_spinner=False)
+def _job_table() -> pd.DataFrame:
+    """
+    One job table per process, shared read-only by every session: categorical
+    columns and localized Diagnosis/Category labels. Reruns only select
+    columns and filter with masks.
+    """
+    df = pd.DataFrame(job_data.load_columns())
+    for lang in LANGS:
+        title_col = "Title (FR)" if lang == "fr" else "Title (EN)"
+        df[f"Title {lang}"] = df[title_col]
+        df[f"Diagnosis {lang}"] = _localized(df["Diagnosis"], tr.JOB_DIAG_VALUE_MAP, lang)
+        df[f"Category {lang}"] = _localized(df["Category"], tr.JOB_CAT_VALUE_MAP, lang)
+    return df
 
 
 def render(t):
@@ -27,26 +42,17 @@ def render(t):
     st.header(t("tab_job"))
     st.markdown(t("job_subheader"))
 
-    # --- 1. LOAD DATA ---
-    df_jobs = pd.DataFrame(job_data.JOBS)
-
-    # Decide which source title column to use based on language
+    # --- 1. LOAD DATA (shared table) ---
+    df_jobs = _job_table()
     lang = st.session_state.lang
-    source_title_col = "Title (FR)" if lang == "fr" else "Title (EN)"
 
-    df_jobs = df_jobs.copy()
-    df_jobs["Title"] = df_jobs[source_title_col]
+    tree = get_tree()
+    facets = get_facets()
 
-    # Optionally drop language-specific title columns so they don't appear
-    for col in ["Title (FR)", "Title (EN)"]:
-        if col in df_jobs.columns:
-            df_jobs.drop(columns=col, inplace=True)
-
-    # --- 2. DASHBOARD STATS (raw diagnosis) ---
-    deficit_count = len(df_jobs[df_jobs["Diagnosis"].str.contains("Déficit", na=False)])
-    slight_deficit_count = len(
-        df_jobs[df_jobs["Diagnosis"].str.contains("Léger déficit", na=False)]
-    )
+    # --- 2. DASHBOARD STATS (raw diagnosis, from the facet count cube) ---
+    diag_totals = facets.option_counts("Diagnosis")
+    deficit_count = diag_totals.get("Déficit", 0)
+    slight_deficit_count = diag_totals.get("Léger déficit", 0)
 
     c1, c2 = st.columns(2)
 
@@ -69,58 +75,111 @@ def render(t):
     st.divider()
 
     # --- 3. SEARCH & FILTERS ---
-    col_search, col_cat, col_diag = st.columns([2, 1, 1])
+    col_search, col_cat, col_teer, col_diag = st.columns([2, 1, 1, 1])
 
     search_txt = col_search.text_input(
         "🔍 " + t("tab_job"),
         placeholder=t("job_search_placeholder"),
     )
 
-    # CATEGORY FILTER (localized options)
-    cat_raw_vals = sorted(df_jobs["Category"].dropna().unique().tolist())
-    cat_display_vals = [_value_label(tr.JOB_CAT_VALUE_MAP, v) for v in cat_raw_vals]
-    cat_opts = ["All"] + cat_display_vals
-    sel_cat_label = col_cat.selectbox(t("job_filter_category"), cat_opts)
-
-    # DIAGNOSTIC FILTER (localized options)
-    diag_raw_vals = sorted(df_jobs["Diagnosis"].dropna().unique().tolist())
-    diag_display_vals = [_value_label(tr.JOB_DIAG_VALUE_MAP, v) for v in diag_raw_vals]
-    diag_opts = ["All"] + diag_display_vals
-    sel_diag_label = col_diag.selectbox(t("job_filter_diagnosis"), diag_opts)
-
-    # Apply Filters with RAW values
-    filtered = df_jobs.copy()
+    cat_col, diag_col = f"Category {lang}", f"Diagnosis {lang}"
 
+    # SEARCH HITS (bitset over row ids)
+    ranked = None  # row ids in relevance order, for fuzzy results
+    search_bits = facets.all
     if search_txt:
-        mask = filtered.astype(str).apply(
-            lambda x: x.str.contains(search_txt, case=False, na=False)
-        ).any(axis=1)
-        filtered = filtered[mask]
-
-    if sel_cat_label != "All":
-        sel_cat_raw = _label_to_raw(tr.JOB_CAT_VALUE_MAP, sel_cat_label)
-        filtered = filtered[filtered["Category"] == sel_cat_raw]
-
-    if sel_diag_label != "All":
-        sel_diag_raw = _label_to_raw(tr.JOB_DIAG_VALUE_MAP, sel_diag_label)
-        filtered = filtered[filtered["Diagnosis"] == sel_diag_raw]
-
-    # --- 4. DISPLAY TABLE (localized values) ---
-    st.write(t("job_matches").format(n=len(filtered)))
-
-    display_df = filtered.copy()
-    display_df["Diagnosis"] = display_df["Diagnosis"].apply(
-        lambda v: _value_label(tr.JOB_DIAG_VALUE_MAP, v)
+        # Accent-insensitive word-prefix match over NOC, both titles and categories
+        search_bits = get_index().match_bits(search_txt)
+        if not search_bits:
+            # No exact match: closest titles in either language (typos, partial words)
+            ranked, _ = get_trigram_index().search(search_txt, FUZZY_TOP_K)
+            search_bits = ids_to_bits(ranked)
+
+    # CURRENT SELECTIONS -> bitsets, so each dropdown can count its options
+    # against the search and every *other* filter
+    state = st.session_state
+    sel_cat = state.get("job_cat", "All")
+    sel_group = state.get("job_group", "All")
+    if sel_cat == "All" or not str(sel_group).startswith(sel_cat):
+        sel_group = state["job_group"] = "All"
+    sel_teer = state.get("job_teer", "All")
+    sel_diag = state.get("job_diag", "All")
+
+    prefix = sel_group if sel_group != "All" else ("" if sel_cat == "All" else sel_cat)
+    node_bits = tree.node(prefix).bits
+    teer_bits = facets.all if sel_teer == "All" else tree.teer(sel_teer).bits
+    diag_bits = facets.all if sel_diag == "All" else facets.value_bits("Diagnosis", sel_diag)
+
+    def _with_count(label, bits):
+        return f"{label} ({popcount(bits)})"
+
+    # CATEGORY FILTER = NOC broad category (1st digit), then major group (2 digits)
+    def _node_label(prefix, within):
+        if prefix == "All":
+            return _with_count(prefix, within)
+        node = tree.node(prefix)
+        label = tr.JOB_CAT_VALUE_MAP.get(node.label, {}).get(lang, node.label)
+        return _with_count(f"{prefix} – {label}", within & node.bits)
+
+    within = search_bits & teer_bits & diag_bits
+    cat_opts = ["All"] + [node.prefix for node in tree.level("broad")]
+    col_cat.selectbox(t("job_filter_category"), cat_opts, key="job_cat",
+                      format_func=lambda p: _node_label(p, within))
+    if sel_cat != "All":
+        group_opts = ["All"] + [node.prefix for node in tree.children(sel_cat)]
+        cat_within = within & tree.node(sel_cat).bits
+        col_cat.selectbox(t("job_filter_major_group"), group_opts, key="job_group",
+                          format_func=lambda p: _node_label(p, cat_within))
+
+    # TEER FILTER (2nd NOC digit, across categories)
+    within = search_bits & node_bits & diag_bits
+    teer_opts = ["All"] + sorted(tree.teers)
+    col_teer.selectbox(
+        t("job_filter_teer"), teer_opts, key="job_teer",
+        format_func=lambda v: _with_count(v, within) if v == "All"
+        else _with_count(f"{t('job_filter_teer')} {v}", within & tree.teer(v).bits),
     )
-    display_df["Category"] = display_df["Category"].apply(
-        lambda v: _value_label(tr.JOB_CAT_VALUE_MAP, v)
+
+    # DIAGNOSTIC FILTER (localized options, in raw-value order)
+    within = search_bits & node_bits & teer_bits
+    diag_counts = facets.option_counts("Diagnosis", within)
+    diag_opts = ["All"] + facets.values["Diagnosis"]
+    col_diag.selectbox(
+        t("job_filter_diagnosis"), diag_opts, key="job_diag",
+        format_func=lambda v: _with_count(v, within) if v == "All"
+        else f"{tr.JOB_DIAG_VALUE_MAP.get(v, {}).get(lang, v)} ({diag_counts[v]})",
     )
 
-    display_cols = ["NOC", "Title", "Diagnosis", "Category"]
+    # Every filter combined: one AND of bitsets
+    mask_bits = search_bits & node_bits & teer_bits & diag_bits
+    mask = np.zeros(len(df_jobs), dtype=bool)
+    mask[bits_to_ids(mask_bits, len(df_jobs))] = True
 
-    st.dataframe(
-        display_df[display_cols],
+    # --- 4. DISPLAY TABLE (localized values) ---
+    rows = np.flatnonzero(mask) if ranked is None else ranked[mask[ranked]]
+    display_df = df_jobs.iloc[rows][["NOC", f"Title {lang}", diag_col, cat_col]]
+    display_df.columns = ["NOC", "Title", "Diagnosis", "Category"]
+
+    # Diagnosis trend across releases (only when more than one is stored)
+    releases = get_store()
+    if len(releases.releases) > 1:
+        labels = [tr.JOB_DIAG_VALUE_MAP.get(d, {}).get(lang, d) for d in releases.diagnoses] + ["–"]
+        # MISSING (-1) indexes the trailing "–"
+        display_df["Trend"] = [
+            " → ".join(labels[c] for c in codes)
+            for codes in releases.histories(display_df["NOC"]).tolist()
+        ]
+
+    if ranked is None:
+        st.write(t("job_matches").format(n=len(display_df)))
+    else:
+        st.write(t("job_fuzzy_matches").format(n=len(display_df)))
+
+    event = st.dataframe(
+        display_df,
         width='stretch',
+        on_select="rerun",
+        selection_mode="multi-row",
         column_config={
             "NOC": st.column_config.TextColumn(t("job_col_noc"), width="small"),
             "Title": t("job_col_title"),
@@ -130,15 +189,49 @@ def render(t):
             "Category": st.column_config.TextColumn(
                 t("job_col_cat"), width="medium"
             ),
+            "Trend": st.column_config.TextColumn(
+                t("job_col_trend").format(releases=" → ".join(releases.releases)), width="medium"
+            ),
         },
         hide_index=True,
     )
 
+    # Similar occupations in shortage, for every selected row
+    title_key = "title_fr" if lang == "fr" else "title_en"
+    for pos in event.selection.rows:
+        job = display_df.iloc[pos]
+        st.markdown(t("job_similar_title").format(title=job["Title"]))
+        st.dataframe(
+            pd.DataFrame([{
+                t("job_col_noc"): s["noc"],
+                t("job_col_title"): s[title_key],
+                t("job_col_diag"): tr.JOB_DIAG_VALUE_MAP.get(s["diagnosis"], {}).get(lang, s["diagnosis"]),
+                t("job_col_similarity"): s["similarity"],
+            } for s in similar_jobs(job["NOC"])]),
+            width='stretch',
+            column_config={
+                t("job_col_similarity"): st.column_config.ProgressColumn(
+                    t("job_col_similarity"), min_value=0.0, max_value=1.0, format="%.2f"
+                ),
+            },
+            hide_index=True,
+        )
+
     # --- 5. VISUAL ANALYSIS (localized category values) ---
     if not display_df.empty:
         with st.expander("📊 " + t("job_cat_chart_title"), expanded=False):
-            cat_counts = display_df["Category"].value_counts().reset_index()
-            cat_counts.columns = ["Category", "Count"]
+            if search_bits & node_bits & teer_bits == facets.all:
+                # At most the diagnosis filter: Category counts straight from the cube
+                cube = facets.cube_counts(Diagnosis=None if sel_diag == "All" else sel_diag)
+                cat_counts = pd.DataFrame({
+                    "Category": [tr.JOB_CAT_VALUE_MAP.get(v, {}).get(lang, v) for v in facets.values["Category"]],
+                    "Count": cube.reshape(len(cube), -1).sum(axis=1),
+                })
+                cat_counts = cat_counts[cat_counts["Count"] > 0].sort_values("Count", ascending=False)
+            else:
+                # Categorical labels also count empty categories: keep the matched ones
+                cat_counts = display_df["Category"].value_counts()[lambda c: c > 0].reset_index()
+                cat_counts.columns = ["Category", "Count"]
 
             fig = px.bar(
                 cat_counts,
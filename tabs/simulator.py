@@ -1,13 +1,43 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import urllib.parse
 import translations as tr
 from tabs.draws import compute_avg_score
 import logic.scoring as scoring
+from logic.simulation import AXES, TIME_AXIS, clean_int, clean_profile, sweep, slice_grid, milestone_ranges
+from logic.occupations import occupation_sweep
+from logic.solver import solve
+from logic.timeline import score_timeline, first_month_reaching
+from logic.grid import resolve_version
 
 AVG_SCORE = int(round(compute_avg_score(scoring.LATEST_DRAWS)))
 
+@st.cache_data(max_entries=16, show_spinner=False)
+def _scenario_cube(profile, axes, version):
+    # `version` keys the cache, so a new grid is never served from an old cube
+    return sweep(profile, axes, as_of=version)
+
+# Keyed axis field -> translation map of its values (tick labels)
+AXIS_VALUE_MAPS = {'vjo': tr.VJO_MAP, 'qc_dip': tr.QC_DIP_MAP, 'diag': tr.DIAG_MAP}
+
+def _axis_labels(key, values):
+    """Display labels of a sweep axis' values (keyed values translated)."""
+    value_map = AXIS_VALUE_MAPS.get(AXES[key][2], {})
+    lang = st.session_state.lang
+    return np.array([value_map.get(v, {}).get(lang, str(v)) for v in values], dtype=object)
+
+# Solver lever -> translation keys for its label (joined with " – ")
+SOLVER_LEVER_LABELS = {
+    'fr_l': ("list",), 'fr_s': ("speak",), 'fr_r': ("read",), 'fr_w': ("write",),
+    'months': ("solver_months",), 'vjo': ("vjo",), 'qc_dip': ("qc_dip",),
+    'out_res': ("reg_res",), 'out_work': ("reg_work",), 'out_study': ("reg_study",),
+    'auth': ("auth",),
+    'sp_fr_l': ("sp_fr", "list"), 'sp_fr_s': ("sp_fr", "speak"),
+    'sp_fr_r': ("sp_fr", "read"), 'sp_fr_w': ("sp_fr", "write"),
+}
+
 
 def build_hard_rules(stream_name: str) -> str:
     stream_name_lower = stream_name.lower()
@@ -173,26 +203,6 @@ def build_hard_rules(stream_name: str) -> str:
     return hard_rules_text
 
 
-def _peq_threshold_met(sim: dict) -> bool:
-    """
-    Very simplified PEQ-style check (historical, for comparison only):
-    - >= 24 months of Quebec work experience
-    - French oral level (L/S) >= 7
-    """
-    def to_int(v):
-        try:
-            return int(v or 0)
-        except Exception:
-            return 0
-
-    qc_months = to_int(sim.get("qc_exp", 0))
-    fr_l = to_int(sim.get("fr_l", 0))
-    fr_s = to_int(sim.get("fr_s", 0))
-    oral_level = min(fr_l, fr_s)
-
-    return qc_months >= 24 and oral_level >= 7
-
-
 def generate_scoring_cheat_sheet(scoring, has_spouse):
     """
     Generates a concise, numeric text representation of the scoring grid for the LLM.
@@ -263,14 +273,7 @@ def render(p, t, scoring):
 
     # --- 0. ROBUST INPUT SANITIZATION ---
     def safe_get(key):
-        val = p.get(key, 0)
-        if val is None: return 0
-        if isinstance(val, (int, float)): return int(val)
-        if isinstance(val, str):
-            val = val.strip()
-            if not val: return 0
-            if not val.isnumeric(): return 0
-        return int(float(val))
+        return clean_int(p.get(key, 0))
 
     # Clean inputs for simulation math
     age_val = safe_get('age')
@@ -334,11 +337,10 @@ def render(p, t, scoring):
     # --- 2. PARAMETERS ---
     st.subheader(t("step2"))
 
-    # FILTER: Exclude 'sp_fr_target' from the list of keys
-    # We use a list comprehension to keep everything EXCEPT Spouse French
+    # Spouse axes only make sense with a spouse
     axis_display_opts = [
         k for k in tr.AXIS_MAP_LABELS.keys()
-        if k != 'sp_fr_target'
+        if has_spouse or not k.startswith('sp_')
     ]
 
     # Map the keys to their translated labels for the dropdown
@@ -347,132 +349,51 @@ def render(p, t, scoring):
     col_x, col_y = st.columns(2)
     x_label_sel = col_x.selectbox(t("x_axis"), axis_display_labels, index=0)
 
-    # Logic to ensure we don't crash if the default index (1) is out of bounds
-    default_y_index = 1 if len(axis_display_labels) > 1 else 0
-    y_label_sel = col_y.selectbox(t("y_axis"), axis_display_labels, index=default_y_index)
+    # The Y axis can be anything but the X axis
+    y_display_labels = [l for l in axis_display_labels if l != x_label_sel]
+    y_label_sel = col_y.selectbox(t("y_axis"), y_display_labels, index=0)
 
     # Reverse lookup: Find the key based on the selected label
     x_key = next(k for k, v in tr.AXIS_MAP_LABELS.items() if v[st.session_state.lang] == x_label_sel)
     y_key = next(k for k, v in tr.AXIS_MAP_LABELS.items() if v[st.session_state.lang] == y_label_sel)
 
-    def get_range(k):
-        if k == 'time_travel': return [0, 6, 12, 18, 24, 30, 36, 48, 60]
-        if 'fr' in k: return [4, 5, 6, 7, 8, 9, 10, 12]
-        return []
-
-    x_vals = get_range(x_key)
-    y_vals = get_range(y_key)
-
-# --- 3. SIMULATION LOOP ---
-    results = []
-
-    # Import pandas here just in case (though it's likely at top of file)
-    import pandas as pd
-
-    for y_val in y_vals:
-        for x_val in x_vals:
-            sim = p.copy()
-
-            # Define the logic function inside the loop to capture variables
-            def apply_sim_logic(key, val):
-                if key == 'time_travel':
-                    years_passed = int(val / 12)
-                    sim['age'] = age_val + years_passed
-                    if has_spouse: sim['sp_age'] = sp_age_val + years_passed
-
-                    sim['qc_exp'] = qc_exp_val + val
-                    sim['prim_occ_exp'] = safe_get('prim_occ_exp') + val
-                    sim['gen_exp'] = exp_val + val
-
-                    if has_spouse: sim['sp_qc_exp'] = sp_qc_exp_val + val
-
-                    curr_out_res = safe_get('out_res')
-                    if curr_out_res > 0: sim['out_res'] = curr_out_res + val
-
-                    curr_out_work = safe_get('out_work')
-                    if curr_out_work > 0: sim['out_work'] = curr_out_work + val
-
-                elif key == 'fr_target':
-                    sim['fr_l'] = sim['fr_s'] = sim['fr_r'] = sim['fr_w'] = val
-                elif key == 'sp_fr_target':
-                    sim['sp_fr_l'] = sim['sp_fr_s'] = sim['sp_fr_r'] = sim['sp_fr_w'] = val
-
-            apply_sim_logic(x_key, x_val)
-            apply_sim_logic(y_key, y_val)
-
-            # --- NEW: CALCULATE DATE ---
-            # We assume x_val is "months passed".
-            # If x_axis is NOT time_travel, x_val might be something else,
-            # but usually "time_travel" is the only time-based axis in your app.
-
-            months_passed = 0
-            if x_key == 'time_travel': months_passed = x_val
-            elif y_key == 'time_travel': months_passed = y_val
-
-            future_date = pd.Timestamp.now() + pd.DateOffset(months=months_passed)
-            date_str = future_date.strftime("%b %Y") # e.g. "Nov 2026"
-
-            score, _ = scoring.calculate_score(sim)
-
-            peq = _peq_threshold_met(sim)
-
-            # SAVE DATA
-            results.append({
-                "x": x_val,
-                "y": y_val,
-                "score": score,
-                "age": sim.get('age', age_val),   # simulated age
-                "date": date_str,                 # simulated date
-                "months": months_passed,          # how many months in the future
-                "peq": peq,                       # PEQ eligibility flag
-            })
+    # --- 3. SIMULATION ---
+    # One cube over the usual axes (plus any other selected one); switching
+    # between its axes only re-slices it.
+    cube_axes = [TIME_AXIS, 'fr_target'] + (['sp_fr_target'] if has_spouse else [])
+    cube_axes += [k for k in (x_key, y_key) if k not in cube_axes]
+    cube = _scenario_cube(clean_profile(p), tuple(cube_axes), resolve_version())
+    grid = slice_grid(cube, x_key, y_key)
+    score_grid = grid['score']
+    x_labels, y_labels = _axis_labels(x_key, grid['x']), _axis_labels(y_key, grid['y'])
 
 
     # --- 4. VISUALIZATION ---
-    # 1. CREATE DATAFRAME & TEXT
-    df_sim = pd.DataFrame(results)
-
-    # By default: label = score as text
-    df_sim["score_label"] = df_sim["score"].astype(str)
+    # 1. LABELS & TOOLTIPS (2-D arrays, rows = y values, columns = x values)
+    score_text = score_grid.astype(str)
 
-    # Find the earliest point where PEQ threshold is met
-    eligible = df_sim[df_sim["peq"]]
-
-    if not eligible.empty:
-        # Row index of earliest eligibility (smallest 'months')
-        first_idx = eligible["months"].idxmin()
-        # Add a star only there
-        df_sim.loc[first_idx, "score_label"] = df_sim.loc[first_idx, "score_label"] + "★"
+    # By default: label = score as text; a star marks the earliest cell
+    # (smallest 'months') where the PEQ threshold is met
+    p_text = score_text.astype(object)
+    if grid['peq'].any():
+        first_idx = np.unravel_index(np.where(grid['peq'], grid['months'], np.iinfo(np.int64).max).argmin(), score_grid.shape)
+        p_text[first_idx] += "★"
 
     # Tooltip text can still mention PEQ status (optional)
-    df_sim["peq_text"] = df_sim["peq"].apply(
-        lambda v: t("peq_met")
-                if v else t("peq_not_met")
-    )
-
-    df_sim["tooltip"] = df_sim.apply(
-        lambda row: (
-            f"<b>{y_label_sel}: {row['y']}</b><br>"
-            f"<b>{x_label_sel}: {row['x']}</b><br><br>"
-            f"<b>📅 Date: {row.get('date', 'N/A')}</b><br>"
-            f"<b>🎂 Age: {row.get('age', 'N/A')}</b><br>"
-            f"<b>🏆 Score: {row['score']}</b><br>"
-            f"{row['peq_text']}"
-        ),
-        axis=1
+    peq_text = np.where(grid['peq'], t("peq_met"), t("peq_not_met"))
+    p_tooltip = (
+        f"<b>{y_label_sel}: " + y_labels[:, None] + "</b><br>"
+        + f"<b>{x_label_sel}: " + x_labels[None, :] + "</b><br><br>"
+        + "<b>📅 Date: " + grid['date'] + "</b><br>"
+        + "<b>🎂 Age: " + grid['age'].astype(str).astype(object) + "</b><br>"
+        + "<b>🏆 Score: " + score_text.astype(object) + "</b><br>"
+        + peq_text.astype(object)
     )
 
 
-
-    # 2. PREPARE DATA
-    pivot_df = df_sim.pivot(index="y", columns="x", values="score").sort_index()
-    p_tooltip = df_sim.pivot(index="y", columns="x", values="tooltip").sort_index()
-    p_text = df_sim.pivot(index="y", columns="x", values="score_label").sort_index()
-
-
     # 3. COLOR LOGIC (Gradient Red -> Static Green)
-    min_val = pivot_df.min().min()
-    max_val = pivot_df.max().max()
+    min_val = int(score_grid.min())
+    max_val = int(score_grid.max())
 
     # Avoid divide-by-zero
     if max_val == min_val: max_val += 1
@@ -502,7 +423,9 @@ def render(p, t, scoring):
 
     # 4. DRAW CHART
     fig = px.imshow(
-        pivot_df,
+        score_grid,
+        x=x_labels.tolist(),
+        y=y_labels.tolist(),
         text_auto=False,
         aspect="auto",
         color_continuous_scale=custom_colors,
@@ -511,9 +434,9 @@ def render(p, t, scoring):
 
     # 5. UPDATE TRACES
     fig.update_traces(
-        text=p_text.values,
+        text=p_text,
         texttemplate="%{text}",
-        customdata=p_tooltip.values.tolist(),
+        customdata=p_tooltip.tolist(),
         hovertemplate="%{customdata}<extra></extra>"
     )
 
@@ -537,39 +460,37 @@ def render(p, t, scoring):
     # ---------------------------------------------------------
     # 0. INITIALIZE DATA
     # ---------------------------------------------------------
-    curr_score, audit = scoring.calculate_score(p)
+    curr_score, audit = scoring.calculate_score(p, compact=True)
     has_spouse = bool(p.get('spouse'))
 
     # ---------------------------------------------------------
     # A. TIMING CALCULATIONS & PROJECTIONS
     # ---------------------------------------------------------
-    max_score_row = df_sim.loc[df_sim['score'].idxmax()]
-    max_score_val = max_score_row['score']
-    months_to_peak = max_score_row['x']
-    peak_date_str = max_score_row.get('date', 'N/A')
+    peak_idx = np.unravel_index(score_grid.argmax(), score_grid.shape)
+    max_score_val = int(score_grid[peak_idx])
+    months_to_peak = int(grid['months'][peak_idx])
+    peak_date_str = grid['date'][peak_idx]
 
     # [NEW] GENERATE FUTURE MATRIX & TRACK GLOBAL MAX
-    # We need to know the absolute best possible score (Max Time + Max French)
+    # We need to know the absolute best possible score over the chosen axes
     # to decide if we should tell the AI to "Protect VJO" or "Burn the Ships".
 
     milestones = [12, 24, 36, 48, 60]
     projection_lines = []
     global_max_projected = 0 # Track the highest number seen in the matrix
 
-    for m in milestones:
-        data_at_m = df_sim[df_sim['x'] == m]
-        if not data_at_m.empty:
-            low_score = int(data_at_m['score'].min())
-            high_score = int(data_at_m['score'].max())
-
-            # Update global max
-            if high_score > global_max_projected:
-                global_max_projected = high_score
+    for m, low_score, high_score in milestone_ranges(grid, milestones):
+        # Update global max
+        if high_score > global_max_projected:
+            global_max_projected = high_score
 
-            if low_score == high_score:
-                projection_lines.append(f"- Month {m}: Guaranteed {low_score} pts (Time Only)")
-            else:
-                projection_lines.append(f"- Month {m}: {low_score} pts (Time Only) ...up to... {high_score} pts (Time + Max French)")
+        if low_score == high_score:
+            projection_lines.append(f"- Month {m}: Guaranteed {low_score} pts")
+        else:
+            projection_lines.append(
+                f"- Month {m}: {low_score} pts ...up to... {high_score} pts "
+                f"(best of {x_label_sel} × {y_label_sel})"
+            )
 
     projection_text = "\n".join(projection_lines)
 
@@ -584,18 +505,70 @@ def render(p, t, scoring):
         st.success(t("peak_score").format(score=max_score_val))
         st.write(t("peak_score_occurs").format(months=months_to_peak, date=peak_date_str))
         # st.write(f"This occurs in **{months_to_peak} months** ({peak_date_str}).")
+        # Exact month-by-month curve at the current French levels
+        timeline = score_timeline(clean_profile(p))
+        reach_month = first_month_reaching(timeline, target_score)
+        if reach_month is None:
+            st.write(t("target_not_reached").format(score=target_score))
+        else:
+            reach_date = (pd.Timestamp.now() + pd.DateOffset(months=reach_month)).strftime('%b %Y')
+            st.write(t("target_reached_in").format(score=target_score, months=reach_month, date=reach_date))
     with col_action:
-        import pandas as pd
         today = pd.Timestamp.now()
         if isinstance(months_to_peak, (int, float)) and months_to_peak > 3:
             deadline = today + pd.DateOffset(months=months_to_peak - 3)
-            st.info(t("lang_test_deadline_label").format(date=deadline.strftime('%b %Y')))
+            st.info(t("lang_test_deadline_label").format(month_year=deadline.strftime('%b %Y')))
         else:
             st.info(t("lang_test_deadline_asap"))
 
     if vjo_will_expire:
         st.error(t("vjo_renewal_warning"))
 
+    # ---------------------------------------------------------
+    # C. LEAST-EFFORT PLAN (inverse solver)
+    # ---------------------------------------------------------
+    st.markdown(t("solver_title"))
+    plan = solve(clean_profile(p), target_score)
+
+    def _change_text(change):
+        lever, sets = change['lever'], change['set']
+        if lever == 'months':
+            return f"+{sets['gen_exp'] - safe_get('gen_exp')}"
+        if lever == 'auth':
+            return "✓"
+        return f"{safe_get(lever) if lever not in ('vjo', 'qc_dip') else p.get(lever)} → {sets[lever]}"
+
+    if not plan['reachable']:
+        st.warning(t("solver_unreachable").format(score=plan['max_score']))
+    elif not plan['changes']:
+        st.success(t("solver_already"))
+    else:
+        df_plan = pd.DataFrame([{
+            t("solver_col_lever"): " – ".join(t(k) for k in SOLVER_LEVER_LABELS[c['lever']]),
+            t("solver_col_change"): _change_text(c),
+            t("solver_col_cost"): c['cost'],
+        } for c in plan['changes']])
+        st.dataframe(df_plan, hide_index=True, width='stretch')
+        st.write(t("solver_total").format(cost=plan['cost'], score=plan['score']))
+    st.caption(t("solver_caption"))
+
+    # ---------------------------------------------------------
+    # D. OCCUPATION SWITCH RANKING
+    # ---------------------------------------------------------
+    st.markdown(t("occ_title"))
+    rank_labels = {"score": t("occ_rank_score"), "time": t("occ_rank_time")}
+    rank_by = st.radio(t("occ_rank_by"), list(rank_labels), format_func=rank_labels.get, horizontal=True)
+    title_key = 'title_fr' if st.session_state.lang == 'fr' else 'title_en'
+    df_occ = pd.DataFrame([{
+        t("job_col_noc"): o['noc'],
+        t("job_col_title"): o[title_key],
+        t("job_col_diag"): tr.JOB_DIAG_VALUE_MAP.get(o['diagnosis'], {}).get(st.session_state.lang, o['diagnosis']),
+        t("occ_col_score"): o['score'],
+        t("occ_col_months"): o['months_to_target'],
+    } for o in occupation_sweep(clean_profile(p), target_score, top=10, rank_by=rank_by)])
+    st.dataframe(df_occ, hide_index=True, width='stretch')
+    st.caption(t("occ_caption"))
+
     st.divider()
 
 
@@ -56,7 +56,17 @@ QC_DIP_MAP = {
 AXIS_MAP_LABELS = {
     "time_travel": {"en": "Future Months Worked", "fr": "Mois Travaillés (Futur)"},
     "fr_target": {"en": "My French Target (All Skills)", "fr": "Cible Français (Moi)"},
-    "sp_fr_target": {"en": "Spouse French Target (All Skills)", "fr": "Cible Français (Conjoint)"}
+    "fr_l_target": {"en": "My Listening Target", "fr": "Cible Compréhension Orale (Moi)"},
+    "fr_s_target": {"en": "My Speaking Target", "fr": "Cible Production Orale (Moi)"},
+    "fr_r_target": {"en": "My Reading Target", "fr": "Cible Compréhension Écrite (Moi)"},
+    "fr_w_target": {"en": "My Writing Target", "fr": "Cible Production Écrite (Moi)"},
+    "sp_fr_target": {"en": "Spouse French Target (All Skills)", "fr": "Cible Français (Conjoint)"},
+    "out_res_target": {"en": "Months Residing Outside Montreal", "fr": "Mois de Résidence hors Montréal"},
+    "out_work_target": {"en": "Months Working Outside Montreal", "fr": "Mois de Travail hors Montréal"},
+    "out_study_target": {"en": "Months Studying Outside Montreal", "fr": "Mois d'Études hors Montréal"},
+    "vjo_target": {"en": "Validated Job Offer", "fr": "Offre d'Emploi Validée"},
+    "qc_dip_target": {"en": "Quebec Diploma", "fr": "Diplôme du Québec"},
+    "diag_target": {"en": "Occupation Shortage Status", "fr": "Diagnostic de la Profession"},
 }
 
 JOB_DIAG_VALUE_MAP = {
@@ -176,6 +186,8 @@ TEXTS = {
         "job_search_placeholder": "e.g. Software, 21232",
         "job_filter_category": "Category",
         "job_filter_diagnosis": "Diagnosis",
+        "job_filter_major_group": "Major group",
+        "job_filter_teer": "TEER",
 
         "job_col_noc": "NOC Code",
         "job_col_title": "Job Title",
@@ -186,6 +198,10 @@ TEXTS = {
         "job_stats_slight_deficit" : "Total Slight Deficit Professions",
         "job_stats_slight_deficit_delta": "Moderate Priority Targets",
         "job_matches": "Showing **{n}** matches:",
+        "job_fuzzy_matches": "No exact match. Showing the **{n}** closest titles:",
+        "job_similar_title": "##### Similar occupations in shortage: {title}",
+        "job_col_similarity": "Similarity",
+        "job_col_trend": "Trend ({releases})",
         "job_cat_chart_title": "Distribution of Jobs by Category (Filtered)",
 
         # Dashboard
@@ -217,6 +233,24 @@ TEXTS = {
         "lang_test_deadline_label" : "📝 Language Test Deadline: {month_year}",
         "lang_test_deadline_asap" : "📝 Language Test Deadline: ASAP",
         "vjo_renewal_warning": "⚠️ **Warning:** Your peak score is in >18 months. You will need to renew your VJO.",
+        "target_reached_in": "At your current French, you first reach **{score}** in **{months} months** ({date}).",
+        "target_not_reached": "At your current French, time alone does not reach **{score}** within 60 months.",
+        "solver_title": "#### 🧭 Least-Effort Plan",
+        "solver_months": "Months Worked (Main Job)",
+        "solver_col_lever": "Lever",
+        "solver_col_change": "Change",
+        "solver_col_cost": "Effort",
+        "solver_total": "Total effort: **{cost}** · Resulting score: **{score}**",
+        "solver_already": "✅ Your current profile already reaches the target.",
+        "solver_unreachable": "❌ The target is out of reach with these levers (best possible: {score} pts).",
+        "solver_caption": "Effort is counted roughly in months (e.g. 2 per French level, 1 per month worked, 6 for a VJO). The plan is the cheapest combination that reaches the target.",
+        "occ_title": "#### 🔁 Best Occupations to Switch To",
+        "occ_rank_by": "Rank by",
+        "occ_rank_score": "Score today",
+        "occ_rank_time": "Time to target",
+        "occ_col_score": "Score",
+        "occ_col_months": "Months to target",
+        "occ_caption": "Your profile scored as if each of the 516 occupations were your main job (only the shortage diagnosis changes; your experience is kept).",
         "calc_section_title": "### 📐 How is this calculated?",
         "calc_section_body": (
             "The simulation recalculates your official score for **every single square** in the grid. "
@@ -494,6 +528,8 @@ TEXTS = {
         "job_search_placeholder": "ex. Informatique, 21232",
         "job_filter_category": "Catégorie",
         "job_filter_diagnosis": "Diagnostic",
+        "job_filter_major_group": "Grand groupe",
+        "job_filter_teer": "FEER",
 
         "job_col_noc": "Code CNP",
         "job_col_title": "Titre d’emploi",
@@ -504,6 +540,10 @@ TEXTS = {
         "job_stats_slight_deficit" : "Total des professions en léger déficit",
         "job_stats_slight_deficit_delta": "Professions modérément prioritaires",
         "job_matches": "Affichage de **{n}** résultats :",
+        "job_fuzzy_matches": "Aucun résultat exact. Affichage des **{n}** titres les plus proches :",
+        "job_similar_title": "##### Professions similaires en pénurie : {title}",
+        "job_col_similarity": "Similarité",
+        "job_col_trend": "Tendance ({releases})",
         "job_cat_chart_title": "Répartition des emplois par catégorie (filtre appliqué)",
 
 
@@ -537,6 +577,24 @@ TEXTS = {
         "lang_test_deadline_label" : "📝 Date limite du test de langue : {month_year}",
         "lang_test_deadline_asap" : "📝 Date limite du test de langue : Dès que possible",
         "vjo_renewal_warning": "⚠️ **Attention :** Votre score maximal est dans plus de 18 mois. Vous devrez renouveler votre OEV.",
+        "target_reached_in": "Avec votre français actuel, vous atteignez **{score}** pour la première fois dans **{months} mois** ({date}).",
+        "target_not_reached": "Avec votre français actuel, le temps seul ne permet pas d'atteindre **{score}** en 60 mois.",
+        "solver_title": "#### 🧭 Plan du moindre effort",
+        "solver_months": "Mois travaillés (emploi principal)",
+        "solver_col_lever": "Levier",
+        "solver_col_change": "Changement",
+        "solver_col_cost": "Effort",
+        "solver_total": "Effort total : **{cost}** · Score obtenu : **{score}**",
+        "solver_already": "✅ Votre profil actuel atteint déjà la cible.",
+        "solver_unreachable": "❌ La cible est hors d'atteinte avec ces leviers (meilleur score possible : {score} pts).",
+        "solver_caption": "L'effort est compté approximativement en mois (p. ex. 2 par niveau de français, 1 par mois travaillé, 6 pour une OEV). Le plan est la combinaison la moins coûteuse qui atteint la cible.",
+        "occ_title": "#### 🔁 Meilleures professions vers lesquelles changer",
+        "occ_rank_by": "Classer par",
+        "occ_rank_score": "Score actuel",
+        "occ_rank_time": "Délai pour la cible",
+        "occ_col_score": "Score",
+        "occ_col_months": "Mois avant la cible",
+        "occ_caption": "Votre profil calculé comme si chacune des 516 professions était votre emploi principal (seul le diagnostic de pénurie change ; votre expérience est conservée).",
         "calc_section_title": "### 📐 Comment est-ce calculé ?",
         "calc_section_body": (
             "La simulation recalcule votre score officiel pour **chaque case** de la grille. "